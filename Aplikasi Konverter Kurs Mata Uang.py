@@ -91,6 +91,8 @@ class CurrencyConverterGUI:
             'INR': '🇮🇳 Indian Rupee',
             'AED': '🇦🇪 UAE Dirham'
         }
+        # Index balik nama lengkap -> kode untuk lookup O(1)
+        self.currency_codes = {name: code for code, name in self.currencies.items()}
         
         self.setup_ui()
         self.load_rates()
@@ -271,10 +273,7 @@ class CurrencyConverterGUI:
     
     def get_currency_code(self, full_name):
         """Mendapatkan kode mata uang dari nama lengkap"""
-        for code, name in self.currencies.items():
-            if name == full_name:
-                return code
-        return None
+        return self.currency_codes.get(full_name)
     
     def load_rates(self):
         """Memuat data kurs dari API"""
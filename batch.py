@@ -0,0 +1,106 @@
+# ============================================================
+# FILE: batch.py
+# ============================================================
+"""Entry point konversi batch CSV/JSONL tanpa GUI"""
+import argparse
+import os
+import sys
+from contextlib import redirect_stdout
+from models import BatchConverter, CurrencyConverter, ParallelBatchConverter
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Membaca argumen command line"""
+    parser = argparse.ArgumentParser(
+        description='Konversi kolom amount pada file CSV/JSONL secara streaming'
+    )
+    parser.add_argument('input', nargs='?', default='-',
+                        help="File input (default '-' untuk stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="File output (default '-' untuk stdout)")
+    parser.add_argument('-f', '--format', choices=['csv', 'jsonl'],
+                        help='Format data (default dari ekstensi file, atau csv)')
+    parser.add_argument('--amount-field', default='amount')
+    parser.add_argument('--from-field', default='from')
+    parser.add_argument('--to-field', default='to')
+    parser.add_argument('--output-field', default='converted')
+    parser.add_argument('--from', dest='default_from',
+                        help='Mata uang asal jika kolom from kosong')
+    parser.add_argument('--to', dest='default_to',
+                        help='Mata uang tujuan jika kolom to kosong')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help='Jumlah proses worker (0 = jumlah CPU)')
+    parser.add_argument('--exact', action='store_true',
+                        help="Pakai engine fixed-point (default dari CONVERSION_CONFIG['engine'])")
+    parser.add_argument('--base', default='USD', help='Base currency untuk API')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Abaikan cache kurs lokal')
+    return parser.parse_args(argv)
+
+
+def detect_format(path: str) -> str:
+    """Menentukan format data dari ekstensi file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    return 'csv'
+
+
+def main(argv=None) -> int:
+    """Fungsi utama untuk menjalankan konversi batch"""
+    args = parse_args(argv)
+    data_format = args.format or detect_format(args.input)
+
+    converter = CurrencyConverter(args.base)
+    # Output bisa ke stdout ('-'); pesan error model dialihkan ke stderr
+    try:
+        with redirect_stdout(sys.stderr):
+            loaded = converter.fetch_rates(force_refresh=args.refresh)
+    finally:
+        # Kurs sudah di snapshot; sumber (dan request hedged yang kalah) ditutup
+        converter.close()
+    if not loaded:
+        print("❌ Gagal memuat data kurs", file=sys.stderr)
+        return 1
+
+    options = dict(
+        amount_field=args.amount_field,
+        from_field=args.from_field,
+        to_field=args.to_field,
+        default_from=args.default_from,
+        default_to=args.default_to,
+        output_field=args.output_field,
+        chunk_size=args.chunk_size,
+        # Engine sama dengan GUI/CLI agar hasilnya identik
+        fixed_point=converter.fixed_point if args.exact or converter.engine == 'fixed' else None
+    )
+    if args.workers == 1:
+        batch = BatchConverter(converter.cross_rates, **options)
+    else:
+        batch = ParallelBatchConverter(converter.cross_rates, workers=args.workers or None,
+                                       **options)
+
+    infile = sys.stdin if args.input == '-' else open(args.input, 'r', newline='', encoding='utf-8')
+    outfile = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        if data_format == 'jsonl':
+            rows, errors = batch.run_jsonl(infile, outfile)
+        else:
+            rows, errors = batch.run_csv(infile, outfile)
+    finally:
+        if isinstance(batch, ParallelBatchConverter):
+            batch.close()
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+    update_time = converter.get_last_update_formatted()
+    print(f"✅ {rows} baris dikonversi ({errors} gagal), kurs: {update_time}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+# ============================================================
+# FILE: benchmarks/__init__.py
+# ============================================================
+"""Benchmark dan alat bantu pengukuran performa"""
+from .replay_server import ReplayServer
+
+__all__ = ['ReplayServer']
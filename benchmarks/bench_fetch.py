@@ -0,0 +1,138 @@
+# ============================================================
+# FILE: benchmarks/bench_fetch.py
+# ============================================================
+"""Benchmark latensi dan throughput jalur fetch_rates terhadap replay server"""
+import argparse
+import json
+import threading
+import time
+from typing import Dict, List
+
+from models import CurrencyConverter, HttpRateSource
+from benchmarks.replay_server import ReplayServer
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Menghitung persentil (nearest-rank) dari data yang sudah terurut
+
+    Args:
+        sorted_values: Data terurut naik
+        fraction: Persentil dalam 0..1
+
+    Returns:
+        Nilai persentil (0.0 jika data kosong)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+
+def run_fetch_benchmark(url_template: str, fetches: int = 200, concurrency: int = 1,
+                        conditional: bool = True, base_currency: str = 'USD',
+                        timeout: float = 10.0) -> Dict[str, float]:
+    """
+    Mengukur fetch_rates berulang kali terhadap sebuah endpoint
+
+    Args:
+        url_template: URL endpoint dengan placeholder {base}
+        fetches: Jumlah total fetch
+        concurrency: Jumlah worker thread, masing-masing dengan converter sendiri
+        conditional: False untuk selalu mengunduh payload penuh (tanpa ETag)
+        base_currency: Base currency yang diminta
+        timeout: Timeout request dalam detik
+
+    Returns:
+        Dict statistik latensi (ms), throughput (fetch/detik) dan jumlah gagal
+    """
+    latencies: List[float] = []
+    failures = [0]
+    lock = threading.Lock()
+    per_worker = [fetches // concurrency + (1 if i < fetches % concurrency else 0)
+                  for i in range(concurrency)]
+
+    def worker(count: int):
+        converter = CurrencyConverter(
+            base_currency,
+            use_cache=False,
+            source=HttpRateSource(url_template, timeout=timeout, name='bench'),
+            # Setiap worker mengukur request-nya sendiri, tanpa berbagi fetch
+            single_flight=False
+        )
+        local = []
+        failed = 0
+        for _ in range(count):
+            if not conditional:
+                converter.etag = None
+                converter.last_modified = None
+            start = time.perf_counter()
+            ok = converter.fetch_rates(force_refresh=True)
+            local.append(time.perf_counter() - start)
+            failed += not ok
+        converter.close()
+        with lock:
+            latencies.extend(local)
+            failures[0] += failed
+
+    threads = [threading.Thread(target=worker, args=(count,)) for count in per_worker]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'fetches': len(latencies),
+        'failures': failures[0],
+        'mean_ms': 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+        'p50_ms': 1000 * percentile(latencies, 0.50),
+        'p90_ms': 1000 * percentile(latencies, 0.90),
+        'p99_ms': 1000 * percentile(latencies, 0.99),
+        'max_ms': 1000 * (latencies[-1] if latencies else 0.0),
+        'throughput_per_s': len(latencies) / elapsed if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    """Menjalankan benchmark fetch dari command line"""
+    parser = argparse.ArgumentParser(description='Benchmark jalur fetch_rates')
+    parser.add_argument('--fetches', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--latency', type=float, default=0.0, help='Detik per request')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Detik +/- acak')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Peluang 503 (0..1)')
+    parser.add_argument('--extra-currencies', type=int, default=0)
+    parser.add_argument('--full', action='store_true',
+                        help='Selalu unduh payload penuh (tanpa conditional GET)')
+    parser.add_argument('--url', help='Endpoint lain dengan placeholder {base} '
+                                      '(default replay server lokal)')
+    parser.add_argument('--json', metavar='PATH', help='Simpan hasil sebagai JSON')
+    args = parser.parse_args(argv)
+
+    server = None
+    url_template = args.url
+    if url_template is None:
+        server = ReplayServer(latency=args.latency, jitter=args.jitter,
+                              error_rate=args.error_rate,
+                              extra_currencies=args.extra_currencies, seed=0).start()
+        url_template = server.url_template
+
+    try:
+        result = run_fetch_benchmark(url_template, args.fetches, args.concurrency,
+                                     conditional=not args.full)
+    finally:
+        if server is not None:
+            server.stop()
+
+    for key, value in result.items():
+        print(f"{key:>18}: {value:,.3f}" if isinstance(value, float) else f"{key:>18}: {value}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# ============================================================
+# FILE: benchmarks/bench_hot_path.py
+# ============================================================
+"""Microbenchmark jalur konversi dengan perbandingan terhadap baseline"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from itertools import cycle
+from typing import Callable, Dict, Optional
+
+from controllers import AppController
+from models import CurrencyConverter, StaticRateSource
+from utils.registry import REGISTRY
+from views import CurrencyConverterGUI
+from benchmarks.replay_server import load_sample_rates
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'baseline_hot_path.json')
+
+
+class HeadlessRoot:
+    """Pengganti Tk root: after() langsung dijalankan saat run_pending()"""
+
+    def __init__(self):
+        self._pending = []
+
+    def after(self, ms, func=None, *args):
+        self._pending.append((func, args))
+        return f'after#{len(self._pending)}'
+
+    def after_cancel(self, job_id):
+        pass
+
+    def update(self):
+        pass
+
+    def run_pending(self):
+        while self._pending:
+            func, args = self._pending.pop(0)
+            func(*args)
+
+
+class HeadlessView:
+    """View tanpa widget dengan getter/setter yang sama seperti CurrencyConverterGUI"""
+
+    def __init__(self, registry=REGISTRY):
+        self.root = HeadlessRoot()
+        self.registry = registry
+        self.amount = '1'
+        self.from_index = registry.id_of('USD')
+        self.to_index = registry.id_of('IDR')
+        self.result = ''
+        self.rate_info = ''
+        self.status = ''
+        self.on_convert = self.on_swap = self.on_refresh = self.on_clear = None
+        self.on_activity = None
+
+    get_currency_code_from_display = CurrencyConverterGUI.get_currency_code_from_display
+
+    def get_amount(self):
+        return self.amount
+
+    def get_from_currency(self):
+        return self.registry.display_names[self.from_index]
+
+    def get_to_currency(self):
+        return self.registry.display_names[self.to_index]
+
+    def get_from_index(self):
+        return self.from_index
+
+    def get_to_index(self):
+        return self.to_index
+
+    def is_minimized(self):
+        return False
+
+    def set_result(self, value):
+        self.result = value
+
+    def set_rate_info(self, text):
+        self.rate_info = text
+
+    def set_status(self, text):
+        self.status = text
+
+    def set_refresh_enabled(self, enabled):
+        pass
+
+    def set_from_currency_index(self, index):
+        self.from_index = index
+
+    def set_to_currency_index(self, index):
+        self.to_index = index
+
+    def clear_amount(self):
+        self.amount = '1'
+
+
+def measure(func: Callable[[], object], number: int, repeat: int) -> float:
+    """
+    Mengukur waktu per operasi (ns), minimum dari beberapa pengulangan
+
+    Args:
+        func: Fungsi tanpa argumen yang diukur
+        number: Jumlah panggilan per pengulangan
+        repeat: Jumlah pengulangan
+
+    Returns:
+        Nanodetik per operasi
+    """
+    # Pemanasan agar cache dan alokasi awal tidak ikut terukur
+    for _ in range(max(1, number // 10)):
+        func()
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter_ns() - start) / number)
+    return best
+
+
+def build_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Menyiapkan model, view headless dan controller untuk diukur"""
+    rates = load_sample_rates()
+    model = CurrencyConverter(use_cache=False, source=StaticRateSource(rates))
+    model.fetch_rates()
+
+    view = HeadlessView()
+    controller = AppController(view, model, auto_refresh=False)
+    view.root.run_pending()
+
+    display_name = REGISTRY.display_from_code('IDR')
+    amounts = cycle(['1', '2.5', '100', '12345.67'])
+
+    def handle_convert():
+        # Amount berganti agar cache input terakhir tidak melewati konversi
+        view.amount = next(amounts)
+        controller.handle_convert()
+
+    return {
+        'convert': lambda: model.convert('100', 'EUR', 'IDR'),
+        'get_rate': lambda: model.get_rate('EUR', 'IDR'),
+        'get_last_update_formatted': model.get_last_update_formatted,
+        'get_currency_code_from_display': lambda: view.get_currency_code_from_display(display_name),
+        'handle_convert': handle_convert,
+        'handle_convert_unchanged': controller.handle_convert,
+    }
+
+
+def run(number: int, repeat: int) -> Dict[str, object]:
+    """Menjalankan semua benchmark dan mengembalikan hasil dalam bentuk dict"""
+    results = {}
+    for name, func in build_benchmarks().items():
+        results[name] = {'ns_per_op': round(measure(func, number, repeat), 1)}
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'number': number,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare(report: Dict[str, object], baseline: Dict[str, object],
+            max_regression: float) -> Dict[str, float]:
+    """
+    Membandingkan hasil dengan baseline
+
+    Args:
+        report: Hasil run()
+        baseline: Hasil run() yang disimpan sebelumnya
+        max_regression: Batas kenaikan relatif yang diizinkan (0.25 = 25%)
+
+    Returns:
+        Dict nama benchmark -> rasio terhadap baseline untuk yang melewati batas
+    """
+    regressions = {}
+    for name, result in report['results'].items():
+        reference = baseline.get('results', {}).get(name)
+        if not reference:
+            continue
+        ratio = result['ns_per_op'] / reference['ns_per_op']
+        result['baseline_ratio'] = round(ratio, 3)
+        if ratio > 1 + max_regression:
+            regressions[name] = ratio
+    return regressions
+
+
+def main(argv=None) -> int:
+    """Menjalankan microbenchmark dari command line"""
+    parser = argparse.ArgumentParser(description='Microbenchmark jalur konversi')
+    parser.add_argument('--number', type=int, default=20000, help='Panggilan per pengulangan')
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='File baseline JSON')
+    parser.add_argument('--max-regression', type=float, default=0.5,
+                        help='Batas kenaikan waktu relatif sebelum gagal (0.5 = 50%%)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Simpan hasil sebagai baseline baru')
+    parser.add_argument('--json', metavar='PATH', help='Simpan hasil sebagai JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.number, args.repeat)
+
+    baseline: Optional[dict] = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    regressions = compare(report, baseline, args.max_regression) if baseline else {}
+
+    for name, result in report['results'].items():
+        ratio = result.get('baseline_ratio')
+        suffix = f"  ({ratio:.2f}x baseline)" if ratio else ''
+        print(f"{name:>32}: {result['ns_per_op']:>10,.1f} ns/op{suffix}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"Baseline disimpan: {args.baseline}")
+
+    if regressions:
+        for name, ratio in regressions.items():
+            print(f"❌ Regresi {name}: {ratio:.2f}x baseline", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# ============================================================
+# FILE: benchmarks/bench_service.py
+# ============================================================
+"""Benchmark throughput service HTTP konversi di localhost"""
+import argparse
+import asyncio
+import json
+import time
+from itertools import cycle
+from typing import Dict, List
+
+from models import CurrencyConverter, StaticRateSource
+from services import ConversionService
+from benchmarks.bench_fetch import percentile
+from benchmarks.replay_server import load_sample_rates
+
+PAIRS = [('USD', 'IDR'), ('EUR', 'JPY'), ('GBP', 'SGD'), ('IDR', 'MYR'), ('AUD', 'CAD')]
+
+
+async def _client(host: str, port: int, requests_count: int,
+                  latencies: List[float]) -> int:
+    """Satu koneksi keep-alive yang mengirim request /convert berurutan"""
+    reader, writer = await asyncio.open_connection(host, port)
+    pairs = cycle(PAIRS)
+    failures = 0
+    for i in range(requests_count):
+        from_currency, to_currency = next(pairs)
+        request = (f'GET /convert?amount={i % 1000 + 1}&from={from_currency}&to={to_currency} '
+                   f'HTTP/1.1\r\nHost: {host}\r\n\r\n').encode('ascii')
+        start = time.perf_counter()
+        writer.write(request)
+        head = await reader.readuntil(b'\r\n\r\n')
+        length = int(head.split(b'Content-Length: ', 1)[1].split(b'\r\n', 1)[0])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+        failures += not head.startswith(b'HTTP/1.1 200')
+    writer.close()
+    return failures
+
+
+async def run_service_benchmark(requests_count: int = 20000, connections: int = 64,
+                                max_batch: int = 256,
+                                batch_delay_ms: float = 0) -> Dict[str, float]:
+    """
+    Mengukur throughput service dengan klien di event loop yang sama
+
+    Args:
+        requests_count: Jumlah total request
+        connections: Jumlah koneksi keep-alive paralel
+        max_batch: Ukuran micro-batch maksimum
+        batch_delay_ms: Waktu tunggu pengumpulan batch
+
+    Returns:
+        Dict throughput (request/detik), latensi (ms) dan jumlah gagal
+    """
+    converter = CurrencyConverter(use_cache=False, source=StaticRateSource(load_sample_rates()))
+    service = ConversionService(converter, '127.0.0.1', 0, max_batch, batch_delay_ms, 0)
+    await service.start()
+
+    latencies: List[float] = []
+    per_client = [requests_count // connections + (1 if i < requests_count % connections else 0)
+                  for i in range(connections)]
+    started = time.perf_counter()
+    failures = await asyncio.gather(*(
+        _client(service.host, service.port, count, latencies) for count in per_client
+    ))
+    elapsed = time.perf_counter() - started
+    await service.stop()
+
+    latencies.sort()
+    return {
+        'requests': requests_count,
+        'connections': connections,
+        'failures': sum(failures),
+        'requests_per_second': round(requests_count / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def main(argv=None):
+    """Menjalankan benchmark service dari command line"""
+    parser = argparse.ArgumentParser(description='Benchmark service HTTP konversi')
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--connections', type=int, default=64)
+    parser.add_argument('--max-batch', type=int, default=256)
+    parser.add_argument('--batch-delay-ms', type=float, default=0)
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run_service_benchmark(args.requests, args.connections,
+                                               args.max_batch, args.batch_delay_ms))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
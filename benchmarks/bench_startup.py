@@ -0,0 +1,104 @@
+# ============================================================
+# FILE: benchmarks/bench_startup.py
+# ============================================================
+"""Benchmark waktu start dan import CLI convert.py terhadap budget"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Set
+
+from utils.constants import CLI_CONFIG
+from benchmarks.replay_server import load_sample_rates
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI_PATH = os.path.join(ROOT_DIR, 'convert.py')
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """
+    Membaca output -X importtime menjadi waktu kumulatif modul level atas
+
+    Returns:
+        Dict nama modul -> mikrodetik kumulatif
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Modul level atas tidak diindentasi lebih dari satu spasi
+        if not name.startswith('  '):
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable] + args, cwd=ROOT_DIR,
+                          capture_output=True, text=True)
+
+
+def measure_startup(runs: int = 20) -> Dict[str, float]:
+    """
+    Mengukur convert.py dengan cache kurs lokal yang masih berlaku
+
+    Args:
+        runs: Jumlah proses yang dijalankan untuk waktu wall-clock
+
+    Returns:
+        Dict waktu import modul aplikasi (ms), waktu proses median (ms)
+        untuk CLI dan interpreter kosong, serta daftar modul terberat
+    """
+    from models.rate_cache import RateCache
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        RateCache(cache_dir).save('USD', load_sample_rates())
+        cli_args = [CLI_PATH, '100', 'USD', 'IDR', '--cache-dir', cache_dir]
+
+        result = _run(['-X', 'importtime'] + cli_args)
+        if result.returncode != 0:
+            raise RuntimeError(f"convert.py gagal: {result.stderr.strip()}")
+        baseline: Set[str] = set(parse_importtime(_run(['-X', 'importtime', '-c', 'pass']).stderr))
+        imports = {name: us for name, us in parse_importtime(result.stderr).items()
+                   if name not in baseline}
+
+        def median_ms(args: List[str]) -> float:
+            samples = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                _run(args)
+                samples.append(time.perf_counter() - start)
+            samples.sort()
+            return samples[len(samples) // 2] * 1000
+
+        heaviest = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:5]
+        return {
+            'import_ms': round(sum(imports.values()) / 1000, 2),
+            'process_ms': round(median_ms(cli_args), 2),
+            'interpreter_ms': round(median_ms(['-c', 'pass']), 2),
+            'heaviest_imports_ms': {name: round(us / 1000, 2) for name, us in heaviest},
+        }
+
+
+def main(argv=None) -> int:
+    """Menjalankan benchmark start CLI dari command line"""
+    parser = argparse.ArgumentParser(description='Benchmark start convert.py')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=CLI_CONFIG['import_budget_ms'],
+                        help='Batas waktu import modul aplikasi (ms)')
+    args = parser.parse_args(argv)
+
+    report = measure_startup(args.runs)
+    print(json.dumps(report, indent=2))
+    if report['import_ms'] > args.budget_ms:
+        print(f"❌ Import {report['import_ms']} ms melebihi budget {args.budget_ms} ms",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
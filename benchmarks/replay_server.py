@@ -0,0 +1,255 @@
+# ============================================================
+# FILE: benchmarks/replay_server.py
+# ============================================================
+"""Server HTTP lokal pengganti API kurs yang memutar ulang payload rekaman"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict
+
+PAYLOAD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'payloads')
+
+
+def payload_path(payload_dir: str, base_currency: str) -> str:
+    """Mendapatkan path file payload rekaman untuk sebuah base currency"""
+    return os.path.join(payload_dir, f'latest_{base_currency.upper()}.json')
+
+
+def load_sample_rates(base_currency: str = 'USD') -> Dict[str, float]:
+    """Membaca data kurs dari payload rekaman benchmark"""
+    with open(payload_path(PAYLOAD_DIR, base_currency), 'r', encoding='utf-8') as f:
+        return json.load(f)['rates']
+
+
+def record_payload(url_template: str, base_currency: str,
+                   payload_dir: str = PAYLOAD_DIR) -> str:
+    """
+    Merekam payload asli dari API ke folder payload
+
+    Args:
+        url_template: URL API dengan placeholder {base}
+        base_currency: Kode mata uang dasar
+        payload_dir: Folder penyimpanan payload
+
+    Returns:
+        Path file payload yang ditulis
+    """
+    import requests
+
+    response = requests.get(url_template.format(base=base_currency), timeout=10)
+    response.raise_for_status()
+    data = response.json()
+
+    os.makedirs(payload_dir, exist_ok=True)
+    path = payload_path(payload_dir, base_currency)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+    return path
+
+
+class ReplayServer:
+    """
+    Class server lokal yang meniru endpoint /v4/latest/{base}
+
+    Latensi, jitter, rasio error dan ukuran payload bisa diatur agar
+    jalur fetch bisa diukur dan diuji tanpa akses ke API publik.
+    """
+
+    def __init__(self, payload_dir: str = PAYLOAD_DIR, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 extra_currencies: int = 0, seed: Optional[int] = None):
+        """
+        Inisialisasi server
+
+        Args:
+            payload_dir: Folder berisi file latest_{BASE}.json
+            host: Alamat bind
+            port: Port bind (0 untuk port bebas)
+            latency: Latensi tambahan per request (detik)
+            jitter: Variasi acak latensi +/- (detik)
+            error_rate: Peluang request dijawab 503 (0..1)
+            extra_currencies: Jumlah mata uang sintetis untuk memperbesar payload
+            seed: Seed random agar hasil bisa diulang
+        """
+        self.payload_dir = payload_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.extra_currencies = extra_currencies
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._bodies: Dict[str, tuple] = {}
+
+        self.stats = {'requests': 0, 'errors': 0, 'not_modified': 0}
+        self._stats_lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url_template(self) -> str:
+        """URL template untuk HttpRateSource"""
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}/v4/latest/{{base}}'
+
+    def start(self) -> 'ReplayServer':
+        """Menjalankan server di background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        name='replay-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Menjalankan server di thread saat ini sampai dihentikan"""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        """Menghentikan server"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'ReplayServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _body_for(self, base_currency: str) -> Optional[tuple]:
+        """
+        Mendapatkan (body, body_gzip, etag) untuk sebuah base currency
+
+        Returns:
+            Tuple bytes atau None jika tidak ada payload rekaman
+        """
+        body = self._bodies.get(base_currency)
+        if body is not None:
+            return body
+
+        try:
+            with open(payload_path(self.payload_dir, base_currency), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        rates = data.setdefault('rates', {})
+        for i in range(self.extra_currencies):
+            rates[f'X{i:02X}'] = 1.0 + i / 1000
+
+        raw = json.dumps(data).encode('utf-8')
+        etag = '"' + hashlib.sha1(raw).hexdigest() + '"'
+        body = (raw, gzip.compress(raw), etag)
+        self._bodies[base_currency] = body
+        return body
+
+    def _delay(self) -> float:
+        with self._random_lock:
+            return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def _should_fail(self) -> bool:
+        with self._random_lock:
+            return self._random.random() < self.error_rate
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Header dan body dikirim dalam satu write agar tidak terkena
+            # delayed ACK yang menambah ~40 ms per respons
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server._count('requests')
+                time.sleep(server._delay())
+
+                prefix = '/v4/latest/'
+                if not self.path.startswith(prefix):
+                    self._send(404, b'{"error": "not found"}')
+                    return
+                if server._should_fail():
+                    server._count('errors')
+                    self._send(503, b'{"error": "injected failure"}')
+                    return
+
+                body = server._body_for(self.path[len(prefix):].upper())
+                if body is None:
+                    self._send(404, b'{"error": "unknown base"}')
+                    return
+
+                raw, compressed, etag = body
+                if self.headers.get('If-None-Match') == etag:
+                    server._count('not_modified')
+                    self._send(304, b'', {'ETag': etag})
+                    return
+
+                headers = {'ETag': etag, 'Content-Type': 'application/json'}
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    headers['Content-Encoding'] = 'gzip'
+                    raw = compressed
+                self._send(200, raw, headers)
+
+            def _send(self, status: int, payload: bytes, headers: Optional[dict] = None):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                if payload:
+                    self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main(argv=None):
+    """Menjalankan replay server dari command line"""
+    parser = argparse.ArgumentParser(description='Server lokal pengganti API kurs')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--payload-dir', default=PAYLOAD_DIR)
+    parser.add_argument('--latency', type=float, default=0.0, help='Detik per request')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Detik +/- acak')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Peluang 503 (0..1)')
+    parser.add_argument('--extra-currencies', type=int, default=0)
+    parser.add_argument('--record', metavar='BASE',
+                        help='Rekam payload asli untuk BASE lalu keluar')
+    args = parser.parse_args(argv)
+
+    if args.record:
+        from utils.constants import HTTP_CONFIG
+        path = record_payload(HTTP_CONFIG['url_template'], args.record, args.payload_dir)
+        print(f"✅ Payload direkam: {path}")
+        return
+
+    server = ReplayServer(args.payload_dir, port=args.port, latency=args.latency,
+                          jitter=args.jitter, error_rate=args.error_rate,
+                          extra_currencies=args.extra_currencies)
+    print(f"Replay server: {server.url_template}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+# ============================================================
+# FILE: checks/__init__.py
+# ============================================================
+"""Pemeriksaan kebenaran jalur cepat model (bukan pengukuran performa)"""
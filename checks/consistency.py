@@ -0,0 +1,315 @@
+# ============================================================
+# FILE: checks/consistency.py
+# ============================================================
+"""Pemeriksaan jaminan jalur cepat model (exit code 1 jika ada yang dilanggar)"""
+import argparse
+import io
+import math
+import random
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from decimal import ROUND_HALF_EVEN
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from models import (
+    CurrencyConverter, RateCache, RateGraph, RateSnapshot, RateSourceError, StaticRateSource,
+)
+from models import rate_graph
+from utils.constants import GRAPH_CONFIG
+from utils.registry import CurrencyRegistry
+from benchmarks.replay_server import load_sample_rates
+
+
+def compare_snapshots(incremental: RateSnapshot, full: RateSnapshot,
+                      pairs: Sequence[Tuple[str, str]]) -> List[str]:
+    """
+    Membandingkan snapshot inkremental dengan snapshot yang dibangun penuh
+
+    Vektor dan matriks dibandingkan per byte, sehingga perbedaan
+    pembulatan sekecil apa pun (dan posisi NaN) ikut terdeteksi.
+
+    Args:
+        incremental: Hasil RateSnapshot.with_rates
+        full: Hasil RateSnapshot(rates, ...) dengan data yang sama
+        pairs: Pasangan yang faktor fixed-point-nya dibandingkan
+
+    Returns:
+        Daftar nama bagian yang berbeda
+    """
+    problems = []
+    if incremental.rates != full.rates:
+        problems.append('rates')
+    if incremental.codes != full.codes:
+        problems.append('codes')
+    if incremental.vector.tobytes() != full.vector.tobytes():
+        problems.append('vector')
+    if incremental.inverse.tobytes() != full.inverse.tobytes():
+        problems.append('inverse')
+    if (incremental.cross_rates.codes != full.cross_rates.codes
+            or incremental.cross_rates.matrix.tobytes() != full.cross_rates.matrix.tobytes()):
+        problems.append('cross_rates')
+
+    engine = incremental.fixed_point(ROUND_HALF_EVEN)
+    reference = full.fixed_point(ROUND_HALF_EVEN)
+    if engine.scaled_rates != reference.scaled_rates:
+        problems.append('fixed_point.scaled_rates')
+    elif any(engine.pair_factor(*pair) != reference.pair_factor(*pair) for pair in pairs):
+        problems.append('fixed_point.pair_factor')
+    return problems
+
+
+def check_incremental_snapshot(rounds: int = 200, seed: int = 0) -> List[str]:
+    """
+    Memeriksa bahwa RateSnapshot.with_rates identik dengan rebuild penuh
+
+    Setiap putaran menggeser kurs sejumlah acak mata uang (kadang tidak
+    ada, kadang semua, kadang menghapus atau menambah mata uang) lalu
+    membandingkan hasil with_rates dengan RateSnapshot(rates, ...). Faktor
+    fixed-point beberapa pasangan di-cache dulu agar faktor yang dipakai
+    ulang oleh with_changes ikut diperiksa.
+
+    Args:
+        rounds: Jumlah update berurutan per konfigurasi cross-rate
+        seed: Seed random agar kegagalan bisa diulang
+
+    Returns:
+        Daftar pesan kegagalan (kosong jika semua identik)
+    """
+    sample = load_sample_rates()
+    codes = sorted(sample)
+    rng = random.Random(seed)
+    failures = []
+
+    for cross_rate_codes in (None, codes[:12]):
+        registry = CurrencyRegistry()
+        snapshot = RateSnapshot(sample, 'USD', 0.0, registry, cross_rate_codes)
+        pairs = [(rng.choice(codes), rng.choice(codes)) for _ in range(50)]
+        incremental = 0
+
+        for round_number in range(1, rounds + 1):
+            engine = snapshot.fixed_point(ROUND_HALF_EVEN)
+            for pair in pairs:
+                engine.pair_factor(*pair)
+
+            rates = dict(snapshot.rates)
+            count = rng.choice((0, 1, 2, 3, 5, len(codes) // 3, len(codes)))
+            for code in rng.sample(sorted(rates), min(count, len(rates))):
+                rates[code] *= 1 + rng.uniform(-0.01, 0.01)
+            if round_number % 50 == 0:
+                # Perubahan struktural: satu mata uang hilang atau kembali
+                missing = sorted(set(sample) - set(rates))
+                if missing:
+                    rates[missing[0]] = sample[missing[0]]
+                else:
+                    del rates[rng.choice(codes[12:])]
+
+            timestamp = float(round_number)
+            updated = snapshot.with_rates(rates, timestamp, cross_rate_codes)
+            full = RateSnapshot(rates, 'USD', timestamp, registry, cross_rate_codes)
+            # Snapshot turunan memakai tuple codes yang sama dengan induknya
+            if updated.codes is snapshot.codes and updated.version != snapshot.version:
+                incremental += 1
+
+            problems = compare_snapshots(updated, full, pairs)
+            if problems:
+                failures.append(f"with_rates putaran {round_number} "
+                                f"(cross_rate_codes={cross_rate_codes is not None}): "
+                                f"berbeda di {', '.join(problems)}")
+            snapshot = updated
+
+        if not incremental:
+            failures.append("with_rates tidak pernah memakai jalur inkremental")
+    return failures
+
+
+class SlowStaticSource(StaticRateSource):
+    """Sumber statis lambat yang menghitung pemanggilan fetch"""
+
+    def __init__(self, rates: Dict[str, float], key: str, delay: float = 0.2,
+                 fail: bool = False):
+        super().__init__(rates)
+        self.key = key
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def flight_key(self):
+        # Instance dengan key sama dianggap provider yang sama
+        return ('check', self.key)
+
+    def fetch(self, base_currency, etag=None, last_modified=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RateSourceError('sumber gagal (disengaja)')
+        return super().fetch(base_currency, etag, last_modified)
+
+
+def _fetch_together(converters: Sequence[CurrencyConverter], force_refresh: bool) -> List[bool]:
+    """Menjalankan fetch_rates semua converter bersamaan dari thread terpisah"""
+    results = [False] * len(converters)
+    barrier = threading.Barrier(len(converters))
+
+    def worker(i: int):
+        barrier.wait()
+        results[i] = converters[i].fetch_rates(force_refresh=force_refresh)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(converters))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def check_single_flight(consumers: int = 8) -> List[str]:
+    """
+    Memeriksa bahwa fetch bersamaan untuk sumber dan base yang sama digabung
+
+    Args:
+        consumers: Jumlah converter yang fetch bersamaan
+
+    Returns:
+        Daftar pesan kegagalan (kosong jika semua sesuai)
+    """
+    sample = load_sample_rates()
+    failures = []
+    # Key unik per run agar snapshot bersama dari run lain tidak terpakai
+    key = f'single-flight-{time.time_ns()}'
+
+    # Setiap converter punya instance sumber sendiri; hitungan total = panggilan upstream
+    sources = [SlowStaticSource(sample, key) for _ in range(consumers)]
+    with tempfile.TemporaryDirectory(prefix='check-single-flight-') as cache_dir:
+        cache = RateCache(cache_dir)
+        converters = [CurrencyConverter(cache=cache, source=source) for source in sources]
+        results = _fetch_together(converters, force_refresh=True)
+        calls = sum(source.calls for source in sources)
+        if not all(results):
+            failures.append(f"fetch bersamaan gagal: {results}")
+        if calls != 1:
+            failures.append(f"{consumers} fetch bersamaan memanggil sumber {calls} kali, bukan 1")
+        if len({id(converter.snapshot) for converter in converters}) != 1:
+            failures.append("converter dengan registry sama tidak memakai satu snapshot")
+
+        # Converter baru (tanpa paksa) memakai snapshot bersama tanpa fetch
+        late = SlowStaticSource(sample, key)
+        converter = CurrencyConverter(cache=cache, source=late)
+        if (not converter.fetch_rates() or late.calls
+                or converter.snapshot is not converters[0].snapshot):
+            failures.append("snapshot bersama yang masih berlaku tidak dipakai converter baru")
+
+    # Kegagalan upstream diterima semua pemanggil, tetap satu panggilan
+    failing = [SlowStaticSource(sample, key + '-fail', fail=True) for _ in range(consumers)]
+    converters = [CurrencyConverter(use_cache=False, source=source) for source in failing]
+    with redirect_stdout(io.StringIO()):
+        results = _fetch_together(converters, force_refresh=True)
+    calls = sum(source.calls for source in failing)
+    if any(results) or calls != 1:
+        failures.append(f"fetch gagal bersamaan: hasil {results}, {calls} panggilan sumber")
+
+    # single_flight=False tetap fetch sendiri-sendiri
+    separate = [SlowStaticSource(sample, key + '-separate', delay=0.05) for _ in range(3)]
+    converters = [CurrencyConverter(use_cache=False, source=source, single_flight=False)
+                  for source in separate]
+    _fetch_together(converters, force_refresh=True)
+    calls = sum(source.calls for source in separate)
+    if calls != len(separate):
+        failures.append(f"single_flight=False memanggil sumber {calls} kali, bukan {len(separate)}")
+    return failures
+
+
+def check_graph_paths(rounds: int = 20, seed: int = 0) -> List[str]:
+    """
+    Memeriksa bahwa path() graf kurs sesuai dengan rate() pasangan yang sama
+
+    Setiap putaran membuat beberapa provider dengan kurs yang digeser acak
+    (sehingga sering ada siklus arbitrase) lalu, untuk setiap pasangan,
+    membandingkan perkalian kurs efektif sisi-sisi jalur dengan rate().
+    Jika ada arbitrase, panjang jalur juga tidak boleh melebihi max_hops.
+    Jalur NumPy dan loop Python sama-sama diperiksa.
+
+    Args:
+        rounds: Jumlah graf acak per implementasi
+        seed: Seed random agar kegagalan bisa diulang
+
+    Returns:
+        Daftar pesan kegagalan (kosong jika semua sesuai)
+    """
+    sample = load_sample_rates()
+    failures = []
+    numpy_module = rate_graph.np
+    for use_numpy in ((False, True) if numpy_module is not None else (False,)):
+        rng = random.Random(seed)
+        rate_graph.np = numpy_module if use_numpy else None
+        try:
+            for round_number in range(1, rounds + 1):
+                graph = RateGraph()
+                for provider in range(rng.choice((1, 2, 3))):
+                    drift = rng.choice((0.0, 0.001, 0.02))
+                    rates = {code: rate * (1 + rng.uniform(-drift, drift))
+                             for code, rate in sample.items()}
+                    graph.add_table('USD', rates, f'p{provider}', spread=0.0, fee=0.0)
+                graph.rebuild()
+                edges = graph._edges()
+                for from_code in graph.codes:
+                    for to_code in graph.codes:
+                        rate = graph.rate(from_code, to_code)
+                        path = graph.path(from_code, to_code)
+                        label = (f"putaran {round_number} (numpy={use_numpy}) "
+                                 f"{from_code}->{to_code}")
+                        if rate is None or path is None:
+                            failures.append(f"{label}: rate {rate}, jalur {path}")
+                            continue
+                        if path[0] != from_code or path[-1] != to_code:
+                            failures.append(f"{label}: jalur {path} salah ujung")
+                            continue
+                        if graph.arbitrage and len(path) - 1 > GRAPH_CONFIG['max_hops']:
+                            failures.append(f"{label}: jalur {path} melebihi max_hops")
+                        product = 1.0
+                        for step in zip(path, path[1:]):
+                            product *= edges.get(step, 0.0)
+                        if not math.isclose(product, rate, rel_tol=1e-9):
+                            failures.append(f"{label}: jalur {path} bernilai {product!r}, "
+                                            f"rate() {rate!r}")
+        finally:
+            rate_graph.np = numpy_module
+    return failures
+
+
+CHECKS: Dict[str, Callable[[], List[str]]] = {
+    'incremental_snapshot': check_incremental_snapshot,
+    'single_flight': check_single_flight,
+    'graph_paths': check_graph_paths,
+}
+
+
+def main(argv=None) -> int:
+    """Menjalankan pemeriksaan dari command line"""
+    parser = argparse.ArgumentParser(description='Pemeriksaan konsistensi model')
+    parser.add_argument('checks', nargs='*', metavar='CHECK',
+                        help=f"Pemeriksaan yang dijalankan: {', '.join(CHECKS)} (default semua)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.checks if name not in CHECKS]
+    if unknown:
+        parser.error(f"Pemeriksaan tidak dikenal: {', '.join(unknown)}")
+
+    failed = False
+    for name in args.checks or CHECKS:
+        failures = CHECKS[name]()
+        for failure in failures:
+            print(f"❌ {name}: {failure}", file=sys.stderr)
+        if failures:
+            failed = True
+        else:
+            print(f"✅ {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,5 +3,7 @@
 # ============================================================
 """Controllers package"""
 from .app_controller import AppController
+from .refresh_scheduler import RefreshScheduler
+from .watchlist_controller import WatchlistController
 
-__all__ = ['AppController']
\ No newline at end of file
+__all__ = ['AppController', 'RefreshScheduler', 'WatchlistController']
\ No newline at end of file
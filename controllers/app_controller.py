@@ -3,35 +3,97 @@
 # ============================================================
 
 """Controller untuk mengatur logika aplikasi"""
+import queue
+import threading
+import time
+from itertools import cycle
 from tkinter import messagebox
-from models import CurrencyConverter
+from typing import Optional
+from models import CurrencyConverter, RateHistory
+from utils.constants import METRICS_CONFIG, REFRESH_CONFIG
+from utils.metrics import METRICS
 from views import CurrencyConverterGUI
+from .refresh_scheduler import RefreshScheduler
+from .watchlist_controller import WatchlistController
+
+# Metrik waktu yang dihabiskan callback controller di Tk main loop
+_UI_CONVERT_SECONDS = METRICS.histogram('ui_convert_seconds',
+                                        'Durasi handle_convert di Tk main loop (sampel)')
+_UI_REFRESH_SECONDS = METRICS.histogram('ui_refresh_update_seconds',
+                                        'Durasi update UI setelah refresh')
 
 
 class AppController:
     """Controller utama aplikasi"""
     
-    def __init__(self, view: CurrencyConverterGUI):
+    def __init__(self, view: CurrencyConverterGUI, model: Optional[CurrencyConverter] = None,
+                 auto_refresh: Optional[bool] = None):
         """
         Inisialisasi controller
         
         Args:
             view: Instance dari GUI view
+            model: Model converter (default CurrencyConverter baru)
+            auto_refresh: Aktifkan refresh otomatis (default REFRESH_CONFIG)
         """
         self.view = view
-        self.model = CurrencyConverter()
+        self.registry = view.registry
+        if model is None:
+            model = CurrencyConverter(registry=self.registry,
+                                      history=RateHistory.from_config('USD'))
+        self.model = model
+        
+        # State untuk refresh di background thread
+        self._refresh_results: "queue.Queue[tuple]" = queue.Queue()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_poll_ms = 50
+        
+        # Input konversi terakhir dan versi kurs yang dipakai, untuk
+        # melewati konversi yang hasilnya pasti sama
+        self._last_convert_key: Optional[tuple] = None
+        self._last_convert_version = 0
+        
+        # Hanya 1 dari N konversi yang diukur: timer dan histogram lebih
+        # mahal daripada konversinya sendiri (bernilai 0 = giliran diukur)
+        self._convert_samples = cycle(range(max(1, METRICS_CONFIG['ui_sample_every'])))
         
         # Set callback functions
         self.view.on_convert = self.handle_convert
         self.view.on_swap = self.handle_swap
         self.view.on_refresh = self.handle_refresh
         self.view.on_clear = self.handle_clear
+        self.view.on_watchlist = self.handle_watchlist
+        
+        # Watchlist memakai model yang sama; dibuat saat jendelanya dibuka
+        self.watchlist: Optional[WatchlistController] = None
         
-        # Load initial rates
-        self.handle_refresh()
+        # Refresh otomatis berjalan tanpa popup, hasilnya menggeser jadwal
+        self.scheduler: Optional[RefreshScheduler] = None
+        if REFRESH_CONFIG['auto_refresh'] if auto_refresh is None else auto_refresh:
+            self.scheduler = RefreshScheduler(
+                self.view.root,
+                lambda: self.handle_refresh(force_refresh=True, notify=False),
+                is_minimized=self.view.is_minimized
+            )
+            self.view.on_activity = self.scheduler.notify_activity
+            self.scheduler.start()
+        
+        # Load initial rates (boleh dari cache lokal)
+        self.handle_refresh(force_refresh=False, notify=False)
+        
+        # Export metrik berkala ke file (jika diaktifkan)
+        self._metrics_interval_ms = METRICS_CONFIG['export_interval_ms']
+        if METRICS.enabled and self._metrics_interval_ms > 0:
+            self.view.root.after(self._metrics_interval_ms, self._export_metrics)
     
     def handle_convert(self):
-        """Handle konversi mata uang"""
+        """
+        Handle konversi mata uang
+        
+        Input dan kurs pasangan yang sama dengan konversi terakhir langsung
+        dilewati tanpa diukur; dari konversi yang berhasil dijalankan, satu
+        dari METRICS_CONFIG['ui_sample_every'] dicatat durasinya di metrik UI.
+        """
         try:
             amount = self.view.get_amount()
             if not amount:
@@ -46,16 +108,54 @@ class AppController:
             if not from_code or not to_code:
                 return
             
-            result = self.model.convert(amount, from_code, to_code)
+            # Belum ada snapshot (misalnya fetch awal masih berjalan): bukan
+            # kegagalan konversi. Input dikonversi setelah refresh selesai.
+            snapshot = self.model.snapshot
+            if not snapshot.rates:
+                if self._refresh_thread is not None:
+                    self.view.set_status("Memuat data kurs...")
+                return
+            
+            try:
+                parsed_amount = float(amount)
+            except ValueError:
+                parsed_amount = amount
+            convert_key = (parsed_amount, from_code, to_code)
+            if convert_key == self._last_convert_key:
+                version = snapshot.version
+                if version == self._last_convert_version:
+                    return
+                # Refresh yang tidak mengubah kurs pasangan ini tidak perlu
+                # menghitung dan menggambar ulang hasil maupun label kurs
+                if snapshot.unchanged_since(self._last_convert_version, convert_key[1:]):
+                    self._last_convert_version = version
+                    return
+            
+            started = (time.perf_counter()
+                       if METRICS.enabled and not next(self._convert_samples) else None)
+            self._last_convert_key = None
+            
+            if self.model.engine == 'fixed':
+                # Decimal eksak sudah memiliki digit minor unit mata uang tujuan
+                result = self.model.convert_exact(amount, from_code, to_code)
+                result_text = None if result is None else f"{result:,}"
+            else:
+                result = self.model.convert(amount, from_code, to_code)
+                result_text = None if result is None else f"{result:,.2f}"
             
             if result is not None:
-                self.view.set_result(f"{result:,.2f}")
+                self._last_convert_key = convert_key
+                self._last_convert_version = snapshot.version
+                self.view.set_result(result_text)
                 
                 # Update rate info
                 rate = self.model.get_rate(from_code, to_code)
                 if rate:
                     rate_text = f"1 {from_code} = {rate:,.4f} {to_code}"
                     self.view.set_rate_info(rate_text)
+                
+                if started is not None:
+                    _UI_CONVERT_SECONDS.observe(time.perf_counter() - started)
             else:
                 self.view.set_result("Error")
                 messagebox.showerror("Error", "Gagal melakukan konversi")
@@ -74,30 +174,106 @@ class AppController:
         
         self.handle_convert()
     
-    def handle_refresh(self):
-        """Handle refresh data kurs"""
+    def handle_refresh(self, force_refresh: bool = True, notify: bool = True):
+        """
+        Handle refresh data kurs tanpa memblokir Tk main loop
+        
+        Pengambilan data dijalankan di worker thread; hasilnya dikirim
+        kembali ke Tk loop melalui root.after. Refresh yang diminta saat
+        refresh sebelumnya masih berjalan akan diabaikan.
+        
+        Args:
+            force_refresh: True untuk mengabaikan cache lokal
+            notify: True untuk menampilkan popup jika gagal (refresh manual)
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        
         self.view.set_status("Memuat data kurs...")
-        self.view.root.update()
+        self.view.set_refresh_enabled(False)
+        
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_worker,
+            args=(force_refresh, notify),
+            name='rate-refresh',
+            daemon=True
+        )
+        self._refresh_thread.start()
+        self.view.root.after(self._refresh_poll_ms, self._poll_refresh)
+    
+    def _refresh_worker(self, force_refresh: bool, notify: bool):
+        """Mengambil data kurs di worker thread (tanpa akses widget)"""
+        try:
+            success = self.model.fetch_rates(force_refresh=force_refresh)
+        except Exception as e:
+            print(f"Refresh error: {e}")
+            success = False
+        self._refresh_results.put((success, notify))
+    
+    def _poll_refresh(self):
+        """Memeriksa hasil refresh dari worker thread di Tk main loop"""
+        try:
+            success, notify = self._refresh_results.get_nowait()
+        except queue.Empty:
+            self.view.root.after(self._refresh_poll_ms, self._poll_refresh)
+            return
+        
+        self._refresh_thread = None
+        self.view.set_refresh_enabled(True)
         
-        success = self.model.fetch_rates()
+        start = time.perf_counter()
+        self._on_refresh_done(success, notify)
+        if METRICS.enabled:
+            _UI_REFRESH_SECONDS.observe(time.perf_counter() - start)
         
+        if self.scheduler is not None:
+            self.scheduler.on_refresh_done(success)
+    
+    def _on_refresh_done(self, success: bool, notify: bool):
+        """
+        Memperbarui tampilan setelah refresh selesai
+        
+        Args:
+            success: Hasil fetch_rates
+            notify: True jika refresh diminta langsung oleh user
+        """
         if success:
             update_time = self.model.get_last_update_formatted()
             status_text = f"✅ Data kurs diperbarui: {update_time}"
             self.view.set_status(status_text)
             self.handle_convert()
-            messagebox.showinfo("Sukses", "Data kurs berhasil diperbarui!")
+            if self.watchlist is not None:
+                self.watchlist.refresh()
         else:
             self.view.set_status("❌ Gagal memuat data kurs")
-            messagebox.showerror(
-                "Error",
-                "Gagal memuat data kurs.\nPeriksa koneksi internet Anda."
-            )
+            # Popup hanya untuk refresh manual; startup dan refresh
+            # otomatis cukup menampilkan status
+            if notify:
+                messagebox.showerror(
+                    "Error",
+                    "Gagal memuat data kurs.\nPeriksa koneksi internet Anda."
+                )
+    
+    def handle_watchlist(self):
+        """Handle membuka jendela watchlist banyak pasangan"""
+        panel = self.view.open_watchlist(on_close=self._close_watchlist)
+        if self.watchlist is None:
+            self.watchlist = WatchlistController(panel, self.model)
+    
+    def _close_watchlist(self):
+        """Melepas controller watchlist setelah jendelanya ditutup"""
+        self.watchlist = None
+    
+    def _export_metrics(self):
+        """Menulis snapshot metrik ke file lalu menjadwalkan export berikutnya"""
+        METRICS.write_snapshot()
+        self.view.root.after(self._metrics_interval_ms, self._export_metrics)
     
     def handle_clear(self):
         """Handle clear/reset form"""
+        self._last_convert_key = None
         self.view.clear_amount()
         self.view.set_result('0.00')
         self.view.set_rate_info('')
-        self.view.set_from_currency_index(0)
-        self.view.set_to_currency_index(3)
+        self.view.set_from_currency_index(self.registry.id_of('USD'))
+        self.view.set_to_currency_index(self.registry.id_of('IDR'))
@@ -0,0 +1,131 @@
+# ============================================================
+# FILE: controllers/refresh_scheduler.py
+# ============================================================
+"""Penjadwal refresh kurs otomatis dengan jitter dan exponential backoff"""
+import random
+import time
+from typing import Callable, Optional
+from utils.constants import REFRESH_CONFIG
+
+
+class RefreshScheduler:
+    """
+    Class penjadwal refresh otomatis di atas root.after
+
+    Setelah refresh berhasil, refresh berikutnya dijadwalkan interval_s
+    kemudian; setelah gagal, jedanya retry_base_s * 2**(gagal - 1) sampai
+    max_backoff_s. Semua jeda diberi jitter acak +/- jitter agar banyak
+    instance tidak menembak API bersamaan. Selama window diminimize atau
+    user tidak aktif lebih dari idle_timeout_s, refresh yang jatuh tempo
+    ditunda dan baru dijalankan saat ada aktivitas lagi.
+    """
+
+    def __init__(self, root, refresh: Callable[[], None],
+                 is_minimized: Optional[Callable[[], bool]] = None,
+                 interval_s: Optional[float] = None, jitter: Optional[float] = None,
+                 retry_base_s: Optional[float] = None, max_backoff_s: Optional[float] = None,
+                 idle_timeout_s: Optional[float] = None, rng: Optional[random.Random] = None):
+        """
+        Inisialisasi penjadwal
+
+        Args:
+            root: Tk root (atau objek lain dengan after/after_cancel)
+            refresh: Fungsi yang memulai refresh; hasilnya dilaporkan lewat
+                     on_refresh_done
+            is_minimized: Fungsi yang mengembalikan True jika window diminimize
+            interval_s: Jeda antar refresh normal (default REFRESH_CONFIG)
+            jitter: Variasi relatif jeda, 0.1 = +/- 10%
+            retry_base_s: Jeda retry pertama setelah gagal
+            max_backoff_s: Jeda retry maksimum
+            idle_timeout_s: Lama tanpa aktivitas sebelum refresh ditunda
+                            (0 = tidak pernah dianggap idle)
+            rng: Sumber angka acak (untuk hasil yang bisa diulang)
+        """
+        self.root = root
+        self.refresh = refresh
+        self.is_minimized = is_minimized or (lambda: False)
+        self.interval_s = REFRESH_CONFIG['interval_s'] if interval_s is None else interval_s
+        self.jitter = REFRESH_CONFIG['jitter'] if jitter is None else jitter
+        self.retry_base_s = REFRESH_CONFIG['retry_base_s'] if retry_base_s is None else retry_base_s
+        self.max_backoff_s = (REFRESH_CONFIG['max_backoff_s']
+                              if max_backoff_s is None else max_backoff_s)
+        self.idle_timeout_s = (REFRESH_CONFIG['idle_timeout_s']
+                               if idle_timeout_s is None else idle_timeout_s)
+        self._random = rng or random.Random()
+
+        self.failures = 0
+        self._job: Optional[str] = None
+        self._due = False
+        self._running = False
+        self._last_activity = time.monotonic()
+
+    def next_delay(self) -> float:
+        """
+        Menghitung jeda sampai refresh berikutnya
+
+        Returns:
+            Jeda dalam detik, sudah diberi jitter
+        """
+        if self.failures:
+            delay = min(self.max_backoff_s, self.retry_base_s * 2 ** (self.failures - 1))
+        else:
+            delay = self.interval_s
+        return delay * (1 + self._random.uniform(-self.jitter, self.jitter))
+
+    def start(self):
+        """Mulai menjadwalkan refresh otomatis"""
+        self._running = True
+        self._schedule()
+
+    def stop(self):
+        """Menghentikan refresh otomatis"""
+        self._running = False
+        self._due = False
+        self._cancel()
+
+    def is_paused(self) -> bool:
+        """True jika window diminimize atau user sedang idle"""
+        if self.is_minimized():
+            return True
+        idle = time.monotonic() - self._last_activity
+        return self.idle_timeout_s > 0 and idle > self.idle_timeout_s
+
+    def notify_activity(self):
+        """Dipanggil setiap ada aktivitas user; menjalankan refresh yang tertunda"""
+        self._last_activity = time.monotonic()
+        if self._due and not self.is_minimized():
+            self._due = False
+            self.refresh()
+
+    def on_refresh_done(self, success: bool):
+        """
+        Mencatat hasil refresh (otomatis maupun manual) dan menjadwalkan ulang
+
+        Args:
+            success: True jika refresh berhasil
+        """
+        self.failures = 0 if success else self.failures + 1
+        # Refresh manual juga menggeser jadwal, jadi tidak ada refresh dobel
+        self._due = False
+        if self._running:
+            self._schedule()
+
+    def _schedule(self):
+        self._cancel()
+        self._job = self.root.after(int(self.next_delay() * 1000), self._tick)
+
+    def _cancel(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _tick(self):
+        """Callback root.after saat refresh jatuh tempo"""
+        self._job = None
+        if not self._running:
+            return
+        if self.is_paused():
+            # Tidak ada timer selama jeda; notify_activity melanjutkan
+            self._due = True
+            return
+        self.refresh()
@@ -0,0 +1,94 @@
+# ============================================================
+# FILE: controllers/watchlist_controller.py
+# ============================================================
+"""Controller watchlist: mengisi panel dari snapshot kurs model"""
+from itertools import permutations
+from typing import Dict, List, Optional, Sequence, Tuple
+from models import CurrencyConverter
+from utils.constants import CURRENCIES, WATCHLIST_CONFIG
+from views import WatchlistPanel
+from views.watchlist import RowValues
+
+Pair = Tuple[str, str]
+
+
+def default_pairs() -> List[Pair]:
+    """Pasangan watchlist dari WATCHLIST_CONFIG (default semua pasangan CURRENCIES)"""
+    pairs = WATCHLIST_CONFIG['pairs']
+    if pairs is None:
+        return list(permutations(CURRENCIES, 2))
+    return [tuple(pair) for pair in pairs]
+
+
+class WatchlistController:
+    """
+    Class controller untuk panel watchlist
+
+    Semua pasangan dihitung dari satu snapshot model (satu fetch untuk
+    ratusan pasangan). Setelah refresh, hanya pasangan yang menyentuh mata
+    uang di delta snapshot yang dihitung ulang, dan hanya baris yang kursnya
+    berubah yang dikirim ke panel.
+    """
+
+    def __init__(self, panel: WatchlistPanel, model: CurrencyConverter,
+                 pairs: Optional[Sequence[Pair]] = None):
+        """
+        Inisialisasi controller watchlist
+
+        Args:
+            panel: Panel watchlist
+            model: Model converter yang datanya ditampilkan
+            pairs: Pasangan (asal, tujuan) yang dipantau (default default_pairs())
+        """
+        self.panel = panel
+        self.model = model
+        self.pairs: List[Pair] = list(pairs) if pairs is not None else default_pairs()
+        self.rate_format = WATCHLIST_CONFIG['rate_format']
+
+        # Kurs terakhir yang dikirim ke panel (None = tampil '-') dan versi snapshot-nya
+        self._rates: Dict[Pair, Optional[float]] = {}
+        self._version = 0
+
+        self.panel.set_rows(self.pairs, {pair: f"{pair[0]}/{pair[1]}" for pair in self.pairs})
+        self.refresh()
+
+    def refresh(self):
+        """Memperbarui panel dari snapshot aktif model"""
+        snapshot = self.model.snapshot
+        if not snapshot.rates or snapshot.version == self._version:
+            return
+
+        delta = snapshot.delta
+        pairs = self.pairs
+        if (self._version and delta is not None and delta.since_version == self._version
+                and not delta.structural):
+            changed = delta.changed
+            pairs = [pair for pair in pairs if pair[0] in changed or pair[1] in changed]
+
+        updates: Dict[Pair, RowValues] = {}
+        previous = self._rates
+        for pair in pairs:
+            rate = snapshot.rate(*pair)
+            # Pasangan yang belum pernah dikirim selalu diisi, termasuk '-'
+            if pair in previous:
+                old = previous[pair]
+                if rate == old:
+                    continue
+            else:
+                old = None
+            updates[pair] = self._format_row(rate, old)
+            previous[pair] = rate
+
+        self._version = snapshot.version
+        if updates:
+            self.panel.update_rows(updates)
+
+    def _format_row(self, rate: Optional[float], old: Optional[float]) -> RowValues:
+        """Teks kurs, perubahan (%) dan tag warna satu baris"""
+        if rate is None:
+            return '-', '', ''
+        rate_text = self.rate_format.format(rate)
+        if not old:
+            return rate_text, '', ''
+        change = (rate / old - 1) * 100
+        return rate_text, f"{change:+.3f}%", 'up' if change > 0 else 'down' if change < 0 else ''
@@ -0,0 +1,159 @@
+# ============================================================
+# FILE: convert.py
+# ============================================================
+"""
+Entry point konversi satu kali dari command line
+
+    python convert.py 100 USD IDR
+
+Dibuat untuk dipanggil berulang dari shell pipeline: modul di-import
+seperlunya saja. Jika cache kurs lokal masih berlaku, hanya cache dan
+rumus cross-rate yang dimuat; requests dan model lengkap baru di-import
+saat kurs harus diambil dari API.
+"""
+import math
+import sys
+from contextlib import redirect_stdout
+from typing import Optional, Dict, List
+
+USAGE = """Penggunaan: python convert.py AMOUNT FROM TO [opsi]
+
+Opsi:
+  --base KODE       Base currency data kurs (default USD)
+  --refresh         Abaikan cache kurs lokal
+  --exact           Pakai engine fixed-point (Decimal eksak)
+  --raw             Cetak hasil float apa adanya tanpa pembulatan
+  --cache-dir DIR   Folder cache kurs (default CACHE_CONFIG)
+"""
+
+
+def parse_args(argv: List[str]) -> Optional[Dict[str, object]]:
+    """
+    Membaca argumen tanpa argparse (lebih cepat di-import)
+
+    Returns:
+        Dict opsi atau None jika argumen tidak valid
+    """
+    options: Dict[str, object] = {
+        'base': 'USD', 'refresh': False, 'exact': False, 'raw': False, 'cache_dir': None,
+    }
+    positional = []
+    args = iter(argv)
+    for arg in args:
+        if arg in ('--refresh', '--exact', '--raw'):
+            options[arg[2:]] = True
+        elif arg in ('--base', '--cache-dir'):
+            value = next(args, None)
+            if value is None:
+                return None
+            options[arg[2:].replace('-', '_')] = value
+        elif arg in ('-h', '--help') or (arg.startswith('--') and arg != '--'):
+            return None
+        else:
+            positional.append(arg)
+
+    if len(positional) != 3:
+        return None
+    options['amount'] = positional[0]
+    options['from'] = positional[1].upper()
+    options['to'] = positional[2].upper()
+    options['base'] = str(options['base']).upper()
+    return options
+
+
+def load_rates(base_currency: str, refresh: bool,
+               cache_dir: Optional[str]) -> Optional[Dict[str, float]]:
+    """
+    Mendapatkan data kurs: cache yang masih berlaku, lalu API, lalu
+    cache kedaluwarsa sebagai cadangan terakhir
+
+    Returns:
+        Data kurs atau None jika semua gagal
+    """
+    from models.rate_cache import RateCache
+
+    cache = RateCache(cache_dir)
+    if not refresh:
+        entry = cache.load_fresh(base_currency)
+        if entry is not None:
+            return entry['rates']
+
+    # Jalur lambat: model lengkap (requests) hanya saat perlu fetch
+    from models.converter import CurrencyConverter
+
+    converter = CurrencyConverter(base_currency, cache=cache)
+    try:
+        # Pesan error model dicetak ke stdout; di CLI stdout hanya untuk hasil
+        with redirect_stdout(sys.stderr):
+            if converter.fetch_rates(force_refresh=refresh):
+                return converter.rates
+    finally:
+        converter.close()
+
+    entry = cache.load(base_currency)
+    if entry is not None:
+        print("⚠️ Memakai data kurs kedaluwarsa dari cache", file=sys.stderr)
+        return entry['rates']
+    return None
+
+
+def main(argv=None) -> int:
+    """Fungsi utama konversi satu kali"""
+    options = parse_args(sys.argv[1:] if argv is None else argv)
+    if options is None:
+        print(USAGE, file=sys.stderr, end='')
+        return 2
+
+    rates = load_rates(options['base'], options['refresh'], options['cache_dir'])
+    if not rates:
+        print("❌ Gagal memuat data kurs", file=sys.stderr)
+        return 1
+
+    from_code, to_code = options['from'], options['to']
+    from utils.constants import CONVERSION_CONFIG
+
+    if options['exact'] or CONVERSION_CONFIG['engine'] == 'fixed':
+        from models.fixed_point import FixedPointConverter
+
+        try:
+            result = FixedPointConverter(rates, rounding=CONVERSION_CONFIG['rounding']).convert(
+                options['amount'], from_code, to_code
+            )
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        if result is None:
+            print(f"❌ Pasangan {from_code}/{to_code} tidak tersedia", file=sys.stderr)
+            return 1
+        print(result)
+        return 0
+
+    from models.cross_rates import CrossRateMatrix
+
+    try:
+        amount = float(options['amount'])
+    except ValueError:
+        amount = math.nan
+    if not math.isfinite(amount):
+        print(f"❌ Jumlah tidak valid: {options['amount']}", file=sys.stderr)
+        return 1
+    rate = CrossRateMatrix.pair_rate(rates, from_code, to_code)
+    if rate is None:
+        print(f"❌ Pasangan {from_code}/{to_code} tidak tersedia", file=sys.stderr)
+        return 1
+
+    result = amount * rate
+    if not math.isfinite(result):
+        print(f"❌ Hasil konversi di luar jangkauan: {options['amount']} {from_code}",
+              file=sys.stderr)
+        return 1
+    if options['raw']:
+        print(repr(result))
+    else:
+        from utils.registry import REGISTRY
+        print(f"{result:.{REGISTRY.minor_unit_of(to_code)}f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
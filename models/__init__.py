@@ -1,7 +1,54 @@
 # ============================================================
 # FILE: models/__init__.py
 # ============================================================
-"""Models package untuk currency converter"""
-from .converter import CurrencyConverter
+"""
+Models package untuk currency converter
 
-__all__ = ['CurrencyConverter']
\ No newline at end of file
+Class di-import saat pertama kali diakses (PEP 562), sehingga
+`from models.rate_cache import RateCache` tidak ikut memuat requests
+dan NumPy yang dibutuhkan converter.
+"""
+from importlib import import_module
+
+# Nama yang diekspor -> submodule tempat nama tersebut didefinisikan
+_EXPORTS = {
+    'BatchConverter': '.batch',
+    'BinarySnapshot': '.binary_snapshot',
+    'CurrencyConverter': '.converter',
+    'CrossRateMatrix': '.cross_rates',
+    'FixedPointConverter': '.fixed_point',
+    'HedgedRateSource': '.hedged_source',
+    'ProviderStats': '.hedged_source',
+    'ParallelBatchConverter': '.parallel_batch',
+    'RateCache': '.rate_cache',
+    'RateDelta': '.rate_delta',
+    'RateGraph': '.rate_graph',
+    'RateHistory': '.rate_history',
+    'RateSnapshot': '.rate_snapshot',
+    'HttpRateSource': '.rate_source',
+    'RateResult': '.rate_source',
+    'RateSource': '.rate_source',
+    'RateSourceError': '.rate_source',
+    'StaticRateSource': '.rate_source',
+    'SharedRates': '.single_flight',
+    'SingleFlight': '.single_flight',
+}
+
+__all__ = ['BatchConverter', 'BinarySnapshot', 'CurrencyConverter', 'CrossRateMatrix',
+           'FixedPointConverter', 'HedgedRateSource', 'HttpRateSource', 'ParallelBatchConverter',
+           'ProviderStats', 'RateCache', 'RateDelta', 'RateGraph', 'RateHistory', 'RateResult',
+           'RateSnapshot', 'RateSource', 'RateSourceError', 'SharedRates', 'SingleFlight',
+           'StaticRateSource']
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,219 @@
+# ============================================================
+# FILE: models/batch.py
+# ============================================================
+"""Konversi batch CSV/JSONL secara streaming tanpa GUI"""
+import csv
+import json
+import math
+from itertools import islice
+from typing import Optional, Dict, List, Iterable, Iterator, TextIO, Tuple
+
+from .cross_rates import CrossRateMatrix
+from .fixed_point import FixedPointConverter
+
+
+def _reject_constant(name: str):
+    """parse_constant json.loads: NaN/Infinity bukan JSON yang valid"""
+    raise ValueError(f"Konstanta JSON tidak valid: {name}")
+
+
+class BatchConverter:
+    """Class untuk mengonversi kolom amount pada aliran record"""
+
+    def __init__(self, cross_rates: CrossRateMatrix,
+                 amount_field: str = 'amount',
+                 from_field: str = 'from',
+                 to_field: str = 'to',
+                 default_from: Optional[str] = None,
+                 default_to: Optional[str] = None,
+                 output_field: str = 'converted',
+                 chunk_size: int = 10000,
+                 fixed_point: Optional[FixedPointConverter] = None):
+        """
+        Inisialisasi batch converter
+
+        Semua record dikonversi dengan matriks cross-rate yang sama,
+        sehingga satu run selalu memakai satu snapshot kurs. Jika
+        fixed_point diberikan, hasil dihitung dengan engine fixed-point
+        dari snapshot yang sama dan ditulis sebagai string Decimal eksak,
+        sama seperti hasil GUI dan CLI dengan engine 'fixed'.
+
+        Args:
+            cross_rates: Snapshot matriks cross-rate
+            amount_field: Nama kolom jumlah uang
+            from_field: Nama kolom mata uang asal
+            to_field: Nama kolom mata uang tujuan
+            default_from: Mata uang asal jika kolom kosong/tidak ada
+            default_to: Mata uang tujuan jika kolom kosong/tidak ada
+            output_field: Nama kolom hasil konversi
+            chunk_size: Jumlah record yang diproses per chunk
+            fixed_point: Engine fixed-point (None = kurs float)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size harus lebih dari 0")
+
+        self.cross_rates = cross_rates
+        self.amount_field = amount_field
+        self.from_field = from_field
+        self.to_field = to_field
+        self.default_from = default_from
+        self.default_to = default_to
+        self.output_field = output_field
+        self.chunk_size = chunk_size
+        self.fixed_point = fixed_point
+
+        self.rows = 0
+        self.errors = 0
+
+    def convert_chunk(self, records: List[Dict]) -> List[Dict]:
+        """
+        Mengonversi satu chunk record (record diubah in-place)
+
+        Args:
+            records: Daftar record (dict)
+
+        Returns:
+            Record yang sama dengan kolom output_field terisi, atau
+            None jika amount/mata uang tidak valid atau hasilnya tidak
+            berhingga
+        """
+        if self.fixed_point is not None:
+            return self._convert_chunk_exact(records)
+
+        matrix = self.cross_rates.matrix
+        index = self.cross_rates.index
+        size = self.cross_rates.size
+        errors = 0
+
+        for record in records:
+            try:
+                i = index.get(record.get(self.from_field) or self.default_from)
+                j = index.get(record.get(self.to_field) or self.default_to)
+                amount = float(record.get(self.amount_field))
+            except (TypeError, ValueError):
+                # Mata uang unhashable (misalnya list JSON) atau amount bukan angka
+                i = j = None
+
+            result = None
+            if i is not None and j is not None:
+                result = amount * matrix[i * size + j]
+                # "nan"/"inf" lolos float() dan hasil bisa overflow; keduanya
+                # tidak bisa ditulis sebagai JSON yang valid
+                if not math.isfinite(result):
+                    result = None
+
+            record[self.output_field] = result
+            if result is None:
+                errors += 1
+
+        self.errors += errors
+        self.rows += len(records)
+        return records
+
+    def _convert_chunk_exact(self, records: List[Dict]) -> List[Dict]:
+        """convert_chunk dengan engine fixed-point (hasil string Decimal)"""
+        engine = self.fixed_point
+        errors = 0
+
+        for record in records:
+            try:
+                result = engine.convert(record.get(self.amount_field),
+                                        record.get(self.from_field) or self.default_from,
+                                        record.get(self.to_field) or self.default_to)
+            except (TypeError, ValueError):
+                result = None
+
+            # String agar presisi tetap utuh di CSV maupun JSON
+            record[self.output_field] = None if result is None else str(result)
+            if result is None:
+                errors += 1
+
+        self.errors += errors
+        self.rows += len(records)
+        return records
+
+    def iter_chunks(self, records: Iterable[Dict]) -> Iterator[List[Dict]]:
+        """
+        Membagi aliran record menjadi chunk yang sudah dikonversi
+
+        Args:
+            records: Iterable record (dict)
+
+        Yields:
+            Daftar record hasil konversi per chunk
+        """
+        iterator = iter(records)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield self.convert_chunk(chunk)
+
+    def run_csv(self, infile: TextIO, outfile: TextIO) -> Tuple[int, int]:
+        """
+        Mengonversi file CSV (dengan header) secara streaming
+
+        Args:
+            infile: File input CSV
+            outfile: File output CSV
+
+        Returns:
+            Tuple (jumlah baris, jumlah baris gagal)
+        """
+        reader = csv.DictReader(infile)
+        fieldnames = list(reader.fieldnames or [])
+        if self.output_field not in fieldnames:
+            fieldnames.append(self.output_field)
+
+        writer = csv.DictWriter(outfile, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        for chunk in self.iter_chunks(reader):
+            # DictWriter menulis None (konversi gagal) sebagai sel kosong
+            writer.writerows(chunk)
+        return self.rows, self.errors
+
+    def iter_jsonl_records(self, lines: Iterable[str]) -> Iterator[Dict]:
+        """
+        Parsing baris JSONL menjadi record
+
+        Baris yang bukan object JSON valid (termasuk yang memuat NaN atau
+        Infinity) tidak ditulis ke output, tetapi
+        dihitung sebagai baris gagal (sama seperti baris CSV yang tidak
+        valid), sehingga run tetap berlanjut.
+
+        Args:
+            lines: Iterable baris JSONL
+
+        Yields:
+            Record (dict) dari baris yang valid
+        """
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line, parse_constant=_reject_constant)
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                yield record
+            else:
+                self.rows += 1
+                self.errors += 1
+
+    def run_jsonl(self, infile: TextIO, outfile: TextIO) -> Tuple[int, int]:
+        """
+        Mengonversi file JSONL (satu object JSON per baris) secara streaming
+
+        Baris yang bukan object JSON dilewati dan dihitung sebagai gagal.
+
+        Args:
+            infile: File input JSONL
+            outfile: File output JSONL
+
+        Returns:
+            Tuple (jumlah baris, jumlah baris gagal)
+        """
+        records = self.iter_jsonl_records(infile)
+        for chunk in self.iter_chunks(records):
+            outfile.writelines(json.dumps(record) + '\n' for record in chunk)
+        return self.rows, self.errors
@@ -0,0 +1,335 @@
+# ============================================================
+# FILE: models/binary_snapshot.py
+# ============================================================
+"""
+Format biner ringkas untuk snapshot data kurs
+
+Layout (little-endian):
+
+    header   40 byte   magic 'RSNP', versi format, encoding, rate_digits,
+                       versi snapshot, timestamp, jumlah mata uang,
+                       panjang blok nama, panjang blok meta, CRC32
+    nama     ASCII     base currency lalu kode mata uang, dipisah '\\n'
+    meta     UTF-8     objek JSON opsional (etag, last_modified, ...)
+    padding            sampai kelipatan 8 byte
+    vektor   8 byte/kode  float64, atau int64 kurs * 10**rate_digits
+
+CRC32 menghitung semua byte setelah header. Vektor dibaca tanpa salinan
+lewat memoryview.cast di atas bytes, bytearray maupun mmap.
+"""
+import json
+import mmap
+import struct
+import sys
+import time
+import zlib
+from array import array
+from typing import Optional, Dict, Any, List, Union
+
+MAGIC = b'RSNP'
+FORMAT_VERSION = 1
+FLOAT64 = 0
+INT64 = 1
+ENCODINGS = {'float64': FLOAT64, 'int64': INT64}
+
+# Sama dengan RATE_DIGITS engine fixed-point (tidak di-import agar modul
+# ini tidak memuat decimal saat hanya membaca cache)
+DEFAULT_RATE_DIGITS = 12
+
+HEADER = struct.Struct('<4sHBBQdIIII')
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+def encode(rates: Dict[str, float], base_currency: str, version: int = 0,
+           timestamp: Optional[float] = None, encoding: str = 'float64',
+           rate_digits: int = DEFAULT_RATE_DIGITS,
+           meta: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Mengubah data kurs menjadi snapshot biner
+
+    Args:
+        rates: Data kurs relatif terhadap base currency
+        base_currency: Base currency data kurs
+        version: Nomor versi snapshot
+        timestamp: Waktu pengambilan data (epoch detik, default sekarang)
+        encoding: 'float64' atau 'int64' (kurs terskala, eksak untuk engine
+                  fixed-point)
+        rate_digits: Jumlah digit desimal kurs terskala untuk 'int64'
+        meta: Data tambahan kecil yang ikut disimpan sebagai JSON
+
+    Returns:
+        Bytes snapshot biner
+
+    Raises:
+        ValueError: Jika encoding tidak dikenal, kode bukan ASCII, atau
+                    kurs terskala tidak muat di int64
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Encoding snapshot tidak dikenal: {encoding}")
+    codes = list(rates)
+    names = '\n'.join([base_currency] + codes).encode('ascii')
+    meta_bytes = json.dumps(meta).encode('utf-8') if meta else b''
+
+    if ENCODINGS[encoding] == FLOAT64:
+        vector = array('d', (float(rates[code] or 0.0) for code in codes))
+    else:
+        from decimal import Decimal, ROUND_HALF_EVEN
+        # Pembulatan sama dengan FixedPointConverter: repr float lalu skala
+        try:
+            vector = array('q', (
+                int(Decimal(repr(float(rates[code] or 0.0))).scaleb(rate_digits)
+                    .to_integral_value(ROUND_HALF_EVEN))
+                for code in codes
+            ))
+        except OverflowError:
+            raise ValueError("Kurs terlalu besar untuk int64; pakai encoding float64") from None
+    if sys.byteorder != 'little':
+        vector.byteswap()
+
+    body = names + meta_bytes + bytes(_padding(HEADER.size + len(names) + len(meta_bytes)))
+    body += vector.tobytes()
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, ENCODINGS[encoding], rate_digits, version,
+                         time.time() if timestamp is None else timestamp,
+                         len(codes), len(names), len(meta_bytes), zlib.crc32(body))
+    return header + body
+
+
+def encode_snapshot(snapshot, encoding: str = 'float64',
+                    meta: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Mengubah RateSnapshot menjadi snapshot biner
+
+    Args:
+        snapshot: RateSnapshot sumber
+        encoding: 'float64' atau 'int64'
+        meta: Data tambahan yang ikut disimpan
+
+    Returns:
+        Bytes snapshot biner
+    """
+    return encode(snapshot.rates, snapshot.base_currency, snapshot.version,
+                  snapshot.timestamp, encoding, meta=meta)
+
+
+class BinarySnapshot:
+    """
+    Class pembaca snapshot biner tanpa menyalin vektor kurs
+
+    Hanya header yang di-parse saat dibuat; daftar kode dan index baru
+    dibangun saat pertama diakses. `values` adalah memoryview yang
+    langsung menunjuk buffer sumber.
+    """
+
+    def __init__(self, buffer: Buffer, verify: bool = True):
+        """
+        Membaca snapshot dari buffer
+
+        Args:
+            buffer: bytes/bytearray/memoryview/mmap berisi snapshot
+            verify: False untuk melewati pemeriksaan CRC32
+
+        Raises:
+            ValueError: Jika format, ukuran atau checksum tidak valid
+        """
+        view = memoryview(buffer).cast('B')
+        if len(view) < HEADER.size:
+            raise ValueError("Snapshot biner terlalu pendek")
+        (magic, format_version, encoding, rate_digits, version, timestamp,
+         count, names_len, meta_len, crc) = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError("Bukan snapshot biner kurs")
+        if format_version != FORMAT_VERSION:
+            raise ValueError(f"Versi format snapshot tidak didukung: {format_version}")
+        if encoding not in (FLOAT64, INT64):
+            raise ValueError(f"Encoding snapshot tidak dikenal: {encoding}")
+
+        meta_start = HEADER.size + names_len
+        vector_start = meta_start + meta_len + _padding(meta_start + meta_len)
+        end = vector_start + count * 8
+        if len(view) < end:
+            raise ValueError("Snapshot biner terpotong")
+        if verify and zlib.crc32(view[HEADER.size:end]) != crc:
+            raise ValueError("Checksum snapshot biner tidak cocok")
+
+        names = bytes(view[HEADER.size:meta_start])
+        base_end = names.find(b'\n')
+        if names.count(b'\n') != count or (count and base_end < 0):
+            raise ValueError("Daftar kode snapshot biner tidak valid")
+
+        self.base_currency = (names[:base_end] if count else names).decode('ascii')
+        self._names = names[base_end + 1:] if count else b''
+        self._codes: Optional[List[str]] = None
+        self._index: Optional[Dict[str, int]] = None
+        self.version = version
+        self.timestamp = timestamp
+        self.encoding = 'float64' if encoding == FLOAT64 else 'int64'
+        self.rate_digits = rate_digits
+        self.meta: Dict[str, Any] = (json.loads(bytes(view[meta_start:meta_start + meta_len]))
+                                     if meta_len else {})
+
+        values = view[vector_start:end]
+        if sys.byteorder != 'little':
+            # Host big-endian: satu salinan yang dibalik urutan byte-nya
+            swapped = array('d' if encoding == FLOAT64 else 'q', values.tobytes())
+            swapped.byteswap()
+            values = memoryview(swapped)
+        self.values = values.cast('d' if encoding == FLOAT64 else 'q')
+        self._mmap: Optional[mmap.mmap] = None
+
+    @property
+    def codes(self) -> List[str]:
+        """Kode mata uang sesuai urutan vektor"""
+        if self._codes is None:
+            self._codes = self._names.decode('ascii').split('\n') if self._names else []
+        return self._codes
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Kode mata uang -> posisi di vektor"""
+        if self._index is None:
+            self._index = {code: i for i, code in enumerate(self.codes)}
+        return self._index
+
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'BinarySnapshot':
+        """
+        Membuka file snapshot biner lewat mmap (tanpa membaca seluruh file)
+
+        Args:
+            path: Path file snapshot
+            verify: False untuk melewati pemeriksaan CRC32
+
+        Returns:
+            BinarySnapshot; panggil close() untuk melepas mmap
+
+        Raises:
+            OSError: Jika file tidak bisa dibuka
+            ValueError: Jika isi file tidak valid
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            snapshot = cls(mapped, verify)
+        except BaseException:
+            mapped.close()
+            raise
+        snapshot._mmap = mapped
+        return snapshot
+
+    def close(self):
+        """Melepas view vektor dan mmap (jika dibuka dengan load())"""
+        self.values.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'BinarySnapshot':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return (f"BinarySnapshot(base={self.base_currency!r}, version={self.version}, "
+                f"currencies={len(self.codes)}, encoding={self.encoding!r})")
+
+    def rate(self, code: str) -> Optional[float]:
+        """
+        Kurs satu mata uang relatif terhadap base currency
+
+        Args:
+            code: Kode mata uang
+
+        Returns:
+            Kurs (float) atau None jika kode tidak ada
+        """
+        i = self.index.get(code)
+        if i is None:
+            return None
+        value = self.values[i]
+        return value / 10 ** self.rate_digits if self.encoding == 'int64' else value
+
+    def rates(self) -> Dict[str, float]:
+        """Data kurs sebagai dict kode -> float"""
+        if self.encoding == 'int64':
+            scale = 10 ** self.rate_digits
+            return {code: value / scale for code, value in zip(self.codes, self.values)}
+        return dict(zip(self.codes, self.values))
+
+    def scaled_rates(self) -> Dict[str, int]:
+        """
+        Data kurs terskala integer (hanya encoding int64)
+
+        Raises:
+            ValueError: Jika encoding snapshot float64
+        """
+        if self.encoding != 'int64':
+            raise ValueError("Snapshot float64 tidak menyimpan kurs terskala")
+        return dict(zip(self.codes, self.values))
+
+    def to_snapshot(self, registry=None, cross_rate_codes=None):
+        """
+        Membangun RateSnapshot dari snapshot biner
+
+        Nomor versi RateSnapshot diberikan ulang oleh proses ini; versi
+        asal tetap tersedia di atribut `version` objek ini.
+
+        Args:
+            registry: Registry mata uang (default REGISTRY)
+            cross_rate_codes: Mata uang untuk matriks cross-rate
+
+        Returns:
+            RateSnapshot
+        """
+        from .rate_snapshot import RateSnapshot
+        return RateSnapshot(self.rates(), self.base_currency, self.timestamp,
+                            registry, cross_rate_codes)
+
+    def to_json(self) -> str:
+        """
+        Jembatan ke JSON: objek dengan base, version, timestamp, rates dan meta
+
+        Returns:
+            String JSON
+        """
+        return json.dumps({
+            'base': self.base_currency,
+            'version': self.version,
+            'timestamp': self.timestamp,
+            'rates': self.rates(),
+            'meta': self.meta,
+        })
+
+
+def from_json(text: Union[str, bytes], encoding: str = 'float64') -> bytes:
+    """
+    Jembatan dari JSON ke snapshot biner
+
+    Menerima output to_json() maupun payload API kurs (`base`, `rates`,
+    dan `time_last_updated` opsional).
+
+    Args:
+        text: Dokumen JSON
+        encoding: 'float64' atau 'int64'
+
+    Returns:
+        Bytes snapshot biner
+
+    Raises:
+        ValueError: Jika JSON tidak berisi base dan rates
+    """
+    document = json.loads(text)
+    if not isinstance(document, dict) or 'rates' not in document or 'base' not in document:
+        raise ValueError("JSON kurs harus berisi 'base' dan 'rates'")
+    timestamp = document.get('timestamp', document.get('time_last_updated'))
+    return encode(document['rates'], document['base'], int(document.get('version', 0)),
+                  None if timestamp is None else float(timestamp), encoding,
+                  meta=document.get('meta') or None)
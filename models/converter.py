@@ -2,49 +2,442 @@
 # FILE: models/converter.py
 # ============================================================
 """Model untuk konversi mata uang"""
-import requests
+import time
+from array import array
 from datetime import datetime
-from typing import Optional, Dict
+from decimal import Decimal
+from itertools import repeat
+from operator import eq
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Sequence, Tuple, Union
+
+import requests
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, hanya untuk konversi batch
+    np = None
+
+from utils.constants import CONVERSION_CONFIG
+from utils.metrics import METRICS
+from utils.registry import CurrencyRegistry, REGISTRY
+from .binary_snapshot import BinarySnapshot, encode_snapshot
+from .cross_rates import CrossRateMatrix
+from .fixed_point import FixedPointConverter
+from .hedged_source import default_source
+from .rate_cache import RateCache
+from .rate_graph import RateGraph
+from .rate_history import RateHistory, Timestamp
+from .rate_snapshot import RateSnapshot
+from .rate_source import RateSource, RateSourceError
+from .single_flight import FETCHES, SHARED_RATES
+
+# Metrik model (objek dibuat sekali agar pencatatan tidak perlu lookup)
+_FETCH_TOTAL = METRICS.counter('fetch_total', 'Jumlah pemanggilan fetch_rates')
+_FETCH_FAILURES = METRICS.counter('fetch_failures_total', 'Jumlah fetch_rates yang gagal')
+_FETCH_CACHE_HITS = METRICS.counter('fetch_cache_hits_total', 'Fetch yang dilayani cache lokal')
+_FETCH_NOT_MODIFIED = METRICS.counter('fetch_not_modified_total', 'Respons 304 dari sumber')
+_FETCH_SHARED = METRICS.counter('fetch_shared_total',
+                                'Fetch yang memakai hasil fetch converter lain')
+_FETCH_SECONDS = METRICS.histogram('fetch_seconds', 'Durasi fetch_rates')
+_FETCH_LAST_SUCCESS = METRICS.gauge('fetch_last_success_timestamp',
+                                    'Epoch detik fetch sukses terakhir')
+_CONVERSIONS = METRICS.counter('conversions_total', 'Jumlah konversi tunggal')
+_BATCH_ROWS = METRICS.counter('batch_rows_total', 'Jumlah baris konversi batch')
+
+# Deret kode (str) atau ID (int) mata uang untuk konversi batch
+CurrencyKeys = Sequence[Union[str, int]]
 
 
 class CurrencyConverter:
     """Class untuk menangani konversi mata uang"""
     
-    def __init__(self, base_currency: str = 'USD'):
+    def __init__(self, base_currency: str = 'USD', cache: Optional[RateCache] = None,
+                 use_cache: bool = True, cross_rate_codes: Optional[Sequence[str]] = None,
+                 registry: Optional[CurrencyRegistry] = None,
+                 history: Optional[RateHistory] = None,
+                 engine: Optional[str] = None,
+                 source: Optional[RateSource] = None,
+                 single_flight: bool = True):
         """
         Inisialisasi converter
         
         Args:
             base_currency: Mata uang dasar untuk konversi
+            cache: Cache data kurs di disk (default RateCache dari CACHE_CONFIG)
+            use_cache: False untuk selalu mengambil data dari API
+            cross_rate_codes: Mata uang untuk matriks cross-rate (default
+                              semua mata uang dari API)
+            registry: Registry mata uang untuk ID integer (default REGISTRY)
+            history: Store riwayat kurs; setiap data baru dari API dicatat
+            engine: 'float' atau 'fixed' (default dari CONVERSION_CONFIG)
+            source: Sumber data kurs (default dari PROVIDER_CONFIG; lebih dari
+                    satu provider memakai HedgedRateSource)
+            single_flight: False untuk selalu fetch sendiri tanpa berbagi
+                           request dan snapshot dengan converter lain
         """
-        self.rates: Dict[str, float] = {}
         self.base_currency = base_currency
         self.last_update: Optional[datetime] = None
-        self.api_url = f'https://api.exchangerate-api.com/v4/latest/{base_currency}'
+        
+        # Sumber data kurs dan validator untuk conditional GET
+        self.source = source if source is not None else default_source()
+        # Sumber selain provider default memakai file cache sendiri
+        self._cache_source = None if source is None else self.source.flight_key
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.single_flight = single_flight
+        
+        self.cache: Optional[RateCache] = None
+        if use_cache:
+            self.cache = cache if cache is not None else RateCache()
+        self.history = history
+        
+        # Registry mata uang untuk ID integer (index vektor kurs)
+        self.registry = registry if registry is not None else REGISTRY
+        
+        # Mata uang untuk matriks cross-rate di setiap snapshot
+        self.cross_rate_codes = cross_rate_codes
+        
+        # Engine konversi; engine fixed-point dibangun saat pertama dipakai
+        self.engine = engine or CONVERSION_CONFIG['engine']
+        if self.engine not in ('float', 'fixed'):
+            raise ValueError(f"Engine konversi tidak dikenal: {self.engine}")
+        self.rounding = CONVERSION_CONFIG['rounding']
+        
+        # Snapshot kurs aktif; hanya diganti utuh oleh _set_rates
+        self.snapshot = RateSnapshot.empty(base_currency, self.registry)
+        
+        # Graf kurs multi-sumber; tabel snapshot aktif diperbarui per versi
+        self.graph = RateGraph()
+        self._graph_version = 0
+    
+    @property
+    def rates(self) -> Mapping[str, float]:
+        """
+        Data kurs snapshot aktif (read-only)
+        
+        Dict milik snapshot dibungkus MappingProxyType: mengubahnya
+        langsung akan melewati versi snapshot yang dipakai untuk
+        mendeteksi perubahan kurs.
+        """
+        return MappingProxyType(self.snapshot.rates)
+    
+    @property
+    def rates_version(self) -> int:
+        """Versi snapshot aktif (0 jika belum ada data)"""
+        return self.snapshot.version
+    
+    @property
+    def currency_codes(self) -> Sequence[str]:
+        """Kode mata uang sesuai ID vektor kurs"""
+        return self.snapshot.codes
+    
+    @property
+    def currency_index(self) -> Dict[str, int]:
+        """Kode mata uang -> ID vektor kurs"""
+        return self.snapshot.index
+    
+    @property
+    def cross_rates(self) -> Optional[CrossRateMatrix]:
+        """Matriks cross-rate snapshot aktif"""
+        return self.snapshot.cross_rates
+    
+    @property
+    def api_url(self) -> Optional[str]:
+        """URL API sumber data kurs (None jika sumber bukan HTTP)"""
+        url_for = getattr(self.source, 'url_for', None)
+        if url_for is not None:
+            return url_for(self.base_currency)
+        return None
+    
+    def close(self):
+        """Menutup sumber data kurs (termasuk HTTP session)"""
+        self.source.close()
+    
+    def fetch_rates(self, force_refresh: bool = False) -> bool:
+        """
+        Mengambil data kurs dari cache lokal atau sumber data kurs
+        
+        Jika data sebelumnya punya ETag/Last-Modified, request dikirim
+        sebagai conditional GET; respons 304 mempertahankan self.rates
+        tanpa parsing ulang.
+        
+        Args:
+            force_refresh: True untuk mengabaikan cache yang masih berlaku
+        
+        Returns:
+            True jika berhasil, False jika gagal
+        """
+        if not METRICS.enabled:
+            return self._fetch_rates(force_refresh)
+        
+        start = time.perf_counter()
+        success = self._fetch_rates(force_refresh)
+        _FETCH_SECONDS.observe(time.perf_counter() - start)
+        _FETCH_TOTAL.inc()
+        if success:
+            _FETCH_LAST_SUCCESS.set(time.time())
+        else:
+            _FETCH_FAILURES.inc()
+        return success
+    
+    def _fetch_rates(self, force_refresh: bool) -> bool:
+        """Implementasi fetch_rates tanpa instrumentasi"""
+        if not self.single_flight:
+            if not force_refresh and self._load_from_cache():
+                if METRICS.enabled:
+                    _FETCH_CACHE_HITS.inc()
+                return True
+            return self._fetch_from_source()
+        
+        # Snapshot yang masih berlaku milik converter lain dipakai langsung
+        key = self._flight_key()
+        if not force_refresh and self.cache is not None:
+            entry = SHARED_RATES.get(key)
+            if entry is not None and self.cache.is_fresh(entry):
+                self._adopt_shared(entry)
+                if METRICS.enabled:
+                    _FETCH_SHARED.inc()
+                return True
+            if self._load_from_cache():
+                if METRICS.enabled:
+                    _FETCH_CACHE_HITS.inc()
+                return True
+        
+        # Fetch yang sedang berjalan untuk sumber dan base yang sama
+        # ditunggu hasilnya, bukan dikirim ulang
+        entry, shared = FETCHES.do(key, self._fetch_and_publish)
+        if entry is None:
+            return False
+        if shared:
+            self._adopt_shared(entry)
+            if METRICS.enabled:
+                _FETCH_SHARED.inc()
+        return True
     
-    def fetch_rates(self) -> bool:
+    def _fetch_from_source(self) -> bool:
         """
-        Mengambil data kurs dari API
+        Mengambil data kurs dari sumber data kurs (conditional GET jika bisa)
         
         Returns:
             True jika berhasil, False jika gagal
         """
+        # Entry cache kedaluwarsa tetap berguna untuk revalidasi
+        stale_entry = None
+        if not self.rates and self.cache is not None:
+            stale_entry = self.cache.load(self.base_currency, self._cache_source)
+            if stale_entry is not None:
+                self.etag = stale_entry.get('etag')
+                self.last_modified = stale_entry.get('last_modified')
+        
+        # Tanpa data yang bisa dipertahankan, 304 tidak berguna
+        revalidate = bool(self.rates) or stale_entry is not None
+        
         try:
-            response = requests.get(self.api_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            result = self.source.fetch(
+                self.base_currency,
+                etag=self.etag if revalidate else None,
+                last_modified=self.last_modified if revalidate else None
+            )
+            
+            if result.not_modified:
+                if METRICS.enabled:
+                    _FETCH_NOT_MODIFIED.inc()
+                if not self.rates:
+                    self._set_rates(stale_entry['rates'], stale_entry['timestamp'])
+            else:
+                self._set_rates(result.rates)
+                self.etag = result.etag
+                self.last_modified = result.last_modified
             
-            self.rates = data['rates']
             self.last_update = datetime.now()
+            
+            # Respons 304 berarti snapshot yang sama, tidak dicatat ulang
+            if not result.not_modified:
+                self._record_history()
+            
+            if self.cache is not None:
+                self.cache.save(self.base_currency, self.snapshot.rates,
+                                self.last_update.timestamp(),
+                                etag=self.etag,
+                                last_modified=self.last_modified,
+                                source=self._cache_source)
             return True
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, RateSourceError) as e:
             print(f"Error fetching rates: {e}")
             return False
         except Exception as e:
             print(f"Unexpected error: {e}")
             return False
     
+    def _record_history(self):
+        """
+        Mencatat snapshot aktif ke store riwayat (jika ada)
+        
+        Kegagalan riwayat (misalnya jam mundur atau kapasitas penuh) hanya
+        dicatat di log; data kurs yang sudah terpasang tetap dipakai.
+        """
+        if self.history is None:
+            return
+        try:
+            self.history.append(self.snapshot.rates, self.last_update)
+        except (ValueError, OSError) as e:
+            print(f"Error recording rate history: {e}")
+    
+    def _flight_key(self) -> Tuple:
+        """Key berbagi fetch: sumber data kurs dan base currency"""
+        return (self.source.flight_key, self.base_currency)
+    
+    def _fetch_and_publish(self) -> Optional[Dict[str, object]]:
+        """
+        Fetch dari sumber lalu mempublikasikan hasilnya ke SHARED_RATES
+        
+        Returns:
+            Entry yang dipublikasikan, atau None jika fetch gagal
+        """
+        if not self._fetch_from_source():
+            return None
+        return self._publish()
+    
+    def _publish(self) -> Dict[str, object]:
+        """Mempublikasikan snapshot aktif untuk converter lain dalam proses ini"""
+        entry = {
+            'snapshot': self.snapshot,
+            'timestamp': self.last_update.timestamp(),
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'registry': self.registry,
+            'cross_rate_codes': self.cross_rate_codes,
+            'cache_path': (self.cache.path_for(self.base_currency, source=self._cache_source)
+                           if self.cache is not None else None),
+        }
+        SHARED_RATES.publish(self._flight_key(), entry)
+        return entry
+    
+    def _adopt_shared(self, entry: Dict[str, object]):
+        """
+        Memakai data kurs hasil fetch converter lain
+        
+        Objek snapshot dipakai bersama jika registry dan mata uang
+        cross-rate-nya sama; jika tidak, snapshot diturunkan dari kursnya.
+        
+        Args:
+            entry: Entry dari SHARED_RATES
+        """
+        previous = self.snapshot
+        snapshot = entry['snapshot']
+        if (entry['registry'] is self.registry
+                and entry['cross_rate_codes'] == self.cross_rate_codes):
+            self.snapshot = snapshot
+        elif snapshot is not previous:
+            self._set_rates(snapshot.rates, snapshot.timestamp)
+        self.etag = entry['etag']
+        self.last_modified = entry['last_modified']
+        self.last_update = datetime.fromtimestamp(entry['timestamp'])
+        
+        if self.snapshot.rates != previous.rates:
+            self._record_history()
+        
+        # File cache yang sama sudah ditulis converter asal entry
+        if (self.cache is not None
+                and entry['cache_path'] != self.cache.path_for(self.base_currency,
+                                                               source=self._cache_source)):
+            self.cache.save(self.base_currency, self.snapshot.rates, entry['timestamp'],
+                            etag=self.etag, last_modified=self.last_modified,
+                            source=self._cache_source)
+    
+    def _load_from_cache(self) -> bool:
+        """
+        Memuat data kurs dari cache jika masih berlaku
+        
+        Returns:
+            True jika data kurs diambil dari cache
+        """
+        if self.cache is None:
+            return False
+        
+        entry = self.cache.load_fresh(self.base_currency, self._cache_source)
+        if entry is None:
+            return False
+        
+        self._set_rates(entry['rates'], entry['timestamp'])
+        self.etag = entry.get('etag')
+        self.last_modified = entry.get('last_modified')
+        self.last_update = datetime.fromtimestamp(entry['timestamp'])
+        if self.single_flight:
+            self._publish()
+        return True
+    
+    def export_snapshot(self, encoding: str = 'float64') -> Optional[bytes]:
+        """
+        Snapshot kurs aktif dalam format biner (untuk proses/host lain)
+        
+        Args:
+            encoding: 'float64' atau 'int64'
+            
+        Returns:
+            Bytes snapshot biner atau None jika belum ada data
+        """
+        snapshot = self.snapshot
+        if not snapshot.rates:
+            return None
+        return encode_snapshot(snapshot, encoding)
+    
+    def import_snapshot(self, data) -> bool:
+        """
+        Memasang data kurs dari snapshot biner (tanpa parsing JSON)
+        
+        Args:
+            data: bytes/bytearray/memoryview/mmap hasil export_snapshot()
+            
+        Returns:
+            True jika berhasil, False jika data tidak valid atau base
+            currency berbeda
+        """
+        try:
+            binary = BinarySnapshot(data)
+        except ValueError as e:
+            print(f"Error reading snapshot: {e}")
+            return False
+        if binary.base_currency != self.base_currency or not len(binary):
+            return False
+        self._set_rates(binary.rates(), binary.timestamp)
+        self.last_update = datetime.fromtimestamp(binary.timestamp)
+        return True
+    
+    def _set_rates(self, rates: Dict[str, float], timestamp: Optional[float] = None):
+        """
+        Mempublikasikan data kurs baru sebagai snapshot immutable
+        
+        Snapshot dibangun lengkap dulu lalu dipasang dengan satu
+        penggantian referensi, sehingga pembaca di thread lain tidak
+        pernah melihat data setengah diperbarui. Untuk base currency yang
+        sama, snapshot baru diturunkan dari snapshot aktif dan hanya
+        bagian milik mata uang yang berubah yang dihitung ulang.
+        
+        Args:
+            rates: Data kurs relatif terhadap base currency
+            timestamp: Waktu pengambilan data (epoch detik, default sekarang)
+        """
+        current = self.snapshot
+        if current.rates and current.base_currency == self.base_currency:
+            self.snapshot = current.with_rates(rates, timestamp, self.cross_rate_codes)
+        else:
+            self.snapshot = RateSnapshot(rates, self.base_currency, timestamp,
+                                         self.registry, self.cross_rate_codes)
+    
+    def currency_id(self, code: str) -> Optional[int]:
+        """
+        Mendapatkan ID integer sebuah kode mata uang
+        
+        Args:
+            code: Kode mata uang
+            
+        Returns:
+            ID mata uang di registry (index vektor kurs) atau None
+        """
+        return self.currency_index.get(code)
+    
     def convert(self, amount: float, from_currency: str, to_currency: str) -> Optional[float]:
         """
         Konversi mata uang
@@ -57,20 +450,36 @@ class CurrencyConverter:
         Returns:
             Hasil konversi atau None jika error
         """
-        if not self.rates:
+        snapshot = self.snapshot
+        if not snapshot.rates:
             return None
         
+        if METRICS.enabled:
+            _CONVERSIONS.tick()
+        
+        if self.engine == 'fixed':
+            result = self.convert_exact(amount, from_currency, to_currency)
+            return None if result is None else float(result)
+        
         try:
             amount = float(amount)
             
+            # Sama dengan cross_rates.rate(), di-inline karena ini jalur terpanas
+            cross_rates = snapshot.cross_rates
+            i = cross_rates.index.get(from_currency)
+            j = cross_rates.index.get(to_currency)
+            if i is not None and j is not None:
+                return amount * cross_rates.matrix[i * cross_rates.size + j]
+            
+            rates = snapshot.rates
             if from_currency == self.base_currency:
-                result = amount * self.rates[to_currency]
+                result = amount * rates[to_currency]
             elif to_currency == self.base_currency:
-                result = amount / self.rates[from_currency]
+                result = amount / rates[from_currency]
             else:
                 # Konversi ke base currency dulu, baru ke target
-                base_amount = amount / self.rates[from_currency]
-                result = base_amount * self.rates[to_currency]
+                base_amount = amount / rates[from_currency]
+                result = base_amount * rates[to_currency]
                 
             return result
             
@@ -78,30 +487,137 @@ class CurrencyConverter:
             print(f"Conversion error: {e}")
             return None
     
-    def get_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+    @property
+    def fixed_point(self) -> Optional[FixedPointConverter]:
+        """Engine fixed-point untuk data kurs saat ini (None jika belum ada data)"""
+        return self.snapshot.fixed_point(self.rounding)
+    
+    def convert_exact(self, amount, from_currency: str, to_currency: str,
+                      rounding: Optional[str] = None) -> Optional[Decimal]:
+        """
+        Konversi eksak dengan engine fixed-point
+        
+        Args:
+            amount: Jumlah uang (string/int/float/Decimal)
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+            rounding: Mode pembulatan decimal (default CONVERSION_CONFIG)
+            
+        Returns:
+            Decimal dengan digit minor unit mata uang tujuan atau None
+        """
+        engine = self.fixed_point
+        if engine is None:
+            return None
+        
+        try:
+            return engine.convert(amount, from_currency, to_currency, rounding)
+        except ValueError as e:
+            print(f"Conversion error: {e}")
+            return None
+    
+    def rebase(self, base_currency: str) -> Optional[RateSnapshot]:
+        """
+        Data kurs relatif terhadap base currency lain tanpa fetch ulang
+        
+        Diturunkan dari snapshot aktif dan di-cache per base sampai
+        refresh berikutnya.
+        
+        Args:
+            base_currency: Kode base currency yang diinginkan
+            
+        Returns:
+            RateSnapshot dengan base tersebut (atribut `rates` berisi tabel
+            kurs lengkap) atau None jika base tidak tersedia
+        """
+        snapshot = self.snapshot
+        if not snapshot.rates:
+            return None
+        return snapshot.rebase(base_currency)
+    
+    def rate_graph(self) -> RateGraph:
+        """
+        Graf kurs dengan tabel snapshot aktif sebagai sumber 'snapshot'
+        
+        Tabel dari provider lain atau kurs langsung bisa ditambahkan ke
+        graf ini (add_table/add_quote/load_source) dan tetap dipakai
+        setelah refresh.
+        
+        Returns:
+            RateGraph milik converter
+        """
+        snapshot = self.snapshot
+        if snapshot.version != self._graph_version:
+            self.graph.add_table(snapshot.base_currency, snapshot.rates, 'snapshot')
+            self._graph_version = snapshot.version
+        return self.graph
+    
+    def convert_best(self, amount: float, from_currency: str,
+                     to_currency: str) -> Optional[float]:
+        """
+        Konversi lewat jalur terbaik di graf kurs (termasuk spread dan fee)
+        
+        Args:
+            amount: Jumlah uang yang akan dikonversi
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+            
+        Returns:
+            Jumlah uang hasil konversi atau None jika tidak ada jalur
+        """
+        return self.rate_graph().convert(amount, from_currency, to_currency)
+    
+    def get_rate(self, from_currency: str, to_currency: str,
+                 as_of: Optional[Timestamp] = None) -> Optional[float]:
         """
         Mendapatkan rate antara dua mata uang
         
         Args:
             from_currency: Kode mata uang asal
             to_currency: Kode mata uang tujuan
+            as_of: Waktu historis (datetime/epoch); butuh store riwayat
             
         Returns:
             Nilai tukar atau None jika error
         """
-        if not self.rates:
+        if as_of is not None:
+            if self.history is None:
+                return None
+            return self.history.get_rate(from_currency, to_currency, as_of)
+        
+        return self.snapshot.rate(from_currency, to_currency)
+    
+    def get_rates_from(self, from_currency: str, amount: float = 1.0) -> Optional[Dict[str, float]]:
+        """
+        Konversi dari satu mata uang ke semua mata uang di matriks cross-rate
+        
+        Args:
+            from_currency: Kode mata uang asal
+            amount: Jumlah uang yang dikonversi
+            
+        Returns:
+            Dict kode tujuan -> hasil konversi atau None
+        """
+        cross_rates = self.snapshot.cross_rates
+        if cross_rates is None:
             return None
+        return cross_rates.convert_row(amount, from_currency)
+    
+    def get_rates_to(self, to_currency: str, amount: float = 1.0) -> Optional[Dict[str, float]]:
+        """
+        Konversi dari semua mata uang di matriks cross-rate ke satu mata uang
         
-        try:
-            if from_currency == self.base_currency:
-                return self.rates[to_currency]
-            elif to_currency == self.base_currency:
-                return 1 / self.rates[from_currency]
-            else:
-                return self.rates[to_currency] / self.rates[from_currency]
-                
-        except (KeyError, ZeroDivisionError):
+        Args:
+            to_currency: Kode mata uang tujuan
+            amount: Jumlah uang dalam setiap mata uang asal
+            
+        Returns:
+            Dict kode asal -> hasil konversi atau None
+        """
+        cross_rates = self.snapshot.cross_rates
+        if cross_rates is None:
             return None
+        return cross_rates.convert_column(amount, to_currency)
     
     def get_last_update_formatted(self) -> str:
         """
@@ -112,4 +628,123 @@ class CurrencyConverter:
         """
         if self.last_update:
             return self.last_update.strftime('%d/%m/%Y %H:%M:%S')
-        return 'Belum ada data'
\ No newline at end of file
+        return 'Belum ada data'
+    
+    def convert_many(self, amounts: Sequence[float],
+                     from_currencies: Union[CurrencyKeys, str, int],
+                     to_currencies: Union[CurrencyKeys, str, int]) -> Tuple:
+        """
+        Konversi banyak jumlah uang sekaligus dengan mata uang campuran
+        
+        Mata uang boleh berupa kode (str) atau ID integer dari
+        currency_id(). Satu kode/ID tunggal berlaku untuk semua baris.
+        Jika NumPy terpasang, perhitungan dilakukan sebagai satu
+        gather-and-multiply atas vektor kurs dan hasilnya ndarray;
+        tanpa NumPy hasilnya array('d') dan array('b').
+        
+        Args:
+            amounts: Deret jumlah uang (list, array atau ndarray)
+            from_currencies: Mata uang asal per baris
+            to_currencies: Mata uang tujuan per baris
+            
+        Returns:
+            Tuple (hasil, valid): hasil konversi (NaN jika mata uang
+            tidak dikenal) dan mask valid per baris
+        """
+        # Semua baris dihitung dari satu snapshot; slot terakhir vektor
+        # (ID == jumlah mata uang) berisi NaN untuk mata uang tidak dikenal
+        snapshot = self.snapshot
+        vector = snapshot.vector
+        inverse = snapshot.inverse
+        
+        if np is not None:
+            amounts = np.asarray(amounts, dtype=np.float64)
+            n = len(amounts)
+            if METRICS.enabled:
+                _BATCH_ROWS.inc(n)
+            from_ids = self._resolve_ids_np(snapshot, from_currencies, n)
+            to_ids = self._resolve_ids_np(snapshot, to_currencies, n)
+            self._check_batch_shape(n, from_ids, to_ids)
+            
+            results = (amounts
+                       * np.frombuffer(inverse, dtype=np.float64)[from_ids]
+                       * np.frombuffer(vector, dtype=np.float64)[to_ids])
+            return results, ~np.isnan(results)
+        
+        amounts = array('d', amounts)
+        n = len(amounts)
+        if METRICS.enabled:
+            _BATCH_ROWS.inc(n)
+        from_ids = self._resolve_ids(snapshot, from_currencies, n)
+        to_ids = self._resolve_ids(snapshot, to_currencies, n)
+        self._check_batch_shape(n, from_ids, to_ids)
+        
+        results = array('d', [
+            amount * inverse[f] * vector[t]
+            for amount, f, t in zip(amounts, from_ids, to_ids)
+        ])
+        valid = array('b', map(eq, results, results))
+        return results, valid
+    
+    @staticmethod
+    def _check_batch_shape(count: int, from_ids: Sequence[int], to_ids: Sequence[int]):
+        """Memastikan jumlah baris amounts dan mata uang sama"""
+        if len(from_ids) != count or len(to_ids) != count:
+            raise ValueError("Panjang amounts dan daftar mata uang harus sama")
+    
+    @staticmethod
+    def _resolve_ids(snapshot: RateSnapshot, currencies: Union[CurrencyKeys, str, int],
+                     count: int) -> List[int]:
+        """
+        Mengubah kode/ID mata uang menjadi daftar ID vektor kurs
+        
+        Args:
+            snapshot: Snapshot kurs yang dipakai batch
+            currencies: Kode/ID tunggal atau deret kode/ID
+            count: Jumlah baris untuk broadcast nilai tunggal
+            
+        Returns:
+            Daftar ID; mata uang tidak dikenal mendapat ID slot NaN
+        """
+        if isinstance(currencies, (str, int)):
+            currencies = (currencies,) * count
+        
+        lookup = snapshot.id_lookup()
+        return list(map(lookup.get, currencies, repeat(len(snapshot.codes))))
+    
+    @staticmethod
+    def _resolve_ids_np(snapshot: RateSnapshot, currencies, count: int):
+        """
+        Versi NumPy dari _resolve_ids
+        
+        Args:
+            snapshot: Snapshot kurs yang dipakai batch
+            currencies: Kode/ID tunggal atau deret kode/ID
+            count: Jumlah baris untuk broadcast nilai tunggal
+            
+        Returns:
+            ndarray ID (intp); mata uang tidak dikenal mendapat ID slot NaN
+        """
+        size = len(snapshot.codes)
+        lookup = snapshot.id_lookup()
+        
+        if isinstance(currencies, (str, int, np.integer)):
+            key = int(currencies) if isinstance(currencies, np.integer) else currencies
+            return np.full(count, lookup.get(key, size), dtype=np.intp)
+        
+        if isinstance(currencies, np.ndarray):
+            if currencies.dtype.kind in 'iu':
+                ids = np.where((currencies >= 0) & (currencies < size), currencies, size)
+                return ids.astype(np.intp).reshape(-1)
+            if currencies.dtype.kind in 'US':
+                # Lookup hanya untuk kode unik, lalu scatter ke semua baris
+                unique, inverse = np.unique(currencies, return_inverse=True)
+                keys = unique.tolist()
+                if currencies.dtype.kind == 'S':
+                    # str(b'USD') adalah "b'USD'", jadi bytes harus di-decode
+                    keys = [key.decode('ascii', 'replace') for key in keys]
+                unique_ids = np.array([lookup.get(key, size) for key in keys], dtype=np.intp)
+                return unique_ids[inverse.reshape(-1)]
+        
+        return np.fromiter(map(lookup.get, currencies, repeat(size)),
+                           dtype=np.intp, count=len(currencies))
@@ -0,0 +1,191 @@
+# ============================================================
+# FILE: models/cross_rates.py
+# ============================================================
+"""Matriks cross-rate N x N yang dihitung sekali per update kurs"""
+from array import array
+from typing import Optional, Dict, List, Sequence
+
+
+class CrossRateMatrix:
+    """Class untuk menyimpan nilai tukar semua pasangan mata uang"""
+
+    def __init__(self, rates: Dict[str, float], codes: Optional[Sequence[str]] = None):
+        """
+        Membangun matriks dari data kurs relatif terhadap base currency
+
+        Args:
+            rates: Data kurs relatif terhadap base currency
+            codes: Mata uang yang dimasukkan ke matriks (default semua
+                   mata uang di rates)
+        """
+        if codes is None:
+            codes = list(rates)
+        # Hanya mata uang dengan kurs valid yang bisa dipakai membagi
+        self.codes: List[str] = [code for code in codes if rates.get(code)]
+        self.index: Dict[str, int] = {code: i for i, code in enumerate(self.codes)}
+        self.size = len(self.codes)
+
+        vector = [float(rates[code]) for code in self.codes]
+        # Baris i berisi kurs dari mata uang i ke setiap mata uang j:
+        # matrix[i * size + j] = rates[j] / rates[i]
+        matrix = array('d')
+        for i, rate in enumerate(vector):
+            inverse = 1.0 / rate
+            row = array('d', [value * inverse for value in vector])
+            row[i] = 1.0
+            matrix.extend(row)
+        self.matrix = matrix
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.index
+
+    def with_changes(self, rates: Dict[str, float],
+                     changed_codes: Sequence[str]) -> Optional['CrossRateMatrix']:
+        """
+        Membuat matriks baru dengan hanya menghitung ulang baris dan kolom
+        mata uang yang kursnya berubah
+
+        Hasilnya identik dengan CrossRateMatrix(rates, self.codes); matriks
+        ini sendiri tidak diubah.
+
+        Args:
+            rates: Data kurs baru lengkap
+            changed_codes: Kode mata uang yang kursnya berubah
+
+        Returns:
+            Matriks baru, atau None jika susunan mata uang ikut berubah
+            (misalnya kurs menjadi 0) sehingga perlu dibangun ulang penuh
+        """
+        size = self.size
+        index = self.index
+        rows = []
+        for code in changed_codes:
+            i = index.get(code)
+            if i is None or not rates.get(code):
+                return None
+            rows.append(i)
+
+        vector = [float(rates[code]) for code in self.codes]
+        matrix = array('d', self.matrix)
+        if rows:
+            inverses = [1.0 / rate for rate in vector]
+            for i in rows:
+                inverse = inverses[i]
+                matrix[i * size:(i + 1) * size] = array('d', [value * inverse for value in vector])
+                rate = vector[i]
+                matrix[i::size] = array('d', [rate * inverse_k for inverse_k in inverses])
+                matrix[i * size + i] = 1.0
+
+        result = CrossRateMatrix.__new__(CrossRateMatrix)
+        result.codes = self.codes
+        result.index = index
+        result.size = size
+        result.matrix = matrix
+        return result
+
+    @staticmethod
+    def pair_rate(rates: Dict[str, float], from_currency: str,
+                  to_currency: str) -> Optional[float]:
+        """
+        Menghitung satu nilai tukar persis seperti elemen matriks
+
+        Dipakai jalur yang hanya butuh satu pasangan (misalnya CLI) agar
+        hasilnya sama dengan konversi lewat matriks tanpa membangunnya.
+
+        Args:
+            rates: Data kurs relatif terhadap base currency
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            Nilai tukar atau None jika salah satu kurs tidak valid
+        """
+        from_rate = rates.get(from_currency)
+        to_rate = rates.get(to_currency)
+        if not from_rate or not to_rate:
+            return None
+        if from_currency == to_currency:
+            return 1.0
+        return float(to_rate) * (1.0 / float(from_rate))
+
+    def rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """
+        Mendapatkan nilai tukar sebuah pasangan tanpa pembagian
+
+        Args:
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            Nilai tukar atau None jika pasangan tidak ada di matriks
+        """
+        i = self.index.get(from_currency)
+        j = self.index.get(to_currency)
+        if i is None or j is None:
+            return None
+        return self.matrix[i * self.size + j]
+
+    def row(self, from_currency: str) -> Optional[array]:
+        """
+        Mendapatkan kurs dari satu mata uang ke semua mata uang
+
+        Args:
+            from_currency: Kode mata uang asal
+
+        Returns:
+            array('d') sepanjang size (urutan self.codes) atau None
+        """
+        i = self.index.get(from_currency)
+        if i is None:
+            return None
+        start = i * self.size
+        return self.matrix[start:start + self.size]
+
+    def column(self, to_currency: str) -> Optional[array]:
+        """
+        Mendapatkan kurs dari semua mata uang ke satu mata uang
+
+        Args:
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            array('d') sepanjang size (urutan self.codes) atau None
+        """
+        j = self.index.get(to_currency)
+        if j is None:
+            return None
+        return self.matrix[j::self.size]
+
+    def convert_row(self, amount: float, from_currency: str) -> Optional[Dict[str, float]]:
+        """
+        Konversi satu jumlah uang ke semua mata uang sekaligus
+
+        Args:
+            amount: Jumlah uang dalam mata uang asal
+            from_currency: Kode mata uang asal
+
+        Returns:
+            Dict kode tujuan -> hasil konversi atau None
+        """
+        row = self.row(from_currency)
+        if row is None:
+            return None
+        amount = float(amount)
+        return dict(zip(self.codes, [amount * rate for rate in row]))
+
+    def convert_column(self, amount: float, to_currency: str) -> Optional[Dict[str, float]]:
+        """
+        Konversi jumlah uang yang sama dari semua mata uang ke satu mata uang
+
+        Args:
+            amount: Jumlah uang dalam setiap mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            Dict kode asal -> hasil konversi atau None
+        """
+        column = self.column(to_currency)
+        if column is None:
+            return None
+        amount = float(amount)
+        return dict(zip(self.codes, [amount * rate for rate in column]))
@@ -0,0 +1,434 @@
+# ============================================================
+# FILE: models/fixed_point.py
+# ============================================================
+"""Engine konversi fixed-point berbasis integer untuk hasil yang eksak"""
+from array import array
+from math import gcd
+from numbers import Integral
+from decimal import (
+    Decimal, InvalidOperation,
+    ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP,
+)
+from typing import Optional, Dict, List, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, hanya untuk konversi batch
+    np = None
+
+from utils.registry import CurrencyRegistry, REGISTRY
+
+ROUNDING_MODES = (
+    ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP,
+)
+
+# Jumlah digit desimal kurs yang disimpan sebagai integer
+RATE_DIGITS = 12
+
+# Batas nilai absolut agar perkalian/pembulatan batch aman di int64
+_INT64_SAFE = 2 ** 62
+
+
+def divide_rounded(numerator: int, denominator: int, rounding: str = ROUND_HALF_EVEN) -> int:
+    """
+    Pembagian integer dengan mode pembulatan yang deterministik
+
+    Args:
+        numerator: Pembilang
+        denominator: Penyebut (positif)
+        rounding: Salah satu konstanta pembulatan dari modul decimal
+
+    Returns:
+        Hasil bagi yang dibulatkan
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    if not remainder:
+        return quotient
+
+    # divmod membulatkan ke bawah (floor); tentukan apakah perlu naik
+    if rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_CEILING:
+        return quotient + 1
+    negative = numerator < 0
+    if rounding == ROUND_DOWN:
+        return quotient + 1 if negative else quotient
+    if rounding == ROUND_UP:
+        return quotient if negative else quotient + 1
+
+    twice = 2 * remainder
+    if twice > denominator:
+        return quotient + 1
+    if twice < denominator:
+        return quotient
+    # Tepat di tengah
+    if rounding == ROUND_HALF_EVEN:
+        return quotient + (quotient & 1)
+    if rounding == ROUND_HALF_UP:
+        return quotient if negative else quotient + 1
+    if rounding == ROUND_HALF_DOWN:
+        return quotient + 1 if negative else quotient
+    raise ValueError(f"Mode pembulatan tidak dikenal: {rounding}")
+
+
+def divide_rounded_array(numerators, denominators, rounding: str = ROUND_HALF_EVEN):
+    """
+    Versi NumPy divide_rounded untuk array (int64 atau object berisi int)
+
+    Args:
+        numerators: Array pembilang
+        denominators: Array penyebut (positif), atau satu penyebut
+        rounding: Salah satu konstanta pembulatan dari modul decimal
+
+    Returns:
+        Array hasil bagi yang dibulatkan (dtype sama dengan input)
+    """
+    # np.divmod tidak mendukung dtype object; // dan sisa eksplisit berlaku untuk keduanya
+    quotient = numerators // denominators
+    remainder = numerators - quotient * denominators
+    if rounding == ROUND_FLOOR:
+        return quotient
+    inexact = remainder != 0
+    if rounding == ROUND_CEILING:
+        up = inexact
+    elif rounding == ROUND_DOWN:
+        up = inexact & (numerators < 0)
+    elif rounding == ROUND_UP:
+        up = inexact & (numerators >= 0)
+    else:
+        twice = remainder * 2
+        tie = twice == denominators
+        if rounding == ROUND_HALF_EVEN:
+            tie &= quotient % 2 == 1
+        elif rounding == ROUND_HALF_UP:
+            tie &= numerators >= 0
+        elif rounding == ROUND_HALF_DOWN:
+            tie &= numerators < 0
+        else:
+            raise ValueError(f"Mode pembulatan tidak dikenal: {rounding}")
+        up = (twice > denominators) | tie
+    return quotient + up.astype(quotient.dtype)
+
+
+class FixedPointConverter:
+    """
+    Class untuk konversi eksak dengan kurs integer terskala
+
+    Kurs disimpan sebagai integer kurs * 10**RATE_DIGITS dan jumlah uang
+    dalam minor unit mata uangnya (misalnya sen). Setiap konversi adalah
+    satu pecahan integer yang dibulatkan sekali dengan mode yang dipilih.
+    """
+
+    def __init__(self, rates: Dict[str, float],
+                 registry: Optional[CurrencyRegistry] = None,
+                 rounding: str = ROUND_HALF_EVEN,
+                 rate_digits: int = RATE_DIGITS):
+        """
+        Inisialisasi engine fixed-point
+
+        Args:
+            rates: Data kurs relatif terhadap base currency
+            registry: Registry mata uang untuk minor unit (default REGISTRY)
+            rounding: Mode pembulatan default
+            rate_digits: Jumlah digit desimal kurs terskala
+        """
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Mode pembulatan tidak dikenal: {rounding}")
+
+        self.registry = registry if registry is not None else REGISTRY
+        self.rounding = rounding
+        self.rate_digits = rate_digits
+
+        self.scaled_rates: Dict[str, int] = {}
+        for code, rate in rates.items():
+            if rate:
+                self.scaled_rates[code] = self._scale(rate)
+
+        self._pair_factors: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+    def _scale(self, rate: float) -> int:
+        """Mengubah kurs float menjadi integer kurs * 10**rate_digits"""
+        # repr float adalah desimal terpendek yang kembali ke float yang
+        # sama, sehingga kurs terskala tidak membawa noise biner
+        scaled = Decimal(repr(float(rate))).scaleb(self.rate_digits)
+        return int(scaled.to_integral_value(ROUND_HALF_EVEN))
+
+    def with_changes(self, changed: Dict[str, float]) -> 'FixedPointConverter':
+        """
+        Membuat engine baru dengan hanya menskalakan ulang kurs yang berubah
+
+        Faktor pasangan yang sudah di-cache dan tidak melibatkan mata uang
+        yang berubah ikut dipakai ulang. Engine ini sendiri tidak diubah.
+
+        Args:
+            changed: Kode -> kurs baru
+
+        Returns:
+            FixedPointConverter baru
+        """
+        engine = FixedPointConverter({}, self.registry, self.rounding, self.rate_digits)
+        scaled_rates = dict(self.scaled_rates)
+        for code, rate in changed.items():
+            if rate:
+                scaled_rates[code] = self._scale(rate)
+            else:
+                scaled_rates.pop(code, None)
+        engine.scaled_rates = scaled_rates
+        engine._pair_factors = {
+            key: factor for key, factor in self._pair_factors.items()
+            if key[0] not in changed and key[1] not in changed
+        }
+        return engine
+
+    def minor_unit_of(self, code: str) -> int:
+        """Mendapatkan jumlah digit minor unit sebuah mata uang"""
+        return self.registry.minor_unit_of(code)
+
+    def to_minor(self, amount: Union[str, int, float, Decimal], code: str,
+                 rounding: Optional[str] = None) -> int:
+        """
+        Mengubah jumlah uang menjadi integer minor unit
+
+        Args:
+            amount: Jumlah uang (string/int/float/Decimal)
+            code: Kode mata uang
+            rounding: Mode pembulatan (default self.rounding)
+
+        Returns:
+            Jumlah uang dalam minor unit
+
+        Raises:
+            ValueError: Jika amount bukan angka
+        """
+        try:
+            if isinstance(amount, (str, int, Decimal)):
+                value = Decimal(amount)
+            elif isinstance(amount, Integral):
+                # Integer NumPy dan sejenisnya tetap eksak
+                value = Decimal(int(amount))
+            else:
+                # float() dulu: repr np.float64 di NumPy 2 adalah 'np.float64(1.5)'
+                value = Decimal(repr(float(amount)))
+        except (InvalidOperation, TypeError, ValueError):
+            raise ValueError(f"Jumlah tidak valid: {amount!r}") from None
+        if not value.is_finite():
+            raise ValueError(f"Jumlah tidak valid: {amount!r}")
+        value = value.scaleb(self.minor_unit_of(code))
+        return int(value.to_integral_value(rounding or self.rounding))
+
+    def from_minor(self, amount_minor: int, code: str) -> Decimal:
+        """
+        Mengubah integer minor unit menjadi Decimal
+
+        Args:
+            amount_minor: Jumlah uang dalam minor unit
+            code: Kode mata uang
+
+        Returns:
+            Decimal dengan jumlah digit sesuai minor unit
+        """
+        return Decimal(amount_minor).scaleb(-self.minor_unit_of(code))
+
+    def pair_factor(self, from_currency: str, to_currency: str) -> Optional[Tuple[int, int]]:
+        """
+        Mendapatkan pecahan (pembilang, penyebut) konversi minor unit
+
+        Args:
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            Tuple integer atau None jika mata uang tidak dikenal
+        """
+        key = (from_currency, to_currency)
+        factor = self._pair_factors.get(key)
+        if factor is not None:
+            return factor
+
+        from_rate = self.scaled_rates.get(from_currency)
+        to_rate = self.scaled_rates.get(to_currency)
+        if from_rate is None or to_rate is None:
+            return None
+
+        # hasil_minor = amount_minor * to/from * 10**(digit_to - digit_from)
+        shift = self.minor_unit_of(to_currency) - self.minor_unit_of(from_currency)
+        numerator = to_rate * 10 ** max(shift, 0)
+        denominator = from_rate * 10 ** max(-shift, 0)
+        common = gcd(numerator, denominator)
+        factor = (numerator // common, denominator // common)
+        self._pair_factors[key] = factor
+        return factor
+
+    def convert_minor(self, amount_minor: int, from_currency: str, to_currency: str,
+                      rounding: Optional[str] = None) -> Optional[int]:
+        """
+        Konversi jumlah uang dalam minor unit
+
+        Args:
+            amount_minor: Jumlah uang asal dalam minor unit
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+            rounding: Mode pembulatan (default self.rounding)
+
+        Returns:
+            Hasil dalam minor unit mata uang tujuan atau None
+        """
+        factor = self.pair_factor(from_currency, to_currency)
+        if factor is None:
+            return None
+        numerator, denominator = factor
+        return divide_rounded(amount_minor * numerator, denominator,
+                              rounding or self.rounding)
+
+    def convert(self, amount: Union[str, int, float, Decimal], from_currency: str,
+                to_currency: str, rounding: Optional[str] = None) -> Optional[Decimal]:
+        """
+        Konversi jumlah uang dan kembalikan Decimal eksak
+
+        Args:
+            amount: Jumlah uang asal
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+            rounding: Mode pembulatan (default self.rounding)
+
+        Returns:
+            Decimal dengan digit minor unit mata uang tujuan atau None
+        """
+        amount_minor = self.to_minor(amount, from_currency, rounding)
+        result = self.convert_minor(amount_minor, from_currency, to_currency, rounding)
+        if result is None:
+            return None
+        return self.from_minor(result, to_currency)
+
+    def convert_many_minor(self, amounts_minor: Sequence[int],
+                           from_currencies: Union[Sequence[Union[str, int]], str, int],
+                           to_currencies: Union[Sequence[Union[str, int]], str, int],
+                           rounding: Optional[str] = None) -> Tuple[List[int], array]:
+        """
+        Konversi batch dalam minor unit dengan mata uang campuran
+
+        Mata uang boleh berupa kode atau ID registry; satu kode/ID
+        tunggal berlaku untuk semua baris.
+
+        Args:
+            amounts_minor: Deret jumlah uang dalam minor unit
+            from_currencies: Mata uang asal per baris
+            to_currencies: Mata uang tujuan per baris
+            rounding: Mode pembulatan (default self.rounding)
+
+        Returns:
+            Tuple (hasil, valid): list integer minor unit (0 jika tidak
+            valid) dan array('b') mask 1/0 per baris
+        """
+        rounding = rounding or self.rounding
+        count = len(amounts_minor)
+        if np is not None and count:
+            return self._convert_many_minor_np(amounts_minor, from_currencies, to_currencies,
+                                               rounding)
+
+        from_codes = self._resolve_codes(from_currencies, count)
+        to_codes = self._resolve_codes(to_currencies, count)
+        if len(from_codes) != count or len(to_codes) != count:
+            raise ValueError("Panjang amounts dan daftar mata uang harus sama")
+
+        results = []
+        valid = array('b', bytes(count))
+        pair_factor = self.pair_factor
+        for row, (amount, from_code, to_code) in enumerate(zip(amounts_minor, from_codes, to_codes)):
+            factor = pair_factor(from_code, to_code)
+            if factor is None:
+                results.append(0)
+                continue
+            numerator, denominator = factor
+            results.append(divide_rounded(amount * numerator, denominator, rounding))
+            valid[row] = 1
+        return results, valid
+
+    def _convert_many_minor_np(self, amounts_minor: Sequence[int], from_currencies,
+                               to_currencies, rounding: str) -> Tuple[List[int], array]:
+        """
+        convert_many_minor dengan NumPy
+
+        Baris dikelompokkan per pasangan mata uang sehingga faktor pecahan
+        hanya dicari sekali per pasangan. Perkalian dan pembulatan dijalankan
+        sebagai operasi array int64; jika hasil antara bisa melewati int64,
+        operasi yang sama dijalankan pada array object (integer Python,
+        tetap eksak).
+        """
+        count = len(amounts_minor)
+        # Kode -> ID sementara, lalu satu ID per pasangan
+        ids: Dict[Optional[str], int] = {}
+        from_ids = self._code_ids(from_currencies, count, ids)
+        to_ids = self._code_ids(to_currencies, count, ids)
+        pairs, rows_pair = np.unique(from_ids * len(ids) + to_ids, return_inverse=True)
+
+        codes = list(ids)
+        numerators = [0] * len(pairs)
+        denominators = [1] * len(pairs)
+        pair_valid = np.zeros(len(pairs), dtype=bool)
+        for k, pair in enumerate(pairs.tolist()):
+            factor = self.pair_factor(codes[pair // len(ids)], codes[pair % len(ids)])
+            if factor is not None:
+                numerators[k], denominators[k] = factor
+                pair_valid[k] = True
+
+        try:
+            amounts = np.asarray(amounts_minor, dtype=np.int64)
+            # Batas dihitung sebagai int Python: np.abs(-2**63) overflow di int64
+            largest = max(-int(amounts.min()), int(amounts.max()))
+        except OverflowError:
+            amounts = np.array([int(amount) for amount in amounts_minor], dtype=object)
+            largest = _INT64_SAFE
+        if largest * max(numerators) < _INT64_SAFE and max(denominators) < _INT64_SAFE:
+            numerators = np.array(numerators, dtype=np.int64)
+            denominators = np.array(denominators, dtype=np.int64)
+        else:
+            numerators = np.array(numerators, dtype=object)
+            denominators = np.array(denominators, dtype=object)
+            amounts = amounts.astype(object)
+
+        results = divide_rounded_array(amounts * numerators[rows_pair],
+                                       denominators[rows_pair], rounding)
+        valid_rows = pair_valid[rows_pair]
+        results[~valid_rows] = 0
+        return results.tolist(), array('b', valid_rows.astype(np.int8).tobytes())
+
+    def _code_ids(self, currencies, count: int, ids: Dict[Optional[str], int]):
+        """
+        ID sementara per baris untuk deret kode/ID mata uang
+
+        Setiap nilai berbeda hanya di-resolve sekali; `ids` (kode -> ID
+        sementara) diisi untuk kode yang belum ada.
+        """
+        if isinstance(currencies, (str, bytes, int, np.integer)):
+            code = self._code_of(currencies)
+            return np.full(count, ids.setdefault(code, len(ids)), dtype=np.int64)
+        if isinstance(currencies, np.ndarray):
+            # tolist mengubah elemen 'S' menjadi bytes dan integer menjadi int
+            currencies = currencies.reshape(-1).tolist()
+        if len(currencies) != count:
+            raise ValueError("Panjang amounts dan daftar mata uang harus sama")
+        key_ids = {}
+        for key in set(currencies):
+            key_ids[key] = ids.setdefault(self._code_of(key), len(ids))
+        return np.fromiter(map(key_ids.__getitem__, currencies), dtype=np.int64, count=count)
+
+    def _code_of(self, currency: Union[str, bytes, int]) -> Optional[str]:
+        """Mengubah satu kode (str/bytes) atau ID registry menjadi kode"""
+        if isinstance(currency, str):
+            return currency
+        if isinstance(currency, bytes):
+            # str(b'USD') adalah "b'USD'", jadi bytes harus di-decode
+            return currency.decode('ascii', 'replace')
+        return self.registry.code_of(int(currency))
+
+    def _resolve_codes(self, currencies, count: int) -> List[Optional[str]]:
+        """Mengubah kode/ID mata uang menjadi daftar kode per baris"""
+        if isinstance(currencies, (str, bytes, Integral)):
+            currencies = (currencies,)
+            repeat = count
+        else:
+            repeat = 1
+        return [self._code_of(currency) for currency in currencies] * repeat
@@ -0,0 +1,294 @@
+# ============================================================
+# FILE: models/hedged_source.py
+# ============================================================
+"""Sumber data kurs multi-provider dengan hedged request dan failover"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Optional, Dict, Hashable, List, Sequence, Tuple
+
+from utils.constants import PROVIDER_CONFIG
+from utils.metrics import METRICS
+from .rate_source import HttpRateSource, RateResult, RateSource, RateSourceError
+
+_HEDGED = METRICS.counter('fetch_hedged_total', 'Request cadangan yang dikirim karena provider lambat')
+_FAILOVERS = METRICS.counter('fetch_failover_total', 'Request cadangan yang dikirim karena provider gagal')
+
+# Bobot sampel terbaru pada rata-rata latensi (EWMA)
+LATENCY_ALPHA = 0.3
+
+# Pemisah nama provider dan validator asli pada ETag/Last-Modified hasil fetch
+VALIDATOR_SEPARATOR = '|'
+
+
+class ProviderStats:
+    """Statistik kesehatan dan latensi satu provider"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency_ewma: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def record(self, latency: float, error: Optional[str] = None):
+        """
+        Mencatat hasil satu request
+
+        Args:
+            latency: Durasi request dalam detik
+            error: Pesan error, None jika berhasil
+        """
+        self.requests += 1
+        if error is None:
+            self.successes += 1
+            self.consecutive_failures = 0
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += LATENCY_ALPHA * (latency - self.latency_ewma)
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = error
+
+    def as_dict(self) -> Dict[str, object]:
+        """Statistik dalam bentuk dict untuk log/monitoring"""
+        return {
+            'requests': self.requests,
+            'successes': self.successes,
+            'failures': self.failures,
+            'consecutive_failures': self.consecutive_failures,
+            'latency_ms': None if self.latency_ewma is None else round(self.latency_ewma * 1000, 2),
+            'last_error': self.last_error,
+        }
+
+
+class HedgedRateSource(RateSource):
+    """
+    Class sumber data kurs yang memakai beberapa provider sekaligus
+
+    Request pertama dikirim ke provider terbaik. Jika belum ada jawaban
+    setelah hedge_delay, request yang sama dikirim ke provider berikutnya;
+    jika provider gagal, provider berikutnya langsung dicoba. Respons valid
+    pertama yang dipakai. Urutan provider ditentukan statistik: provider
+    sehat dulu, lalu yang rata-rata latensinya paling kecil.
+
+    ETag/Last-Modified yang dikembalikan diawali nama provider penerbitnya
+    ("nama|validator"), sehingga validator dari cache disk pun hanya
+    diteruskan ke provider yang mengeluarkannya.
+    """
+
+    name = 'hedged'
+
+    def __init__(self, sources: Sequence[RateSource], hedge_delay: Optional[float] = None):
+        """
+        Inisialisasi sumber multi-provider
+
+        Args:
+            sources: Daftar provider sesuai urutan preferensi awal
+            hedge_delay: Detik menunggu provider sebelum mengirim request
+                         cadangan; 0 berarti semua provider ditanya bersamaan
+                         (default PROVIDER_CONFIG)
+        """
+        if not sources:
+            raise ValueError("Minimal satu sumber data kurs")
+        self.sources = list(sources)
+        self.hedge_delay = (PROVIDER_CONFIG['hedge_delay_ms'] / 1000
+                            if hedge_delay is None else hedge_delay)
+        self.stats: Dict[str, ProviderStats] = {
+            source.name: ProviderStats(source.name) for source in self.sources
+        }
+        self.last_source: Optional[str] = None
+
+        self._lock = threading.Lock()
+        # Request yang masih berjalan per (provider, base, etag, last_modified):
+        # (future, waktu mulai). Fetch berikutnya dengan validator yang sama
+        # ikut menunggu request ini alih-alih mengirim ulang, sehingga provider
+        # yang macet tidak menumpuk thread request. Validator ikut menjadi key
+        # karena respons 304 hanya berguna bagi pemanggil yang mengirimnya.
+        self._in_flight: Dict[Tuple[str, str, Optional[str], Optional[str]],
+                              Tuple[Future, float]] = {}
+
+    def ordered_sources(self) -> List[RateSource]:
+        """
+        Mendapatkan provider sesuai urutan pemakaian berikutnya
+
+        Returns:
+            Provider tanpa kegagalan beruntun dulu, lalu yang tercepat;
+            provider tanpa data latensi mengikuti urutan konfigurasi.
+            Request yang belum selesai dihitung sebagai latensi minimal.
+        """
+        now = time.perf_counter()
+        with self._lock:
+            waiting: Dict[str, float] = {}
+            for (name, *_), (_, started) in self._in_flight.items():
+                waiting[name] = max(waiting.get(name, 0.0), now - started)
+
+            keys = {}
+            for position, source in enumerate(self.sources):
+                stats = self.stats[source.name]
+                latency = max(stats.latency_ewma or 0.0, waiting.get(source.name, 0.0))
+                keys[source.name] = (stats.consecutive_failures > 0,
+                                     stats.consecutive_failures,
+                                     latency,
+                                     position)
+        return sorted(self.sources, key=lambda source: keys[source.name])
+
+    @property
+    def flight_key(self) -> Hashable:
+        """Gabungan key semua provider"""
+        return ('hedged',) + tuple(source.flight_key for source in self.sources)
+
+    def url_for(self, base_currency: str) -> Optional[str]:
+        """URL provider HTTP yang akan ditanya pertama"""
+        for source in self.ordered_sources():
+            if isinstance(source, HttpRateSource):
+                return source.url_for(base_currency)
+        return None
+
+    def provider_stats(self) -> Dict[str, Dict[str, object]]:
+        """Statistik semua provider"""
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    @staticmethod
+    def _tag_validator(source: RateSource, value: Optional[str]) -> Optional[str]:
+        """Menandai validator dengan nama provider yang mengeluarkannya"""
+        return None if value is None else f"{source.name}{VALIDATOR_SEPARATOR}{value}"
+
+    @staticmethod
+    def _validator_for(source: RateSource, value: Optional[str]) -> Optional[str]:
+        """Validator asli jika value dikeluarkan provider ini, selain itu None"""
+        prefix = source.name + VALIDATOR_SEPARATOR
+        if value and value.startswith(prefix):
+            return value[len(prefix):]
+        return None
+
+    def _submit(self, source: RateSource, base_currency: str,
+                etag: Optional[str], last_modified: Optional[str]) -> Future:
+        """Mengirim request ke provider, atau ikut request identik yang masih berjalan"""
+        key = (source.name, base_currency, etag, last_modified)
+        with self._lock:
+            running = self._in_flight.get(key)
+            if running is not None:
+                return running[0]
+            # Thread daemon: request yang kalah balapan hedge tidak menahan
+            # proses keluar (thread ThreadPoolExecutor selalu ditunggu saat exit)
+            future: Future = Future()
+            future.set_running_or_notify_cancel()
+            threading.Thread(target=self._run_fetch,
+                             args=(future, source, base_currency, etag, last_modified),
+                             name=f'rate-source-{source.name}', daemon=True).start()
+            self._in_flight[key] = (future, time.perf_counter())
+
+        def finished(_future, key=key):
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+        future.add_done_callback(finished)
+        return future
+
+    def _run_fetch(self, future: Future, source: RateSource, base_currency: str,
+                   etag: Optional[str], last_modified: Optional[str]):
+        """Isi thread request: hasil atau exception fetch dikirim ke future"""
+        try:
+            result = self._timed_fetch(source, base_currency, etag, last_modified)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def _timed_fetch(self, source: RateSource, base_currency: str,
+                     etag: Optional[str], last_modified: Optional[str]) -> RateResult:
+        """Menjalankan fetch satu provider dan mencatat statistiknya"""
+        start = time.perf_counter()
+        try:
+            result = source.fetch(base_currency, etag=etag, last_modified=last_modified)
+            if not result.not_modified and not result.rates:
+                raise RateSourceError("Respons tanpa data kurs")
+        except Exception as e:
+            with self._lock:
+                self.stats[source.name].record(time.perf_counter() - start, str(e))
+            raise
+        with self._lock:
+            self.stats[source.name].record(time.perf_counter() - start)
+        return result
+
+    def fetch(self, base_currency: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> RateResult:
+        order = self.ordered_sources()
+        pending: Dict[Future, RateSource] = {}
+        errors: List[str] = []
+        launched = 0
+
+        def launch():
+            nonlocal launched
+            source = order[launched]
+            launched += 1
+            pending[self._submit(source, base_currency,
+                                 self._validator_for(source, etag),
+                                 self._validator_for(source, last_modified))] = source
+
+        launch()
+        while pending:
+            timeout = self.hedge_delay if launched < len(order) else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # Provider yang berjalan terlalu lambat: kirim request cadangan
+                if METRICS.enabled:
+                    _HEDGED.inc()
+                launch()
+                continue
+
+            failed = False
+            for future in done:
+                source = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.append(f"{source.name}: {e}")
+                    failed = True
+                    continue
+                # Request lain dibiarkan selesai di background agar
+                # statistiknya tetap tercatat
+                self.last_source = source.name
+                if result.not_modified:
+                    return result
+                # Objek hasil bisa dipakai bersama pemanggil lain; buat yang baru
+                return RateResult(result.rates,
+                                  etag=self._tag_validator(source, result.etag),
+                                  last_modified=self._tag_validator(source, result.last_modified))
+
+            if failed and launched < len(order):
+                if METRICS.enabled:
+                    _FAILOVERS.inc()
+                launch()
+
+        raise RateSourceError("Semua provider gagal: " + "; ".join(errors))
+
+    def close(self):
+        """
+        Menutup semua provider
+
+        Request yang masih berjalan (misalnya yang kalah balapan hedge)
+        berjalan di thread daemon, jadi tidak ditunggu saat proses keluar.
+        """
+        for source in self.sources:
+            source.close()
+
+
+def default_source() -> RateSource:
+    """
+    Membuat sumber data kurs default dari PROVIDER_CONFIG
+
+    Returns:
+        HttpRateSource jika hanya ada satu provider, selain itu
+        HedgedRateSource di atas semua provider
+    """
+    sources = [HttpRateSource(url_template) for url_template in PROVIDER_CONFIG['url_templates']]
+    if len(sources) == 1:
+        return sources[0]
+    return HedgedRateSource(sources)
@@ -0,0 +1,228 @@
+# ============================================================
+# FILE: models/parallel_batch.py
+# ============================================================
+"""Konversi batch multi-proses dengan tabel kurs di shared memory"""
+import csv
+import io
+import json
+import multiprocessing
+import multiprocessing.util
+from collections import deque
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import Optional, Dict, List, Iterable, Iterator, Sequence, TextIO, Tuple
+
+from .batch import BatchConverter
+from .cross_rates import CrossRateMatrix
+
+# State per proses worker, diisi sekali oleh _init_worker
+_WORKER: Dict[str, object] = {}
+
+
+class SharedCrossRates:
+    """
+    Matriks cross-rate di atas buffer shared memory
+
+    Atributnya sama dengan CrossRateMatrix yang dipakai BatchConverter
+    (codes, index, size, matrix), sehingga perhitungan di worker memakai
+    kode yang sama dengan konversi di proses utama.
+    """
+
+    def __init__(self, buffer, codes: Sequence[str]):
+        """
+        Args:
+            buffer: Buffer berisi size * size float64 (row-major)
+            codes: Kode mata uang sesuai urutan baris/kolom
+        """
+        self.codes = list(codes)
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self.size = len(self.codes)
+        self.matrix = memoryview(buffer).cast('B')[:self.size * self.size * 8].cast('d')
+
+
+def _init_worker(shm_name: str, codes: Sequence[str], options: Dict[str, object]):
+    """Initializer pool: membuka tabel kurs sekali per proses worker"""
+    # Worker memakai resource tracker yang sama dengan proses utama, jadi
+    # segmen hanya di-unlink sekali oleh proses utama di close()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    cross_rates = SharedCrossRates(shm.buf, codes)
+    _WORKER['converter'] = BatchConverter(cross_rates, **options)
+
+    def release():
+        # View ke buffer harus dilepas sebelum close(), kalau tidak
+        # SharedMemory.__del__ gagal dengan BufferError saat worker keluar
+        cross_rates.matrix.release()
+        shm.close()
+
+    multiprocessing.util.Finalize(None, release, exitpriority=10)
+
+
+def _convert_records(records: List[Dict]) -> Tuple[List[Dict], int]:
+    """Task worker: konversi daftar record"""
+    converter: BatchConverter = _WORKER['converter']
+    errors = converter.errors
+    records = converter.convert_chunk(records)
+    return records, converter.errors - errors
+
+
+def _convert_csv_text(text: str, fieldnames: List[str],
+                      output_fieldnames: List[str]) -> Tuple[str, int, int]:
+    """Task worker: konversi potongan CSV tanpa header, hasilnya teks CSV"""
+    converter: BatchConverter = _WORKER['converter']
+    errors = converter.errors
+    records = converter.convert_chunk(list(csv.DictReader(io.StringIO(text, newline=''),
+                                                          fieldnames=fieldnames)))
+    out = io.StringIO(newline='')
+    csv.DictWriter(out, fieldnames=output_fieldnames, extrasaction='ignore').writerows(records)
+    return out.getvalue(), len(records), converter.errors - errors
+
+
+def _convert_jsonl_text(lines: List[str]) -> Tuple[str, int, int]:
+    """Task worker: konversi potongan JSONL, hasilnya teks JSONL"""
+    converter: BatchConverter = _WORKER['converter']
+    rows, errors = converter.rows, converter.errors
+    records = converter.convert_chunk(list(converter.iter_jsonl_records(lines)))
+    text = ''.join(json.dumps(record) + '\n' for record in records)
+    return text, converter.rows - rows, converter.errors - errors
+
+
+class ParallelBatchConverter(BatchConverter):
+    """
+    Class batch converter yang membagi chunk ke beberapa proses
+
+    Matriks cross-rate disalin sekali ke multiprocessing.shared_memory dan
+    setiap worker membukanya saat start, jadi tabel kurs tidak di-pickle
+    per task. Urutan output selalu sama dengan urutan input. Untuk CSV
+    dan JSONL, parsing dan serialisasi juga dikerjakan worker; proses
+    utama hanya memotong baris mentah dan menulis hasilnya. Engine
+    fixed-point (opsi fixed_point) dikirim sekali ke setiap worker lewat
+    initializer.
+    """
+
+    def __init__(self, cross_rates: CrossRateMatrix, workers: Optional[int] = None,
+                 **options):
+        """
+        Inisialisasi batch converter paralel
+
+        Args:
+            cross_rates: Snapshot matriks cross-rate
+            workers: Jumlah proses worker (default jumlah CPU)
+            **options: Argumen BatchConverter lainnya (amount_field, dst.)
+        """
+        super().__init__(cross_rates, **options)
+        self.workers = workers or multiprocessing.cpu_count()
+        # Task yang boleh berjalan bersamaan; membatasi memori untuk input besar
+        self.max_pending = self.workers * 2
+        self._options = options
+        self._pool = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    def __enter__(self) -> 'ParallelBatchConverter':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """Menyalin tabel kurs ke shared memory dan menjalankan pool worker"""
+        if self._pool is not None:
+            return
+        matrix = self.cross_rates.matrix
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, len(matrix) * 8))
+        self._shm.buf[:len(matrix) * 8] = memoryview(matrix).cast('B')
+        try:
+            self._pool = multiprocessing.Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self._shm.name, self.cross_rates.codes, self._options)
+            )
+        except BaseException:
+            # Segmen tidak akan di-unlink oleh close() jika pool gagal dibuat
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+            raise
+
+    def close(self):
+        """Menghentikan pool worker dan menghapus shared memory"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _ordered(self, func, tasks: Iterable[tuple]) -> Iterator:
+        """
+        Menjalankan task di pool dan mengembalikan hasil sesuai urutan task
+
+        Paling banyak max_pending task berjalan sekaligus, sehingga input
+        dibaca sedikit demi sedikit (berbeda dengan Pool.imap yang membaca
+        seluruh iterable).
+        """
+        self.start()
+        pending = deque()
+        for args in tasks:
+            pending.append(self._pool.apply_async(func, args))
+            if len(pending) >= self.max_pending:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+    def iter_chunks(self, records: Iterable[Dict]) -> Iterator[List[Dict]]:
+        iterator = iter(records)
+        tasks = iter(lambda: (list(islice(iterator, self.chunk_size)),), ([],))
+        for chunk, errors in self._ordered(_convert_records, tasks):
+            self.rows += len(chunk)
+            self.errors += errors
+            yield chunk
+
+    def run_csv(self, infile: TextIO, outfile: TextIO) -> Tuple[int, int]:
+        header = next(csv.reader([infile.readline()]), [])
+        fieldnames = list(header)
+        output_fieldnames = list(fieldnames)
+        if self.output_field not in output_fieldnames:
+            output_fieldnames.append(self.output_field)
+        csv.writer(outfile).writerow(output_fieldnames)
+
+        tasks = ((text, fieldnames, output_fieldnames)
+                 for text in self._csv_text_chunks(infile))
+        for text, rows, errors in self._ordered(_convert_csv_text, tasks):
+            outfile.write(text)
+            self.rows += rows
+            self.errors += errors
+        return self.rows, self.errors
+
+    def _csv_text_chunks(self, infile: TextIO) -> Iterator[str]:
+        """
+        Memotong baris CSV mentah per chunk_size record
+
+        Record dengan newline di dalam kutipan terdiri dari beberapa baris;
+        potongan hanya dibuat saat jumlah tanda kutip genap, sehingga
+        record tidak pernah terbelah.
+        """
+        lines: List[str] = []
+        records = 0
+        quotes = 0
+        for line in infile:
+            lines.append(line)
+            quotes += line.count('"')
+            if quotes % 2:
+                continue
+            records += 1
+            if records >= self.chunk_size:
+                yield ''.join(lines)
+                lines, records, quotes = [], 0, 0
+        if lines:
+            yield ''.join(lines)
+
+    def run_jsonl(self, infile: TextIO, outfile: TextIO) -> Tuple[int, int]:
+        tasks = iter(lambda: (list(islice(infile, self.chunk_size)),), ([],))
+        for text, rows, errors in self._ordered(_convert_jsonl_text, tasks):
+            outfile.write(text)
+            self.rows += rows
+            self.errors += errors
+        return self.rows, self.errors
@@ -0,0 +1,212 @@
+# ============================================================
+# FILE: models/rate_cache.py
+# ============================================================
+"""Cache data kurs di disk dengan masa berlaku (TTL)"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional, Dict, Any, Hashable
+
+from utils.constants import CACHE_CONFIG
+from .binary_snapshot import BinarySnapshot, encode
+
+# Ekstensi file cache per format
+EXTENSIONS = {'binary': 'rsnp', 'json': 'json'}
+
+
+def source_tag(source: Hashable) -> str:
+    """Tag pendek nama file cache untuk flight_key sebuah sumber data kurs"""
+    return hashlib.sha1(repr(source).encode('utf-8')).hexdigest()[:12]
+
+
+class RateCache:
+    """
+    Class untuk menyimpan data kurs ke file lokal per base currency
+
+    Parameter source berisi flight_key sumber data kurs; data dari sumber
+    berbeda disimpan di file berbeda. source None berarti provider
+    default (PROVIDER_CONFIG), yang dipakai juga oleh convert.py.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None,
+                 file_format: Optional[str] = None):
+        """
+        Inisialisasi cache
+
+        Args:
+            cache_dir: Folder penyimpanan file cache
+            ttl: Masa berlaku cache dalam detik
+            file_format: 'binary' atau 'json' (default CACHE_CONFIG)
+        """
+        self.cache_dir = os.path.expanduser(cache_dir or CACHE_CONFIG['directory'])
+        self.ttl = CACHE_CONFIG['ttl_seconds'] if ttl is None else ttl
+        self.file_format = file_format or CACHE_CONFIG['format']
+        if self.file_format not in EXTENSIONS:
+            raise ValueError(f"Format cache tidak dikenal: {self.file_format}")
+
+    def path_for(self, base_currency: str, file_format: Optional[str] = None,
+                 source: Optional[Hashable] = None) -> str:
+        """
+        Mendapatkan path file cache untuk sebuah base currency
+
+        Args:
+            base_currency: Kode mata uang dasar
+            file_format: Format file (default format cache ini)
+            source: flight_key sumber data kurs (None = provider default)
+
+        Returns:
+            Path lengkap file cache
+        """
+        extension = EXTENSIONS[file_format or self.file_format]
+        name = f'rates_{base_currency.upper()}'
+        if source is not None:
+            name = f'{name}_{source_tag(source)}'
+        return os.path.join(self.cache_dir, f'{name}.{extension}')
+
+    def load(self, base_currency: str,
+             source: Optional[Hashable] = None) -> Optional[Dict[str, Any]]:
+        """
+        Membaca entry cache tanpa memeriksa masa berlaku
+
+        File dengan format cache ini dibaca lebih dulu; file format lain
+        (misalnya cache JSON lama) dipakai jika belum ada.
+
+        Args:
+            base_currency: Kode mata uang dasar
+            source: flight_key sumber data kurs (None = provider default)
+
+        Returns:
+            Dict berisi 'rates' dan 'timestamp', atau None jika tidak ada
+        """
+        formats = [self.file_format] + [f for f in EXTENSIONS if f != self.file_format]
+        for file_format in formats:
+            path = self.path_for(base_currency, file_format, source)
+            if file_format == 'binary':
+                entry = self._load_binary(path)
+            else:
+                entry = self._load_json(path)
+            if entry is not None:
+                break
+        else:
+            return None
+
+        if not isinstance(entry, dict) or not entry.get('rates'):
+            return None
+        if entry.get('base') != base_currency.upper():
+            return None
+        return entry
+
+    @staticmethod
+    def _load_json(path: str) -> Optional[Dict[str, Any]]:
+        """Membaca entry cache dari file JSON"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _load_binary(path: str) -> Optional[Dict[str, Any]]:
+        """Membaca entry cache dari snapshot biner"""
+        try:
+            with BinarySnapshot.load(path) as snapshot:
+                return {
+                    'base': snapshot.base_currency,
+                    'timestamp': snapshot.timestamp,
+                    'rates': snapshot.rates(),
+                    'etag': snapshot.meta.get('etag'),
+                    'last_modified': snapshot.meta.get('last_modified'),
+                }
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """
+        Memeriksa apakah entry cache masih berlaku
+
+        Args:
+            entry: Entry hasil load()
+            now: Waktu acuan (epoch detik), default waktu sekarang
+
+        Returns:
+            True jika umur entry kurang dari TTL
+        """
+        if now is None:
+            now = time.time()
+        age = now - float(entry.get('timestamp', 0))
+        return 0 <= age < self.ttl
+
+    def load_fresh(self, base_currency: str,
+                   source: Optional[Hashable] = None) -> Optional[Dict[str, Any]]:
+        """
+        Membaca entry cache hanya jika masih berlaku
+
+        Args:
+            base_currency: Kode mata uang dasar
+            source: flight_key sumber data kurs (None = provider default)
+
+        Returns:
+            Entry cache atau None jika tidak ada/kedaluwarsa
+        """
+        entry = self.load(base_currency, source)
+        if entry is not None and self.is_fresh(entry):
+            return entry
+        return None
+
+    def save(self, base_currency: str, rates: Dict[str, float],
+             timestamp: Optional[float] = None, etag: Optional[str] = None,
+             last_modified: Optional[str] = None,
+             source: Optional[Hashable] = None) -> bool:
+        """
+        Menyimpan data kurs ke file cache secara atomik
+
+        Args:
+            base_currency: Kode mata uang dasar
+            rates: Data kurs relatif terhadap base currency
+            timestamp: Waktu pengambilan data (epoch detik)
+            etag: Header ETag dari respons API
+            last_modified: Header Last-Modified dari respons API
+            source: flight_key sumber data kurs (None = provider default)
+
+        Returns:
+            True jika berhasil, False jika gagal
+        """
+        base_currency = base_currency.upper()
+        timestamp = time.time() if timestamp is None else timestamp
+
+        try:
+            if self.file_format == 'binary':
+                meta = {key: value for key, value in
+                        (('etag', etag), ('last_modified', last_modified)) if value}
+                data = encode(rates, base_currency, timestamp=timestamp, meta=meta)
+            else:
+                data = json.dumps({
+                    'base': base_currency,
+                    'timestamp': timestamp,
+                    'rates': rates,
+                    'etag': etag,
+                    'last_modified': last_modified,
+                }).encode('utf-8')
+        except ValueError as e:
+            print(f"Error writing rate cache: {e}")
+            return False
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Tulis ke file sementara lalu rename agar pembaca
+            # tidak pernah melihat file yang setengah tertulis
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path_for(base_currency, source=source))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return True
+
+        except OSError as e:
+            print(f"Error writing rate cache: {e}")
+            return False
@@ -0,0 +1,85 @@
+# ============================================================
+# FILE: models/rate_delta.py
+# ============================================================
+"""Selisih (delta) antara dua data kurs"""
+from typing import Dict, Iterable, Tuple
+
+
+class RateDelta:
+    """
+    Class delta data kurs: mata uang yang berubah, bertambah dan hilang
+
+    Dipakai untuk memperbarui struktur turunan (vektor kurs, matriks
+    cross-rate, engine fixed-point) hanya pada baris/kolom yang berubah.
+    """
+
+    __slots__ = ('changed', 'added', 'removed', 'since_version')
+
+    def __init__(self, changed: Dict[str, float], added: Dict[str, float],
+                 removed: Tuple[str, ...], since_version: int = 0):
+        """
+        Args:
+            changed: Kode -> kurs baru untuk mata uang yang nilainya berubah
+            added: Kode -> kurs untuk mata uang yang baru muncul
+            removed: Kode mata uang yang tidak ada lagi
+            since_version: Versi snapshot asal delta
+        """
+        self.changed = changed
+        self.added = added
+        self.removed = removed
+        self.since_version = since_version
+
+    @classmethod
+    def between(cls, old_rates: Dict[str, float], new_rates: Dict[str, float],
+                since_version: int = 0) -> 'RateDelta':
+        """
+        Menghitung delta dari data kurs lama ke data kurs baru
+
+        Args:
+            old_rates: Data kurs saat ini
+            new_rates: Data kurs baru
+            since_version: Versi snapshot data kurs lama
+
+        Returns:
+            RateDelta (kosong jika data sama persis)
+        """
+        changed = {}
+        added = {}
+        for code, rate in new_rates.items():
+            old = old_rates.get(code)
+            if old is None:
+                added[code] = rate
+            elif old != rate:
+                changed[code] = rate
+        removed = tuple(code for code in old_rates if code not in new_rates)
+        return cls(changed, added, removed, since_version)
+
+    @property
+    def structural(self) -> bool:
+        """True jika himpunan mata uang berubah (perlu bangun ulang penuh)"""
+        return bool(self.added or self.removed)
+
+    def affects(self, codes: Iterable[str]) -> bool:
+        """
+        Mengecek apakah delta menyentuh salah satu mata uang
+
+        Args:
+            codes: Kode mata uang yang diperiksa
+
+        Returns:
+            True jika ada kode yang berubah, bertambah atau hilang
+        """
+        if self.structural:
+            return True
+        changed = self.changed
+        return any(code in changed for code in codes)
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.added or self.removed)
+
+    def __len__(self) -> int:
+        return len(self.changed) + len(self.added) + len(self.removed)
+
+    def __repr__(self) -> str:
+        return (f"RateDelta(changed={len(self.changed)}, added={len(self.added)}, "
+                f"removed={len(self.removed)}, since_version={self.since_version})")
@@ -0,0 +1,367 @@
+# ============================================================
+# FILE: models/rate_graph.py
+# ============================================================
+"""Graf kurs multi-sumber dengan jalur konversi terbaik antar semua pasangan"""
+import math
+from typing import Optional, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, tanpa NumPy dipakai loop Python
+    np = None
+
+from utils.constants import GRAPH_CONFIG
+from .rate_source import RateSource, RateSourceError
+
+# Toleransi log-space agar noise floating point pada siklus kurs mid
+# (misalnya USD -> EUR -> USD) tidak dianggap arbitrase
+CYCLE_TOLERANCE = 1e-12
+
+
+class RateGraph:
+    """
+    Class graf kurs dari beberapa tabel kurs, base currency dan provider
+
+    Setiap tabel kurs `{kode: kurs}` terhadap sebuah base menjadi dua sisi
+    per mata uang (base -> kode dan kode -> base). Kurs efektif sisi sudah
+    dipotong setengah spread bid/ask dan fee proporsional sumbernya. Bobot
+    sisi adalah -log(kurs efektif), sehingga jalur terpendek (Floyd-Warshall)
+    adalah jalur dengan hasil konversi terbesar.
+
+    Matriks kurs efektif semua pasangan dibangun ulang hanya saat tabel
+    berubah; setelah itu rate() dan convert() cukup satu lookup.
+    """
+
+    def __init__(self):
+        # (source, base) -> (rates, spread, fee)
+        self._tables: Dict[Tuple[str, str], Tuple[Dict[str, float], float, float]] = {}
+        self._dirty = True
+        self.codes: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.size = 0
+        self.arbitrage: List[str] = []
+        self._rates: List[List[float]] = []
+        # Matriks predecessor (satu, atau satu per putaran jika ada arbitrase)
+        self._preds: List[List[List[int]]] = []
+        # Jumlah langkah jalur terbaik per pasangan (hanya jika ada arbitrase)
+        self._layers: Optional[List[List[int]]] = None
+
+    def add_table(self, base_currency: str, rates: Dict[str, float], source: str = 'default',
+                  spread: Optional[float] = None, fee: Optional[float] = None):
+        """
+        Menambah atau mengganti tabel kurs sebuah sumber
+
+        Args:
+            base_currency: Base currency tabel kurs
+            rates: Kode -> kurs relatif terhadap base currency
+            source: Nama provider/sumber (tabel dengan source dan base sama
+                    diganti)
+            spread: Spread bid/ask relatif (0.002 = 0.2%), separuhnya
+                    dibebankan di setiap arah (default dari GRAPH_CONFIG)
+            fee: Fee proporsional per konversi (0.001 = 0.1%, default dari
+                 GRAPH_CONFIG)
+
+        Raises:
+            ValueError: Jika spread atau fee di luar [0, 1)
+        """
+        costs = GRAPH_CONFIG['provider_costs'].get(source, {})
+        if spread is None:
+            spread = costs.get('spread', GRAPH_CONFIG['spread'])
+        if fee is None:
+            fee = costs.get('fee', GRAPH_CONFIG['fee'])
+        if not 0 <= spread < 1 or not 0 <= fee < 1:
+            raise ValueError("spread dan fee harus di antara 0 dan 1")
+        self._tables[(source, base_currency)] = (dict(rates), spread, fee)
+        self._dirty = True
+
+    def add_quote(self, from_currency: str, to_currency: str, rate: float,
+                  source: str = 'default', spread: Optional[float] = None,
+                  fee: Optional[float] = None):
+        """
+        Menambah kurs langsung satu pasangan (berlaku dua arah)
+
+        Args:
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+            rate: Kurs mid from -> to
+            source: Nama provider/sumber
+            spread: Spread bid/ask relatif
+            fee: Fee proporsional per konversi
+        """
+        key = (source, from_currency)
+        rates = dict(self._tables[key][0]) if key in self._tables else {}
+        rates[to_currency] = rate
+        self.add_table(from_currency, rates, source, spread, fee)
+
+    def load_source(self, source: RateSource, base_currencies: Sequence[str] = ('USD',)) -> int:
+        """
+        Mengambil tabel kurs dari sebuah sumber untuk beberapa base currency
+
+        Sumber gabungan (HedgedRateSource) dibuka per provider, sehingga
+        kurs semua provider ikut bersaing di graf.
+
+        Args:
+            source: Sumber data kurs
+            base_currencies: Base currency yang diambil dari setiap provider
+
+        Returns:
+            Jumlah tabel kurs yang berhasil ditambahkan
+        """
+        loaded = 0
+        for provider in getattr(source, 'sources', None) or [source]:
+            for base_currency in base_currencies:
+                try:
+                    result = provider.fetch(base_currency)
+                except RateSourceError as e:
+                    print(f"Error fetching rates from {provider.name}: {e}")
+                    continue
+                if result.rates:
+                    self.add_table(base_currency, result.rates, provider.name)
+                    loaded += 1
+        return loaded
+
+    def remove_source(self, source: str):
+        """Menghapus semua tabel kurs milik sebuah sumber"""
+        for key in [key for key in self._tables if key[0] == source]:
+            del self._tables[key]
+        self._dirty = True
+
+    def _edges(self) -> Dict[Tuple[str, str], float]:
+        """Kurs efektif terbaik per pasangan (from, to) dari semua tabel"""
+        edges: Dict[Tuple[str, str], float] = {}
+        for (_, base), (rates, spread, fee) in self._tables.items():
+            factor = (1 - spread / 2) * (1 - fee)
+            for code, rate in rates.items():
+                if not rate or code == base:
+                    continue
+                for pair, value in (((base, code), rate * factor),
+                                    ((code, base), factor / rate)):
+                    if value > edges.get(pair, 0.0):
+                        edges[pair] = value
+        return edges
+
+    def rebuild(self):
+        """Menghitung ulang kurs efektif dan jalur terbaik semua pasangan"""
+        edges = self._edges()
+        codes = sorted({code for pair in edges for code in pair})
+        index = {code: i for i, code in enumerate(codes)}
+        size = len(codes)
+
+        # Bobot log-space: jalur terpendek = perkalian kurs terbesar
+        weights = [[math.inf] * size for _ in range(size)]
+        for i in range(size):
+            weights[i][i] = 0.0
+        for (from_code, to_code), rate in edges.items():
+            weights[index[from_code]][index[to_code]] = -math.log(rate)
+
+        if np is not None:
+            dist, pred = self._floyd_warshall_np(weights)
+        else:
+            dist, pred = self._floyd_warshall(weights)
+        preds = [pred]
+        layers = None
+
+        # Siklus berbobot negatif = arbitrase (hasil > 1 setelah biaya);
+        # jalur terpendek tidak terbatas, jadi jumlah langkah dibatasi
+        arbitrage = [code for i, code in enumerate(codes) if dist[i][i] < -CYCLE_TOLERANCE]
+        if arbitrage:
+            dist, preds, layers = self._bounded_paths(weights, GRAPH_CONFIG['max_hops'])
+
+        rates = [[math.exp(-d) for d in row] for row in dist]
+        for i in range(size):
+            rates[i][i] = 1.0
+
+        self.codes = codes
+        self.index = index
+        self.size = size
+        self.arbitrage = arbitrage
+        self._rates = rates
+        self._preds = preds
+        self._layers = layers
+        self._dirty = False
+
+    @staticmethod
+    def _floyd_warshall_np(weights: List[List[float]]) -> Tuple[List[List[float]], List[List[int]]]:
+        """Floyd-Warshall dengan satu operasi matriks NumPy per node perantara"""
+        dist = np.array(weights, dtype=np.float64)
+        size = len(dist)
+        pred = np.where(np.isfinite(dist), np.arange(size)[:, None], -1)
+        for k in range(size):
+            through = dist[:, k, None] + dist[None, k, :]
+            better = through < dist - CYCLE_TOLERANCE
+            if better.any():
+                dist = np.where(better, through, dist)
+                pred = np.where(better, pred[None, k, :], pred)
+        return dist.tolist(), pred.tolist()
+
+    @staticmethod
+    def _floyd_warshall(weights: List[List[float]]) -> Tuple[List[List[float]], List[List[int]]]:
+        """Floyd-Warshall tanpa NumPy"""
+        size = len(weights)
+        dist = [list(row) for row in weights]
+        pred = [[i if d < math.inf else -1 for d in row] for i, row in enumerate(dist)]
+        for k in range(size):
+            dist_k = dist[k]
+            pred_k = pred[k]
+            for i in range(size):
+                d_ik = dist[i][k]
+                if d_ik == math.inf:
+                    continue
+                dist_i = dist[i]
+                pred_i = pred[i]
+                for j in range(size):
+                    through = d_ik + dist_k[j]
+                    if through < dist_i[j] - CYCLE_TOLERANCE:
+                        dist_i[j] = through
+                        pred_i[j] = pred_k[j]
+        return dist, pred
+
+    @staticmethod
+    def _bounded_paths(weights: List[List[float]], max_hops: int
+                       ) -> Tuple[List[List[float]], List[List[List[int]]], List[List[int]]]:
+        """
+        Jalur terbaik dengan paling banyak max_hops langkah
+
+        Putaran ke-h menghitung jalur terbaik dengan tepat h langkah dari
+        jalur h - 1 langkah, sehingga siklus arbitrase tidak bisa berlipat
+        tanpa batas. Jalur tidak kembali ke mata uang asal. Predecessor
+        disimpan per putaran bersama putaran yang menghasilkan nilai
+        terbaik, jadi jalur yang direkonstruksi selalu jalur yang sama
+        dengan nilai kursnya.
+
+        Returns:
+            Tuple (dist, preds, layers): preds[h - 1] adalah predecessor
+            jalur h langkah, layers[i][j] jumlah langkah jalur terbaik
+        """
+        size = len(weights)
+        # Jalur 0 langkah: hanya dari mata uang ke dirinya sendiri
+        exact = [[0.0 if i == j else math.inf for j in range(size)] for i in range(size)]
+        dist = [list(row) for row in exact]
+        layers = [[0] * size for _ in range(size)]
+        preds: List[List[List[int]]] = []
+        edge = np.array(weights, dtype=np.float64) if np is not None else None
+        for hops in range(1, max(max_hops, 1) + 1):
+            if np is not None:
+                current = np.array(exact, dtype=np.float64)
+                new_exact = np.full((size, size), np.inf)
+                new_pred = np.full((size, size), -1)
+                for k in range(size):
+                    through = current[:, k, None] + edge[None, k, :]
+                    better = through < new_exact - CYCLE_TOLERANCE
+                    if better.any():
+                        new_exact = np.where(better, through, new_exact)
+                        new_pred = np.where(better, k, new_pred)
+                new_exact, new_pred = new_exact.tolist(), new_pred.tolist()
+            else:
+                new_exact = [[math.inf] * size for _ in range(size)]
+                new_pred = [[-1] * size for _ in range(size)]
+                for i in range(size):
+                    exact_i = exact[i]
+                    new_exact_i = new_exact[i]
+                    new_pred_i = new_pred[i]
+                    for k in range(size):
+                        d_ik = exact_i[k]
+                        if d_ik == math.inf:
+                            continue
+                        for j, w_kj in enumerate(weights[k]):
+                            through = d_ik + w_kj
+                            if through < new_exact_i[j] - CYCLE_TOLERANCE:
+                                new_exact_i[j] = through
+                                new_pred_i[j] = k
+            for i in range(size):
+                # Jalur yang kembali ke asal tidak diteruskan
+                new_exact[i][i] = math.inf
+                new_pred[i][i] = -1
+                dist_i = dist[i]
+                layers_i = layers[i]
+                for j, d in enumerate(new_exact[i]):
+                    # Jalur lebih panjang hanya dipakai jika nyata lebih baik
+                    if d < dist_i[j] - CYCLE_TOLERANCE:
+                        dist_i[j] = d
+                        layers_i[j] = hops
+            exact = new_exact
+            preds.append(new_pred)
+        return dist, preds, layers
+
+    def _ensure_built(self):
+        if self._dirty:
+            self.rebuild()
+
+    def rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """
+        Mendapatkan kurs efektif terbaik antara dua mata uang
+
+        Args:
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            Kurs efektif (sudah termasuk spread dan fee) atau None jika
+            tidak ada jalur
+        """
+        self._ensure_built()
+        i = self.index.get(from_currency)
+        j = self.index.get(to_currency)
+        if i is None or j is None:
+            return None
+        rate = self._rates[i][j]
+        return rate if rate > 0 else None
+
+    def convert(self, amount: float, from_currency: str, to_currency: str) -> Optional[float]:
+        """
+        Konversi lewat jalur terbaik
+
+        Args:
+            amount: Jumlah uang asal
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            Jumlah uang hasil konversi atau None jika tidak ada jalur
+        """
+        rate = self.rate(from_currency, to_currency)
+        if rate is None:
+            return None
+        return amount * rate
+
+    def path(self, from_currency: str, to_currency: str) -> Optional[List[str]]:
+        """
+        Mendapatkan urutan mata uang pada jalur terbaik
+
+        Args:
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            List kode dari asal sampai tujuan, atau None jika tidak ada jalur
+        """
+        self._ensure_built()
+        i = self.index.get(from_currency)
+        j = self.index.get(to_currency)
+        if i is None or j is None or self._rates[i][j] <= 0:
+            return None
+        preds = self._preds
+        nodes = [j]
+        if self._layers is not None:
+            # Dirunut dari putaran yang menghasilkan nilai rate(), satu
+            # langkah per putaran
+            for hops in range(self._layers[i][j], 0, -1):
+                j = preds[hops - 1][i][j]
+                if j < 0:
+                    return None
+                nodes.append(j)
+            if j != i:
+                return None
+            return [self.codes[node] for node in reversed(nodes)]
+
+        # Dirunut mundur dari tujuan; batas langkah hanya pengaman
+        for _ in range(self.size):
+            if j == i:
+                break
+            j = preds[0][i][j]
+            if j < 0:
+                return None
+            nodes.append(j)
+        else:
+            return None
+        return [self.codes[node] for node in reversed(nodes)]
@@ -0,0 +1,363 @@
+# ============================================================
+# FILE: models/rate_history.py
+# ============================================================
+"""Riwayat data kurs append-only berbasis file kolom memory-mapped"""
+import json
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Dict, Iterator, List, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: tanpa lock antar proses
+    fcntl = None
+
+from utils.constants import HISTORY_CONFIG
+
+Timestamp = Union[datetime, float, int]
+
+NAN = float('nan')
+
+
+class RateHistory:
+    """
+    Class untuk menyimpan setiap snapshot kurs dan query as-of
+
+    Data disimpan dalam dua file kolom float64:
+    - timestamps.f64: satu timestamp (epoch detik) per snapshot, urut naik
+    - rates.f64: satu baris sepanjang `capacity` per snapshot, kolom ke-i
+      berisi kurs mata uang dengan ID kolom i (NaN jika tidak ada)
+    Pemetaan kode -> ID kolom disimpan di meta.json. Kedua file di-mmap
+    sehingga query tidak perlu memuat seluruh riwayat ke RAM. Penulisan
+    memegang flock eksklusif pada file .lock, sehingga beberapa proses
+    (misalnya GUI dan service.py) bisa memakai store yang sama.
+    """
+
+    ROW_ITEM_SIZE = array('d').itemsize
+
+    def __init__(self, directory: str, base_currency: str = 'USD', capacity: int = 512):
+        """
+        Membuka (atau membuat) store riwayat kurs
+
+        Args:
+            directory: Folder penyimpanan store
+            base_currency: Base currency seluruh snapshot di store
+            capacity: Jumlah kolom mata uang per baris (hanya dipakai saat
+                      store baru dibuat)
+        """
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._meta_path = os.path.join(self.directory, 'meta.json')
+        self._timestamps_path = os.path.join(self.directory, 'timestamps.f64')
+        self._rates_path = os.path.join(self.directory, 'rates.f64')
+        self._lock_path = os.path.join(self.directory, '.lock')
+        self._lock = threading.Lock()
+
+        self._timestamps: memoryview = memoryview(array('d'))
+        self._rates: memoryview = memoryview(array('d'))
+        self._count = 0
+
+        with self._store_lock():
+            meta = self._load_meta()
+            if meta is None:
+                meta = {'base': base_currency, 'capacity': capacity, 'codes': []}
+                self._save_meta(meta)
+            elif meta['base'] != base_currency:
+                raise ValueError(
+                    f"Store riwayat memakai base {meta['base']}, bukan {base_currency}"
+                )
+
+            self.base_currency = meta['base']
+            self.capacity: int = meta['capacity']
+            self.codes: List[str] = meta['codes']
+            self.index: Dict[str, int] = {code: i for i, code in enumerate(self.codes)}
+
+            for path in (self._timestamps_path, self._rates_path):
+                open(path, 'ab').close()
+
+            self._truncate_partial()
+            self._remap()
+
+    @contextmanager
+    def _store_lock(self) -> Iterator[None]:
+        """
+        Lock eksklusif antar proses untuk mengubah file store
+
+        Tanpa lock ini, _truncate_partial proses lain bisa memotong baris
+        yang sedang ditulis, dan meta.json bisa ditimpa dengan pemetaan
+        kolom yang berbeda.
+        """
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @classmethod
+    def from_config(cls, base_currency: str = 'USD',
+                    directory: Optional[str] = None) -> Optional['RateHistory']:
+        """
+        Membuka store riwayat sesuai HISTORY_CONFIG
+
+        Args:
+            base_currency: Base currency store (folder terpisah per base)
+            directory: Folder induk store (default HISTORY_CONFIG)
+
+        Returns:
+            RateHistory, atau None jika riwayat dimatikan atau gagal dibuka
+        """
+        if directory is None:
+            if not HISTORY_CONFIG['enabled']:
+                return None
+            directory = HISTORY_CONFIG['directory']
+        path = os.path.join(os.path.expanduser(directory), base_currency.upper())
+        try:
+            return cls(path, base_currency.upper(), HISTORY_CONFIG['capacity'])
+        except (ValueError, OSError) as e:
+            print(f"Error opening rate history: {e}")
+            return None
+
+    def _load_meta(self) -> Optional[dict]:
+        """Membaca meta.json jika ada"""
+        try:
+            with open(self._meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _save_meta(self, meta: dict):
+        """Menulis meta.json secara atomik"""
+        tmp_path = self._meta_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._meta_path)
+
+    def _map_file(self, path: str) -> memoryview:
+        """
+        Memetakan file float64 ke memoryview read-only
+
+        Args:
+            path: Path file kolom
+
+        Returns:
+            memoryview format 'd' (kosong jika file kosong)
+        """
+        size = os.path.getsize(path)
+        size -= size % self.ROW_ITEM_SIZE
+        if size == 0:
+            return memoryview(array('d'))
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        return memoryview(mapped).cast('d')
+
+    def _truncate_partial(self):
+        """
+        Memotong kedua file ke jumlah baris lengkap
+
+        Append yang terputus (crash di antara dua penulisan) bisa
+        meninggalkan baris rates tanpa timestamp atau sebaliknya. Tanpa
+        dipotong, baris berikutnya akan bergeser dari timestamp-nya.
+        """
+        row_size = self.capacity * self.ROW_ITEM_SIZE
+        timestamps_size = os.path.getsize(self._timestamps_path)
+        rates_size = os.path.getsize(self._rates_path)
+        count = min(timestamps_size // self.ROW_ITEM_SIZE, rates_size // row_size)
+        if timestamps_size != count * self.ROW_ITEM_SIZE:
+            os.truncate(self._timestamps_path, count * self.ROW_ITEM_SIZE)
+        if rates_size != count * row_size:
+            os.truncate(self._rates_path, count * row_size)
+
+    def _remap(self):
+        """
+        Memetakan ulang file setelah ada baris baru
+
+        Mapping lama tidak ditutup paksa karena mungkin masih dibaca
+        thread lain; mapping itu dilepas oleh garbage collector.
+        """
+        self._timestamps = self._map_file(self._timestamps_path)
+        self._rates = self._map_file(self._rates_path)
+        # Baris rates ditulis sebelum timestamp-nya, jadi jumlah baris
+        # lengkap adalah minimum dari keduanya
+        self._count = min(len(self._timestamps), len(self._rates) // self.capacity)
+
+    def close(self):
+        """Menutup store"""
+        with self._lock:
+            self._timestamps = memoryview(array('d'))
+            self._rates = memoryview(array('d'))
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def _to_epoch(value: Timestamp) -> float:
+        """Mengubah datetime/epoch menjadi epoch detik"""
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return float(value)
+
+    def append(self, rates: Dict[str, float], timestamp: Timestamp) -> int:
+        """
+        Menambahkan satu snapshot kurs
+
+        Args:
+            rates: Data kurs relatif terhadap base currency
+            timestamp: Waktu pengambilan data
+
+        Returns:
+            Nomor baris snapshot
+
+        Raises:
+            ValueError: Jika timestamp lebih lama dari snapshot terakhir atau
+                        jumlah mata uang melebihi kapasitas store
+        """
+        timestamp = self._to_epoch(timestamp)
+
+        with self._lock, self._store_lock():
+            # Proses lain mungkin sudah menambah kolom atau baris; sisa
+            # append yang gagal dibuang agar baris baru sejajar dengan
+            # timestamp-nya
+            meta = self._load_meta()
+            if meta is not None and len(meta['codes']) > len(self.codes):
+                self.codes = meta['codes']
+                self.index = {code: i for i, code in enumerate(self.codes)}
+            self._truncate_partial()
+            self._remap()
+
+            if self._count and timestamp < self._timestamps[self._count - 1]:
+                raise ValueError("Timestamp snapshot harus urut naik")
+
+            new_codes = [code for code in rates if code not in self.index]
+            if len(self.codes) + len(new_codes) > self.capacity:
+                raise ValueError(
+                    f"Jumlah mata uang melebihi kapasitas store ({self.capacity})"
+                )
+            if new_codes:
+                for code in new_codes:
+                    self.index[code] = len(self.codes)
+                    self.codes.append(code)
+                self._save_meta({'base': self.base_currency,
+                                 'capacity': self.capacity,
+                                 'codes': self.codes})
+
+            row = array('d', [NAN]) * self.capacity
+            for code, rate in rates.items():
+                row[self.index[code]] = float(rate)
+
+            with open(self._rates_path, 'ab') as f:
+                row.tofile(f)
+            with open(self._timestamps_path, 'ab') as f:
+                array('d', [timestamp]).tofile(f)
+
+            self._remap()
+            return self._count - 1
+
+    def row_at(self, as_of: Timestamp) -> Optional[int]:
+        """
+        Mencari snapshot terakhir pada atau sebelum waktu as_of
+
+        Args:
+            as_of: Waktu acuan
+
+        Returns:
+            Nomor baris atau None jika belum ada snapshot pada waktu itu
+        """
+        row = bisect_right(self._timestamps, self._to_epoch(as_of), 0, self._count) - 1
+        return row if row >= 0 else None
+
+    def timestamp_of(self, row: int) -> datetime:
+        """Mendapatkan waktu snapshot sebuah baris"""
+        return datetime.fromtimestamp(self._timestamps[row])
+
+    def _rate_in_row(self, row: int, from_currency: str, to_currency: str) -> Optional[float]:
+        """Menghitung cross rate dari satu baris snapshot"""
+        if from_currency == self.base_currency:
+            from_rate = 1.0
+        else:
+            i = self.index.get(from_currency)
+            if i is None:
+                return None
+            from_rate = self._rates[row * self.capacity + i]
+
+        if to_currency == self.base_currency:
+            to_rate = 1.0
+        else:
+            j = self.index.get(to_currency)
+            if j is None:
+                return None
+            to_rate = self._rates[row * self.capacity + j]
+
+        # NaN (mata uang belum ada di snapshot ini) tidak sama dengan dirinya
+        if from_rate != from_rate or to_rate != to_rate or not from_rate:
+            return None
+        return to_rate / from_rate
+
+    def get_rate(self, from_currency: str, to_currency: str,
+                 as_of: Timestamp) -> Optional[float]:
+        """
+        Mendapatkan nilai tukar yang berlaku pada waktu as_of
+
+        Args:
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+            as_of: Waktu acuan
+
+        Returns:
+            Nilai tukar atau None jika tidak ada data
+        """
+        row = self.row_at(as_of)
+        if row is None:
+            return None
+        return self._rate_in_row(row, from_currency, to_currency)
+
+    def get_rates_at(self, as_of: Timestamp) -> Optional[Dict[str, float]]:
+        """
+        Mendapatkan seluruh tabel kurs yang berlaku pada waktu as_of
+
+        Args:
+            as_of: Waktu acuan
+
+        Returns:
+            Dict kode -> kurs atau None jika tidak ada data
+        """
+        row = self.row_at(as_of)
+        if row is None:
+            return None
+        start = row * self.capacity
+        values = self._rates[start:start + len(self.codes)]
+        return {code: rate for code, rate in zip(self.codes, values) if rate == rate}
+
+    def get_rate_range(self, from_currency: str, to_currency: str,
+                       start: Timestamp, end: Timestamp) -> List[Tuple[datetime, float]]:
+        """
+        Mendapatkan deret nilai tukar untuk snapshot di rentang [start, end]
+
+        Args:
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+            start: Awal rentang waktu
+            end: Akhir rentang waktu
+
+        Returns:
+            Daftar (waktu snapshot, nilai tukar)
+        """
+        first = bisect_left(self._timestamps, self._to_epoch(start), 0, self._count)
+        last = bisect_right(self._timestamps, self._to_epoch(end), 0, self._count)
+
+        series = []
+        for row in range(first, last):
+            rate = self._rate_in_row(row, from_currency, to_currency)
+            if rate is not None:
+                series.append((self.timestamp_of(row), rate))
+        return series
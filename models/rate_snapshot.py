@@ -0,0 +1,298 @@
+# ============================================================
+# FILE: models/rate_snapshot.py
+# ============================================================
+"""Snapshot data kurs immutable dengan nomor versi"""
+import itertools
+import time
+from array import array
+from typing import Optional, Dict, Iterable, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, hanya untuk rebase
+    np = None
+
+from utils.registry import CurrencyRegistry, REGISTRY
+from .cross_rates import CrossRateMatrix
+from .fixed_point import FixedPointConverter
+from .rate_delta import RateDelta
+
+NAN = float('nan')
+
+# Nomor versi unik dan naik terus di seluruh proses; next() atomik di bawah GIL
+_VERSIONS = itertools.count(1)
+
+
+class RateSnapshot:
+    """
+    Class snapshot data kurs yang tidak berubah setelah dibuat
+
+    Semua turunan data kurs (vektor per ID mata uang, matriks cross-rate)
+    dibangun sekali di constructor. Converter mempublikasikan snapshot baru
+    dengan mengganti satu referensi, sehingga pembaca di thread lain selalu
+    melihat snapshot lama atau baru secara utuh tanpa lock. Nomor versi
+    cukup dibandingkan untuk mengetahui apakah cache turunan sudah basi.
+
+    Vektor `vector` dan `inverse` diindeks dengan ID registry dan punya
+    satu slot tambahan di akhir (ID == len(codes)) berisi NaN untuk mata
+    uang yang tidak dikenal. Dict `rates` dan array jangan diubah.
+
+    Snapshot yang dibuat dengan with_rates() menyimpan `delta` terhadap
+    snapshot sebelumnya, sehingga cache turunan di luar model bisa
+    dibuang hanya untuk mata uang yang berubah.
+    """
+
+    __slots__ = ('base_currency', 'version', 'timestamp', 'rates', 'codes', 'index',
+                 'vector', 'inverse', 'cross_rates', 'registry', 'delta',
+                 '_lookup', '_fixed_point', '_rebased')
+
+    def __init__(self, rates: Dict[str, float], base_currency: str = 'USD',
+                 timestamp: Optional[float] = None,
+                 registry: Optional[CurrencyRegistry] = None,
+                 cross_rate_codes: Optional[Sequence[str]] = None):
+        """
+        Membangun snapshot dari data kurs
+
+        Args:
+            rates: Data kurs relatif terhadap base currency (disalin)
+            base_currency: Base currency data kurs
+            timestamp: Waktu pengambilan data (epoch detik, default sekarang)
+            registry: Registry mata uang untuk ID integer (default REGISTRY)
+            cross_rate_codes: Mata uang untuk matriks cross-rate (default
+                              semua mata uang di rates)
+        """
+        registry = registry if registry is not None else REGISTRY
+        rates = dict(rates)
+
+        # Mata uang baru dari API mendapat ID di belakang ID yang sudah ada
+        registry.register_many(rates)
+        codes = tuple(registry.codes)
+        vector = array('d', (float(rates.get(code) or NAN) for code in codes))
+        vector.append(NAN)
+        inverse = array('d', (1.0 / r for r in vector))
+
+        setattr_ = object.__setattr__
+        setattr_(self, 'base_currency', base_currency)
+        setattr_(self, 'version', next(_VERSIONS) if rates else 0)
+        setattr_(self, 'timestamp', time.time() if timestamp is None else timestamp)
+        setattr_(self, 'rates', rates)
+        setattr_(self, 'codes', codes)
+        setattr_(self, 'index', {code: i for i, code in enumerate(codes)})
+        setattr_(self, 'vector', vector)
+        setattr_(self, 'inverse', inverse)
+        setattr_(self, 'cross_rates', CrossRateMatrix(rates, cross_rate_codes) if rates else None)
+        setattr_(self, 'registry', registry)
+        setattr_(self, 'delta', None)
+        setattr_(self, '_lookup', None)
+        setattr_(self, '_fixed_point', None)
+        setattr_(self, '_rebased', {})
+
+    @classmethod
+    def empty(cls, base_currency: str = 'USD',
+              registry: Optional[CurrencyRegistry] = None) -> 'RateSnapshot':
+        """Snapshot tanpa data kurs (versi 0)"""
+        return cls({}, base_currency, 0.0, registry)
+
+    def with_rates(self, rates: Dict[str, float], timestamp: Optional[float] = None,
+                   cross_rate_codes: Optional[Sequence[str]] = None) -> 'RateSnapshot':
+        """
+        Membuat snapshot berikutnya dari data kurs baru secara inkremental
+
+        Data baru dibandingkan dengan snapshot ini; hanya slot vektor,
+        baris/kolom matriks cross-rate dan kurs fixed-point milik mata uang
+        yang berubah yang dihitung ulang. Jika himpunan mata uang berubah
+        atau sebagian besar kurs bergerak, snapshot dibangun ulang penuh.
+        Hasilnya identik dengan RateSnapshot(rates, ...).
+
+        Args:
+            rates: Data kurs baru relatif terhadap base currency yang sama
+            timestamp: Waktu pengambilan data (epoch detik, default sekarang)
+            cross_rate_codes: Mata uang untuk matriks cross-rate (harus sama
+                              dengan yang dipakai snapshot ini)
+
+        Returns:
+            Snapshot baru dengan atribut `delta`. Jika data kurs tidak
+            berubah sama sekali, versinya tetap dan hanya timestamp yang
+            diperbarui.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        delta = RateDelta.between(self.rates, rates, self.version)
+        if not delta:
+            return self._derive(version=self.version, timestamp=timestamp, _rebased={})
+
+        changed = delta.changed
+        if cross_rate_codes is not None:
+            selected = set(cross_rate_codes)
+            matrix_codes = [code for code in changed if code in selected]
+        else:
+            matrix_codes = list(changed)
+        cross = None
+        # Registry yang bertambah (dari snapshot lain) mengubah panjang vektor
+        if (not delta.structural and len(self.registry.codes) == len(self.codes)
+                and len(matrix_codes) * 2 <= self.cross_rates.size):
+            cross = self.cross_rates.with_changes(rates, matrix_codes)
+        if cross is None:
+            snapshot = RateSnapshot(rates, self.base_currency, timestamp,
+                                    self.registry, cross_rate_codes)
+            object.__setattr__(snapshot, 'delta', delta)
+            return snapshot
+
+        index = self.index
+        vector = array('d', self.vector)
+        inverse = array('d', self.inverse)
+        for code, rate in changed.items():
+            i = index[code]
+            vector[i] = float(rate or NAN)
+            inverse[i] = 1.0 / vector[i]
+
+        engine = self._fixed_point
+        return self._derive(version=next(_VERSIONS), timestamp=timestamp, rates=dict(rates),
+                            vector=vector, inverse=inverse, cross_rates=cross, delta=delta,
+                            _fixed_point=None if engine is None else engine.with_changes(changed),
+                            _rebased={})
+
+    def _derive(self, **fields) -> 'RateSnapshot':
+        """Salinan snapshot dengan sebagian field diganti (struktur lain dipakai bersama)"""
+        snapshot = RateSnapshot.__new__(RateSnapshot)
+        for name in self.__slots__:
+            object.__setattr__(snapshot, name, fields[name] if name in fields else getattr(self, name))
+        return snapshot
+
+    def rebase(self, base_currency: str) -> Optional['RateSnapshot']:
+        """
+        Snapshot yang sama relatif terhadap base currency lain, tanpa fetch
+
+        Semua kurs dibagi kurs base baru dalam satu operasi vektor. Matriks
+        cross-rate, index dan registry dipakai bersama karena tidak
+        bergantung pada base. Hasilnya di-cache per base di snapshot ini,
+        sehingga otomatis dibuang saat refresh mempublikasikan snapshot baru.
+        Versi snapshot hasil rebase sama dengan versi snapshot ini.
+
+        Args:
+            base_currency: Kode base currency baru
+
+        Returns:
+            RateSnapshot dengan base baru, atau None jika kurs base baru
+            tidak tersedia
+        """
+        if base_currency == self.base_currency:
+            return self
+        rebased = self._rebased
+        snapshot = rebased.get(base_currency)
+        if snapshot is not None:
+            return snapshot
+        base_rate = self.rates.get(base_currency)
+        if not base_rate:
+            return None
+
+        rates = self.rates
+        if np is not None:
+            values = (np.fromiter(rates.values(), dtype=np.float64, count=len(rates))
+                      / base_rate).tolist()
+            vector = np.frombuffer(self.vector, dtype=np.float64) / base_rate
+            inverse = array('d', (1.0 / vector).tobytes())
+            vector = array('d', vector.tobytes())
+        else:
+            values = [rate / base_rate for rate in rates.values()]
+            vector = array('d', [rate / base_rate for rate in self.vector])
+            inverse = array('d', [1.0 / rate for rate in vector])
+
+        # Snapshot ini ikut terdaftar agar rebase berantai kembali ke objek yang sama
+        rebased.setdefault(self.base_currency, self)
+        snapshot = self._derive(base_currency=base_currency, rates=dict(zip(rates, values)),
+                                vector=vector, inverse=inverse, delta=None, _fixed_point=None)
+        return rebased.setdefault(base_currency, snapshot)
+
+    def unchanged_since(self, version: int, codes: Iterable[str]) -> bool:
+        """
+        Mengecek apakah kurs mata uang tertentu sama dengan di versi lain
+
+        Args:
+            version: Versi snapshot pembanding
+            codes: Kode mata uang yang diperiksa
+
+        Returns:
+            True jika versi sama, atau snapshot ini dibuat langsung dari
+            versi tersebut tanpa menyentuh mata uang yang diperiksa
+        """
+        if version == self.version:
+            return True
+        delta = self.delta
+        return bool(delta is not None and version and delta.since_version == version
+                    and not delta.affects(codes))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RateSnapshot tidak bisa diubah; buat snapshot baru")
+
+    def __delattr__(self, name):
+        raise AttributeError("RateSnapshot tidak bisa diubah; buat snapshot baru")
+
+    def __bool__(self) -> bool:
+        return bool(self.rates)
+
+    def __len__(self) -> int:
+        return len(self.rates)
+
+    def __repr__(self) -> str:
+        return (f"RateSnapshot(base={self.base_currency!r}, version={self.version}, "
+                f"currencies={len(self.rates)}, timestamp={self.timestamp:.3f})")
+
+    def rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """
+        Mendapatkan nilai tukar antara dua mata uang
+
+        Args:
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            Nilai tukar atau None jika pasangan tidak tersedia
+        """
+        if self.cross_rates is None:
+            return None
+        rate = self.cross_rates.rate(from_currency, to_currency)
+        if rate is not None:
+            return rate
+
+        rates = self.rates
+        try:
+            if from_currency == self.base_currency:
+                return rates[to_currency]
+            elif to_currency == self.base_currency:
+                return 1 / rates[from_currency]
+            else:
+                return rates[to_currency] / rates[from_currency]
+        except (KeyError, ZeroDivisionError):
+            return None
+
+    def id_lookup(self) -> Dict[Union[str, int], int]:
+        """
+        Tabel lookup kode maupun ID ke ID vektor kurs (dibuat sekali)
+
+        Returns:
+            Dict kode/ID -> ID
+        """
+        lookup = self._lookup
+        if lookup is None:
+            lookup = dict(self.index)
+            lookup.update((i, i) for i in range(len(self.codes)))
+            object.__setattr__(self, '_lookup', lookup)
+        return lookup
+
+    def fixed_point(self, rounding: str) -> Optional[FixedPointConverter]:
+        """
+        Engine fixed-point untuk snapshot ini (dibuat saat pertama dipakai)
+
+        Args:
+            rounding: Mode pembulatan default engine
+
+        Returns:
+            FixedPointConverter atau None jika snapshot kosong
+        """
+        if not self.rates:
+            return None
+        engine = self._fixed_point
+        if engine is None or engine.rounding != rounding:
+            engine = FixedPointConverter(self.rates, self.registry, rounding)
+            object.__setattr__(self, '_fixed_point', engine)
+        return engine
@@ -0,0 +1,170 @@
+# ============================================================
+# FILE: models/rate_source.py
+# ============================================================
+"""Sumber data kurs yang bisa diganti (API, server lokal, dll)"""
+from typing import Optional, Dict, Hashable
+
+import requests
+import requests.adapters
+
+from utils.constants import HTTP_CONFIG
+
+
+class RateSourceError(Exception):
+    """Error dari sumber data kurs yang bukan error HTTP"""
+
+
+class RateResult:
+    """Hasil satu kali pengambilan data kurs dari sebuah sumber"""
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None, not_modified: bool = False,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Inisialisasi hasil
+
+        Args:
+            rates: Data kurs relatif terhadap base currency (None jika 304)
+            not_modified: True jika sumber menjawab data tidak berubah
+            etag: Validator ETag dari sumber
+            last_modified: Validator Last-Modified dari sumber
+        """
+        self.rates = rates
+        self.not_modified = not_modified
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class RateSource:
+    """Interface sumber data kurs"""
+
+    name = 'source'
+
+    @property
+    def flight_key(self) -> Hashable:
+        """
+        Key sumber untuk berbagi fetch antar converter dalam satu proses
+
+        Sumber dengan key sama dianggap mengembalikan data yang sama.
+        Default-nya unik per instance.
+        """
+        return (type(self).__name__, id(self))
+
+    def fetch(self, base_currency: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> RateResult:
+        """
+        Mengambil data kurs untuk sebuah base currency
+
+        Args:
+            base_currency: Kode mata uang dasar
+            etag: Validator ETag data yang sudah dimiliki (opsional)
+            last_modified: Validator Last-Modified data yang sudah dimiliki
+
+        Returns:
+            RateResult
+
+        Raises:
+            requests.exceptions.RequestException atau RateSourceError
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Melepas resource milik sumber (default tidak ada)"""
+
+
+class StaticRateSource(RateSource):
+    """Sumber data kurs tetap di memori (untuk mode offline dan benchmark)"""
+
+    name = 'static'
+
+    def __init__(self, rates: Dict[str, float], base_currency: str = 'USD'):
+        """
+        Inisialisasi sumber statis
+
+        Args:
+            rates: Data kurs relatif terhadap base_currency
+            base_currency: Base currency data kurs
+        """
+        self.rates = dict(rates)
+        self.base_currency = base_currency
+
+    def fetch(self, base_currency: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> RateResult:
+        if base_currency != self.base_currency:
+            raise RateSourceError(
+                f"Sumber statis hanya punya base {self.base_currency}, bukan {base_currency}"
+            )
+        return RateResult(dict(self.rates))
+
+
+class HttpRateSource(RateSource):
+    """Sumber data kurs dari HTTP API dengan session dan conditional GET"""
+
+    def __init__(self, url_template: Optional[str] = None, timeout: Optional[float] = None,
+                 name: Optional[str] = None):
+        """
+        Inisialisasi sumber HTTP
+
+        Args:
+            url_template: URL dengan placeholder {base} (default HTTP_CONFIG)
+            timeout: Timeout request dalam detik (default HTTP_CONFIG)
+            name: Nama sumber untuk log/statistik (default host URL)
+        """
+        self.url_template = url_template or HTTP_CONFIG['url_template']
+        self.timeout = HTTP_CONFIG['timeout'] if timeout is None else timeout
+        self.name = name or self.url_template.split('/')[2]
+        self.session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Membuat HTTP session dengan connection pool yang dipakai ulang
+
+        Returns:
+            Instance requests.Session
+        """
+        session = requests.Session()
+        session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=HTTP_CONFIG['pool_connections'],
+            pool_maxsize=HTTP_CONFIG['pool_maxsize']
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @property
+    def flight_key(self) -> Hashable:
+        """Sumber HTTP dengan URL template sama berbagi fetch"""
+        return ('http', self.url_template)
+
+    def url_for(self, base_currency: str) -> str:
+        """Mendapatkan URL API untuk sebuah base currency"""
+        return self.url_template.format(base=base_currency)
+
+    def fetch(self, base_currency: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> RateResult:
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        response = self.session.get(self.url_for(base_currency), headers=headers,
+                                    timeout=self.timeout)
+        if response.status_code == 304:
+            return RateResult(not_modified=True, etag=etag, last_modified=last_modified)
+
+        response.raise_for_status()
+        data = response.json()
+        return RateResult(
+            data['rates'],
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+
+    def close(self):
+        """Menutup HTTP session beserta koneksi di pool"""
+        self.session.close()
@@ -0,0 +1,120 @@
+# ============================================================
+# FILE: models/single_flight.py
+# ============================================================
+"""Penggabungan fetch bersamaan dan snapshot kurs bersama dalam satu proses"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class _Call:
+    """Satu pemanggilan yang sedang berjalan beserta hasilnya"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Class untuk menjalankan paling banyak satu pemanggilan per key
+
+    Pemanggil yang datang saat pemanggilan dengan key yang sama masih
+    berjalan tidak menjalankan fungsinya sendiri, tetapi menunggu dan
+    menerima hasil (atau exception) pemanggilan tersebut.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Menjalankan func, atau ikut menunggu pemanggilan yang sedang berjalan
+
+        Args:
+            key: Key pemanggilan (misalnya provider dan base currency)
+            func: Fungsi tanpa argumen yang dijalankan oleh pemanggil pertama
+
+        Returns:
+            Tuple (hasil, shared): shared True jika hasil berasal dari
+            pemanggilan milik thread lain
+
+        Raises:
+            Exception apa pun yang dilempar func
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Jumlah key yang sedang berjalan"""
+        with self._lock:
+            return len(self._calls)
+
+
+class SharedRates:
+    """
+    Class penyimpan data kurs terbaru per key untuk seluruh proses
+
+    Setiap entry berisi snapshot beserta validator dan waktu update-nya,
+    sehingga converter lain dengan key yang sama bisa memakai snapshot
+    tersebut tanpa fetch sendiri.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Dict[str, Any]] = {}
+
+    def publish(self, key: Hashable, entry: Dict[str, Any]):
+        """
+        Menyimpan entry jika tidak lebih lama dari entry yang ada
+
+        Args:
+            key: Key data kurs
+            entry: Dict berisi minimal 'snapshot' (RateSnapshot) dan
+                   'timestamp' (epoch detik data terakhir divalidasi)
+        """
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or current['timestamp'] <= entry['timestamp']:
+                self._entries[key] = entry
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Entry terbaru untuk key, atau None"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def clear(self):
+        """Menghapus semua entry"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Instance bersama seluruh proses
+FETCHES = SingleFlight()
+SHARED_RATES = SharedRates()
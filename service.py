@@ -0,0 +1,56 @@
+# ============================================================
+# FILE: service.py
+# ============================================================
+"""Entry point service HTTP konversi tanpa GUI"""
+import argparse
+import asyncio
+from models import CurrencyConverter, HttpRateSource, RateHistory
+from services import ConversionService
+from utils.constants import SERVICE_CONFIG
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Membaca argumen command line"""
+    parser = argparse.ArgumentParser(description='Service HTTP konversi mata uang')
+    parser.add_argument('--host', default=SERVICE_CONFIG['host'])
+    parser.add_argument('--port', type=int, default=SERVICE_CONFIG['port'])
+    parser.add_argument('--base', default='USD', help='Base currency untuk API')
+    parser.add_argument('--source-url', help='URL template sumber kurs dengan {base}')
+    parser.add_argument('--history-dir',
+                        help="Folder riwayat kurs (default HISTORY_CONFIG['directory'])")
+    parser.add_argument('--no-history', action='store_true',
+                        help='Jangan mencatat riwayat kurs (as_of tidak tersedia)')
+    parser.add_argument('--max-batch', type=int, default=SERVICE_CONFIG['max_batch'])
+    parser.add_argument('--batch-delay-ms', type=float, default=SERVICE_CONFIG['batch_delay_ms'])
+    parser.add_argument('--refresh-interval', type=float,
+                        default=SERVICE_CONFIG['refresh_interval_s'],
+                        help='Detik antar refresh otomatis (0 = mati)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Fungsi utama untuk menjalankan service"""
+    args = parse_args(argv)
+    source = HttpRateSource(args.source_url) if args.source_url else None
+    history = None if args.no_history else RateHistory.from_config(args.base, args.history_dir)
+    converter = CurrencyConverter(args.base, source=source, history=history)
+    service = ConversionService(converter, args.host, args.port, args.max_batch,
+                                args.batch_delay_ms, args.refresh_interval)
+
+    async def run():
+        await service.start()
+        print(f"Service konversi: http://{service.host}:{service.port}")
+        await service.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        converter.close()
+        if history is not None:
+            history.close()
+
+
+if __name__ == "__main__":
+    main()
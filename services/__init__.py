@@ -0,0 +1,7 @@
+# ============================================================
+# FILE: services/__init__.py
+# ============================================================
+"""Services package: akses headless ke model converter"""
+from .conversion_service import ConversionService, ServiceError
+
+__all__ = ['ConversionService', 'ServiceError']
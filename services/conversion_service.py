@@ -0,0 +1,470 @@
+# ============================================================
+# FILE: services/conversion_service.py
+# ============================================================
+"""Service HTTP asyncio untuk konversi mata uang dengan micro-batching"""
+import asyncio
+import json
+import math
+import time
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from models import CurrencyConverter
+from models.binary_snapshot import encode_snapshot
+from utils.constants import SERVICE_CONFIG
+from utils.metrics import METRICS
+
+_REQUESTS = METRICS.counter('service_requests_total', 'Jumlah request HTTP service')
+_BATCHES = METRICS.counter('service_batches_total', 'Jumlah micro-batch yang dievaluasi')
+_BATCH_SECONDS = METRICS.histogram('service_batch_seconds', 'Durasi evaluasi satu micro-batch')
+
+_REASONS = {
+    200: 'OK',
+    202: 'Accepted',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+# Satu item micro-batch: (jenis, amount, from, to, future)
+BatchItem = Tuple[str, float, str, str, asyncio.Future]
+
+
+class ServiceError(Exception):
+    """Error request yang dijawab dengan status HTTP tertentu"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ConversionService:
+    """
+    Class service HTTP headless di atas CurrencyConverter
+
+    Request convert/rate dari banyak koneksi ditampung dulu lalu
+    dievaluasi bersama dalam satu micro-batch terhadap satu snapshot
+    CrossRateMatrix. Refresh kurs berjalan di executor sehingga event
+    loop tidak pernah menunggu jaringan.
+
+    Endpoint:
+        GET  /convert?amount=100&from=USD&to=IDR
+        GET  /rate?from=USD&to=IDR
+        GET  /pairs              (matriks semua pasangan)
+        GET  /pairs?from=USD     (satu baris)
+        GET  /rates?base=EUR     (tabel kurs untuk base lain, tanpa fetch)
+        GET  /snapshot           (snapshot kurs biner, application/octet-stream)
+        GET  /health
+        GET  /metrics
+        POST /refresh
+    """
+
+    def __init__(self, converter: Optional[CurrencyConverter] = None,
+                 host: Optional[str] = None, port: Optional[int] = None,
+                 max_batch: Optional[int] = None, batch_delay_ms: Optional[float] = None,
+                 refresh_interval_s: Optional[float] = None):
+        """
+        Inisialisasi service
+
+        Args:
+            converter: Model converter (default CurrencyConverter())
+            host: Alamat bind (default SERVICE_CONFIG)
+            port: Port bind, 0 untuk port bebas (default SERVICE_CONFIG)
+            max_batch: Jumlah request maksimum per micro-batch
+            batch_delay_ms: Waktu tunggu pengumpulan batch; 0 berarti
+                            batch ditutup pada giliran event loop berikutnya
+            refresh_interval_s: Interval refresh otomatis (0 = mati)
+        """
+        self.converter = converter if converter is not None else CurrencyConverter()
+        self.host = host or SERVICE_CONFIG['host']
+        self.port = SERVICE_CONFIG['port'] if port is None else port
+        self.max_batch = max_batch or SERVICE_CONFIG['max_batch']
+        delay_ms = SERVICE_CONFIG['batch_delay_ms'] if batch_delay_ms is None else batch_delay_ms
+        self.batch_delay = delay_ms / 1000
+        self.refresh_interval = (SERVICE_CONFIG['refresh_interval_s']
+                                 if refresh_interval_s is None else refresh_interval_s)
+        self.max_body_bytes = SERVICE_CONFIG['max_body_bytes']
+
+        self._pending: List[BatchItem] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Koneksi klien yang masih terbuka -> task handler-nya, ditutup oleh stop()
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refreshing: Optional[asyncio.Future] = None
+
+        # Body /pairs dan /rates disimpan per versi snapshot agar tidak di-encode ulang
+        self._pairs_cache: Dict[object, bytes] = {}
+        self._pairs_version = 0
+        self._snapshot_body: Tuple[int, Optional[memoryview]] = (0, None)
+
+    async def start(self) -> 'ConversionService':
+        """Memuat kurs awal (boleh dari cache) lalu mulai menerima koneksi"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.converter.fetch_rates, False)
+
+        self._server = await asyncio.start_server(self._handle_connection,
+                                                  self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.refresh_interval > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+        return self
+
+    async def serve_forever(self):
+        """Menjalankan service sampai dibatalkan"""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        """Menghentikan server dan refresh otomatis"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._server is not None:
+            self._server.close()
+            # Koneksi keep-alive yang menganggur ditutup lalu handler-nya
+            # ditunggu selesai, agar tidak dibatalkan saat event loop berhenti
+            handlers = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def refresh(self) -> asyncio.Future:
+        """
+        Menjalankan fetch_rates di executor tanpa memblokir event loop
+
+        Returns:
+            Future hasil fetch_rates; refresh yang sedang berjalan dipakai
+            bersama, tidak memicu fetch kedua
+        """
+        if self._refreshing is None or self._refreshing.done():
+            loop = asyncio.get_running_loop()
+            self._refreshing = loop.run_in_executor(None, self.converter.fetch_rates, True)
+        return self._refreshing
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    # ---------------------------------------------------------------
+    # Micro-batching
+    # ---------------------------------------------------------------
+
+    def submit(self, kind: str, amount: float, from_currency: str,
+               to_currency: str) -> asyncio.Future:
+        """
+        Menambahkan satu permintaan ke micro-batch berikutnya
+
+        Args:
+            kind: 'convert' atau 'rate'
+            amount: Jumlah uang (diabaikan untuk 'rate')
+            from_currency: Kode mata uang asal
+            to_currency: Kode mata uang tujuan
+
+        Returns:
+            Future berisi hasil (float) atau None jika pasangan tidak dikenal
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((kind, amount, from_currency, to_currency, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.batch_delay > 0:
+                self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        """Mengevaluasi semua permintaan tertunda terhadap satu snapshot"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        # Satu snapshot untuk seluruh batch; refresh di thread lain hanya
+        # mengganti referensi, snapshot lama tetap utuh
+        snapshot = self.converter.snapshot
+        cross = snapshot.cross_rates
+        fixed = (snapshot.fixed_point(self.converter.rounding)
+                 if self.converter.engine == 'fixed' else None)
+
+        for kind, amount, from_currency, to_currency, future in batch:
+            if future.done():
+                continue
+            if cross is None:
+                future.set_exception(ServiceError(503, 'Data kurs belum tersedia'))
+                continue
+            rate = cross.rate(from_currency, to_currency)
+            if rate is None:
+                future.set_result(None)
+            elif kind == 'rate':
+                future.set_result(rate)
+            elif fixed is not None:
+                try:
+                    future.set_result(float(fixed.convert(amount, from_currency, to_currency)))
+                except ValueError as e:
+                    future.set_exception(ServiceError(400, str(e)))
+            else:
+                future.set_result(amount * rate)
+
+        if METRICS.enabled:
+            _BATCHES.inc()
+            _BATCH_SECONDS.observe(time.perf_counter() - start)
+
+    # ---------------------------------------------------------------
+    # HTTP
+    # ---------------------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Melayani satu koneksi HTTP/1.1 keep-alive"""
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self._write(writer, 400, {'error': 'Request line tidak valid'}, False)
+                    break
+
+                headers = {}
+                for line in lines[1:]:
+                    if line:
+                        name, _, value = line.partition(':')
+                        headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length') or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    # Batas body tidak diketahui, koneksi tidak bisa dipakai lagi
+                    await self._write(writer, 400, {'error': 'Content-Length tidak valid'}, False)
+                    break
+                if length > self.max_body_bytes:
+                    # Body tidak dibaca sama sekali, jadi koneksi ditutup
+                    await self._write(writer, 413, {'error': 'Body request terlalu besar'}, False)
+                    break
+                if length:
+                    try:
+                        await reader.readexactly(length)
+                    except asyncio.IncompleteReadError:
+                        break
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = (connection != 'close' if version == 'HTTP/1.1'
+                              else connection == 'keep-alive')
+
+                if METRICS.enabled:
+                    _REQUESTS.inc()
+                try:
+                    status, body = await self._route(method, target)
+                except ServiceError as e:
+                    status, body = e.status, {'error': str(e)}
+                except Exception as e:
+                    print(f"Service error: {e}")
+                    status, body = 500, {'error': 'Kesalahan internal service'}
+                await self._write(writer, status, body, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (asyncio.CancelledError, ConnectionError):
+                # stop() membatalkan handler yang masih menunggu di sini
+                pass
+
+    async def _route(self, method: str, target: str):
+        """
+        Menjalankan endpoint sesuai path
+
+        Returns:
+            Tuple (status, body): body dict, bytes JSON siap kirim, str
+            untuk teks biasa, atau memoryview untuk data biner
+        """
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        query = dict(parse_qsl(url.query))
+
+        if path == '/refresh':
+            if method != 'POST':
+                raise ServiceError(405, 'Gunakan POST')
+            self.refresh()
+            return 202, {'status': 'refreshing'}
+        if method != 'GET':
+            raise ServiceError(405, 'Gunakan GET')
+
+        if path == '/convert':
+            from_currency, to_currency = self._pair_from(query)
+            try:
+                amount = float(query.get('amount', '1'))
+            except ValueError:
+                amount = math.nan
+            if not math.isfinite(amount):
+                raise ServiceError(400, 'Jumlah tidak valid')
+            result = await self.submit('convert', amount, from_currency, to_currency)
+            if result is None:
+                raise ServiceError(404, f'Pasangan {from_currency}/{to_currency} tidak tersedia')
+            if not math.isfinite(result):
+                # Amount besar dengan kurs > 1 bisa overflow; Infinity bukan JSON valid
+                raise ServiceError(400, 'Hasil konversi di luar jangkauan')
+            return 200, {'amount': amount, 'from': from_currency, 'to': to_currency,
+                         'result': result}
+
+        if path == '/rate':
+            from_currency, to_currency = self._pair_from(query)
+            rate = await self.submit('rate', 1.0, from_currency, to_currency)
+            if rate is None:
+                raise ServiceError(404, f'Pasangan {from_currency}/{to_currency} tidak tersedia')
+            return 200, {'from': from_currency, 'to': to_currency, 'rate': rate}
+
+        if path == '/pairs':
+            return 200, self._pairs_body(query.get('from', '').upper() or None)
+
+        if path == '/rates':
+            return 200, self._rates_body(query.get('base', '').upper() or None)
+
+        if path == '/snapshot':
+            return 200, self._binary_snapshot()
+
+        if path == '/health':
+            snapshot = self.converter.snapshot
+            return 200, {
+                'base': snapshot.base_currency,
+                'rates_version': snapshot.version,
+                'timestamp': snapshot.timestamp,
+                'last_update': self.converter.get_last_update_formatted(),
+                'currencies': len(snapshot),
+            }
+
+        if path == '/metrics':
+            return 200, METRICS.snapshot_text()
+
+        raise ServiceError(404, f'Endpoint tidak dikenal: {path}')
+
+    @staticmethod
+    def _pair_from(query: Dict[str, str]) -> Tuple[str, str]:
+        from_currency = query.get('from', '').upper()
+        to_currency = query.get('to', '').upper()
+        if not from_currency or not to_currency:
+            raise ServiceError(400, "Parameter 'from' dan 'to' wajib diisi")
+        return from_currency, to_currency
+
+    def _pairs_body(self, from_currency: Optional[str]) -> bytes:
+        """Body JSON /pairs, di-cache sampai snapshot kurs berganti"""
+        snapshot = self.converter.snapshot
+        cross = snapshot.cross_rates
+        if cross is None:
+            raise ServiceError(503, 'Data kurs belum tersedia')
+        self._check_pairs_version(snapshot.version)
+
+        body = self._pairs_cache.get(from_currency)
+        if body is not None:
+            return body
+
+        if from_currency is None:
+            size = cross.size
+            data = {
+                'codes': cross.codes,
+                'rates': {code: dict(zip(cross.codes, cross.matrix[i * size:(i + 1) * size]))
+                          for i, code in enumerate(cross.codes)},
+            }
+        else:
+            row = cross.convert_row(1.0, from_currency)
+            if row is None:
+                raise ServiceError(404, f'Mata uang tidak dikenal: {from_currency}')
+            data = {'from': from_currency, 'rates': row}
+
+        body = json.dumps(data).encode('utf-8')
+        self._pairs_cache[from_currency] = body
+        return body
+
+    def _rates_body(self, base_currency: Optional[str]) -> bytes:
+        """Body JSON /rates untuk sebuah base, di-cache sampai snapshot berganti"""
+        snapshot = self.converter.snapshot
+        if not snapshot.rates:
+            raise ServiceError(503, 'Data kurs belum tersedia')
+        base_currency = base_currency or snapshot.base_currency
+        self._check_pairs_version(snapshot.version)
+        key = ('rates', base_currency)
+        body = self._pairs_cache.get(key)
+        if body is not None:
+            return body
+
+        rebased = snapshot.rebase(base_currency)
+        if rebased is None:
+            raise ServiceError(404, f'Mata uang tidak dikenal: {base_currency}')
+        body = json.dumps({
+            'base': base_currency,
+            'rates_version': rebased.version,
+            'timestamp': rebased.timestamp,
+            'rates': rebased.rates,
+        }).encode('utf-8')
+        self._pairs_cache[key] = body
+        return body
+
+    def _check_pairs_version(self, version: int):
+        """Mengosongkan cache body jika snapshot kurs sudah berganti"""
+        if version != self._pairs_version:
+            self._pairs_cache = {}
+            self._pairs_version = version
+
+    def _binary_snapshot(self) -> memoryview:
+        """Body /snapshot, di-encode sekali per versi snapshot"""
+        snapshot = self.converter.snapshot
+        if not snapshot.rates:
+            raise ServiceError(503, 'Data kurs belum tersedia')
+        version, body = self._snapshot_body
+        if body is None or version != snapshot.version:
+            body = memoryview(encode_snapshot(snapshot))
+            self._snapshot_body = (snapshot.version, body)
+        return body
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, status: int, body, keep_alive: bool):
+        """Menulis respons HTTP dalam satu write"""
+        content_type = 'application/json'
+        if isinstance(body, bytes):
+            payload = body
+        elif isinstance(body, memoryview):
+            payload = body
+            content_type = 'application/octet-stream'
+        elif isinstance(body, str):
+            payload = body.encode('utf-8')
+            content_type = 'text/plain; version=0.0.4'
+        else:
+            payload = json.dumps(body).encode('utf-8')
+        head = (
+            f'HTTP/1.1 {status} {_REASONS.get(status, "OK")}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Length: {len(payload)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+        )
+        writer.write(head.encode('latin-1') + payload)
+        await writer.drain()
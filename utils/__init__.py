@@ -3,5 +3,7 @@
 # ============================================================
 """Utilities package"""
 from .constants import CURRENCIES, COLORS
+from .metrics import MetricsRegistry, METRICS
+from .registry import CurrencyRegistry, REGISTRY
 
-__all__ = ['CURRENCIES', 'COLORS']
\ No newline at end of file
+__all__ = ['CURRENCIES', 'COLORS', 'CurrencyRegistry', 'REGISTRY', 'MetricsRegistry', 'METRICS']
\ No newline at end of file
@@ -2,6 +2,7 @@
 # FILE: utils/constants.py
 # ============================================================
 """Konstanta untuk aplikasi"""
+import os
 
 # Daftar mata uang yang tersedia
 CURRENCIES = {
@@ -25,6 +26,16 @@ CURRENCIES = {
     'ZAR': '🇿🇦 South African Rand'
 }
 
+# Jumlah digit minor unit ISO 4217 yang tidak sama dengan 2
+MINOR_UNITS = {
+    'BIF': 0, 'CLP': 0, 'DJF': 0, 'GNF': 0, 'ISK': 0, 'JPY': 0,
+    'KMF': 0, 'KRW': 0, 'PYG': 0, 'RWF': 0, 'UGX': 0, 'UYI': 0,
+    'VND': 0, 'VUV': 0, 'XAF': 0, 'XOF': 0, 'XPF': 0,
+    'BHD': 3, 'IQD': 3, 'JOD': 3, 'KWD': 3, 'LYD': 3, 'OMR': 3, 'TND': 3,
+    'CLF': 4, 'UYW': 4
+}
+DEFAULT_MINOR_UNITS = 2
+
 # Skema warna untuk GUI
 COLORS = {
     'primary': '#4F46E5',
@@ -45,4 +56,100 @@ WINDOW_CONFIG = {
     'width': 600,
     'height': 550,
     'resizable': False
-}
\ No newline at end of file
+}
+
+# Konfigurasi jendela watchlist (pairs None = semua pasangan CURRENCIES)
+WATCHLIST_CONFIG = {
+    'title': 'Watchlist Kurs',
+    'pairs': None,
+    'visible_rows': 25,
+    'rate_format': '{:,.6f}'
+}
+
+# Konfigurasi engine konversi: 'float' atau 'fixed' (integer eksak)
+CONVERSION_CONFIG = {
+    'engine': 'float',
+    'rounding': 'ROUND_HALF_EVEN'
+}
+
+# Konfigurasi input: konversi saat mengetik digabung per interval
+INPUT_CONFIG = {
+    'convert_interval_ms': 150
+}
+
+# Konfigurasi cache data kurs (format 'binary' = snapshot biner, atau 'json')
+CACHE_CONFIG = {
+    'directory': os.path.join('~', '.cache', 'currency_converter'),
+    'ttl_seconds': 3600,
+    'format': 'binary'
+}
+
+# Konfigurasi riwayat kurs: satu store per base currency di bawah directory,
+# capacity = jumlah kolom mata uang per snapshot (enabled False = tidak dicatat)
+HISTORY_CONFIG = {
+    'enabled': True,
+    'directory': os.path.join('~', '.cache', 'currency_converter', 'history'),
+    'capacity': 512
+}
+
+# Konfigurasi HTTP untuk pengambilan data kurs
+HTTP_CONFIG = {
+    'url_template': 'https://api.exchangerate-api.com/v4/latest/{base}',
+    'timeout': 10,
+    'pool_connections': 1,
+    'pool_maxsize': 4
+}
+
+# Provider data kurs; lebih dari satu URL berarti fetch memakai hedged request
+PROVIDER_CONFIG = {
+    'url_templates': [
+        HTTP_CONFIG['url_template'],
+        'https://open.er-api.com/v6/latest/{base}',
+    ],
+    'hedge_delay_ms': 500
+}
+
+# Konfigurasi refresh otomatis (idle_timeout_s 0 = tidak pernah dianggap idle)
+REFRESH_CONFIG = {
+    'auto_refresh': True,
+    'interval_s': 600,
+    'jitter': 0.1,
+    'retry_base_s': 15,
+    'max_backoff_s': 900,
+    'idle_timeout_s': 1800
+}
+
+# Konfigurasi CLI convert.py: batas waktu import modul aplikasi
+CLI_CONFIG = {
+    'import_budget_ms': 25
+}
+
+# Konfigurasi metrik (export_interval_ms 0 = hanya export manual,
+# ui_sample_every N = hanya 1 dari N konversi UI yang diukur durasinya)
+METRICS_CONFIG = {
+    'enabled': True,
+    'export_path': os.path.join('~', '.cache', 'currency_converter', 'metrics.prom'),
+    'export_interval_ms': 0,
+    'ui_sample_every': 16
+}
+
+# Konfigurasi service HTTP konversi (refresh_interval_s 0 = tanpa refresh otomatis,
+# body request di atas max_body_bytes dijawab 413)
+SERVICE_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8080,
+    'max_batch': 256,
+    'batch_delay_ms': 0,
+    'refresh_interval_s': 900,
+    'max_body_bytes': 64 * 1024
+}
+
+# Konfigurasi graf kurs multi-sumber: spread bid/ask dan fee proporsional
+# default, bisa di-override per nama provider di provider_costs.
+# max_hops membatasi panjang jalur jika ada siklus arbitrase.
+GRAPH_CONFIG = {
+    'spread': 0.0,
+    'fee': 0.0,
+    'max_hops': 3,
+    'provider_costs': {}
+}
@@ -0,0 +1,224 @@
+# ============================================================
+# FILE: utils/metrics.py
+# ============================================================
+"""Metrik ringan (counter, gauge, histogram latensi) untuk fetch dan UI"""
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+from .constants import METRICS_CONFIG
+
+# Batas atas bucket histogram latensi dalam detik
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Jumlah pengukuran histogram yang ditampung sebelum dimasukkan ke bucket
+PENDING_LIMIT = 256
+
+
+class Counter:
+    """
+    Counter yang hanya bisa bertambah
+
+    Setiap thread menambah integer miliknya sendiri (satu sel per thread),
+    sehingga jalur panas tidak perlu mengambil lock. Nilai counter adalah
+    jumlah semua sel.
+    """
+
+    def __init__(self, name: str, help_text: str = ''):
+        self.name = name
+        self.help_text = help_text
+        self._local = threading.local()
+        self._cells: List[List[int]] = []
+        self._lock = threading.Lock()
+
+    def _new_cell(self) -> List[int]:
+        """Membuat dan mendaftarkan sel thread saat ini"""
+        cell = [0]
+        with self._lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+    def inc(self, amount: int = 1):
+        """Menambah nilai counter"""
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._new_cell()
+        cell[0] += amount
+
+    def tick(self):
+        """Menambah satu (jalur panas, tanpa argumen)"""
+        try:
+            self._local.cell[0] += 1
+        except AttributeError:
+            self._new_cell()[0] += 1
+
+    @property
+    def value(self) -> int:
+        """Nilai counter saat ini"""
+        with self._lock:
+            return sum(cell[0] for cell in self._cells)
+
+    def render(self) -> List[str]:
+        return [f'# TYPE {self.name} counter', f'{self.name} {self.value}']
+
+
+class Gauge:
+    """Nilai terakhir yang bisa naik turun (misalnya waktu sukses terakhir)"""
+
+    def __init__(self, name: str, help_text: str = ''):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0.0
+
+    def set(self, value: float):
+        """Mengatur nilai gauge"""
+        self.value = value
+
+    def render(self) -> List[str]:
+        return [f'# TYPE {self.name} gauge', f'{self.name} {self.value}']
+
+
+class Histogram:
+    """
+    Histogram latensi dengan bucket tetap
+
+    Pengukuran baru hanya di-append ke deque (thread-safe tanpa lock) dan
+    baru dimasukkan ke bucket saat antrean penuh atau saat snapshot.
+    """
+
+    def __init__(self, name: str, help_text: str = '',
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # Bucket terakhir menampung nilai di atas batas tertinggi (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._pending = deque()
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        """Mencatat satu pengukuran latensi"""
+        pending = self._pending
+        pending.append(seconds)
+        if len(pending) >= PENDING_LIMIT:
+            self.flush()
+
+    def flush(self):
+        """Memasukkan pengukuran yang tertunda ke bucket"""
+        pending = self._pending
+        buckets = self.buckets
+        with self._lock:
+            while pending:
+                try:
+                    seconds = pending.popleft()
+                except IndexError:
+                    break
+                self.counts[bisect_left(buckets, seconds)] += 1
+                self.count += 1
+                self.sum += seconds
+
+    def render(self) -> List[str]:
+        self.flush()
+        lines = [f'# TYPE {self.name} histogram']
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f'{self.name}_sum {self.sum}')
+        lines.append(f'{self.name}_count {self.count}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Class kumpulan metrik aplikasi
+
+    Titik instrumentasi memeriksa `enabled` sebelum mengukur apa pun,
+    sehingga saat metrik dimatikan biayanya hanya satu pembacaan atribut.
+    """
+
+    def __init__(self, enabled: bool = True, prefix: str = 'currency_converter'):
+        """
+        Inisialisasi registry metrik
+
+        Args:
+            enabled: False untuk mematikan pencatatan
+            prefix: Awalan nama metrik pada snapshot teks
+        """
+        self.enabled = enabled
+        self.prefix = prefix
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory, *args):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = factory(f'{self.prefix}_{name}', *args)
+                    self._metrics[name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str = '') -> Counter:
+        """Mendapatkan (atau membuat) counter"""
+        return self._get_or_create(name, Counter, help_text)
+
+    def gauge(self, name: str, help_text: str = '') -> Gauge:
+        """Mendapatkan (atau membuat) gauge"""
+        return self._get_or_create(name, Gauge, help_text)
+
+    def histogram(self, name: str, help_text: str = '',
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Mendapatkan (atau membuat) histogram latensi"""
+        return self._get_or_create(name, Histogram, help_text, buckets)
+
+    def snapshot_text(self) -> str:
+        """
+        Membuat snapshot semua metrik dalam format teks Prometheus
+
+        Returns:
+            Teks snapshot
+        """
+        lines = [f'# snapshot {time.time():.3f}']
+        for metric in list(self._metrics.values()):
+            if metric.help_text:
+                lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_snapshot(self, path: Optional[str] = None) -> bool:
+        """
+        Menulis snapshot ke file secara atomik
+
+        Args:
+            path: Path file tujuan (default METRICS_CONFIG['export_path'])
+
+        Returns:
+            True jika berhasil, False jika gagal
+        """
+        path = os.path.expanduser(path or METRICS_CONFIG['export_path'])
+        directory = os.path.dirname(path) or '.'
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.snapshot_text())
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            print(f"Error writing metrics: {e}")
+            return False
+
+
+# Registry metrik bersama untuk model dan controller
+METRICS = MetricsRegistry(enabled=METRICS_CONFIG['enabled'])
@@ -0,0 +1,139 @@
+# ============================================================
+# FILE: utils/registry.py
+# ============================================================
+"""Registry mata uang dengan index dua arah yang sudah dihitung"""
+import threading
+from typing import Optional, Dict, List, Iterable
+
+from .constants import CURRENCIES, MINOR_UNITS, DEFAULT_MINOR_UNITS
+
+
+class CurrencyRegistry:
+    """
+    Class untuk lookup O(1) antara kode, display name, ID dan minor unit
+
+    ID mata uang sama dengan index combobox: mata uang dari CURRENCIES
+    mendapat ID sesuai urutannya, mata uang tambahan (misalnya dari API)
+    ditambahkan di belakang. ID tidak pernah berubah setelah diberikan.
+    """
+
+    def __init__(self, currencies: Optional[Dict[str, str]] = None):
+        """
+        Inisialisasi registry
+
+        Args:
+            currencies: Dict kode -> display name (default CURRENCIES)
+        """
+        self.codes: List[str] = []
+        self.display_names: List[str] = []
+        self.minor_units: List[int] = []
+        self._id_by_code: Dict[str, int] = {}
+        self._id_by_display: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if currencies is None:
+            currencies = CURRENCIES
+        for code, display_name in currencies.items():
+            self.register(code, display_name)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._id_by_code
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Lock tidak bisa di-pickle (misalnya saat dikirim ke worker
+        # multiprocessing); dibuat ulang di __setstate__
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, object]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def register(self, code: str, display_name: Optional[str] = None) -> int:
+        """
+        Mendaftarkan mata uang (tidak berubah jika sudah terdaftar)
+
+        Args:
+            code: Kode mata uang ISO 4217
+            display_name: Nama tampilan (default sama dengan kode)
+
+        Returns:
+            ID mata uang
+        """
+        currency_id = self._id_by_code.get(code)
+        if currency_id is not None:
+            return currency_id
+
+        with self._lock:
+            currency_id = self._id_by_code.get(code)
+            if currency_id is not None:
+                return currency_id
+
+            display_name = display_name or code
+            currency_id = len(self.codes)
+            self.codes.append(code)
+            self.display_names.append(display_name)
+            self.minor_units.append(MINOR_UNITS.get(code, DEFAULT_MINOR_UNITS))
+            self._id_by_display[display_name] = currency_id
+            # Kode dipasang terakhir agar pembaca lain tidak melihat ID
+            # yang datanya belum lengkap
+            self._id_by_code[code] = currency_id
+            return currency_id
+
+    def register_many(self, codes: Iterable[str]):
+        """
+        Mendaftarkan banyak kode mata uang sekaligus
+
+        Args:
+            codes: Kode mata uang (misalnya semua kode dari API)
+        """
+        for code in codes:
+            if code not in self._id_by_code:
+                self.register(code)
+
+    def id_of(self, code: str) -> Optional[int]:
+        """Mendapatkan ID (= index combobox) dari kode mata uang"""
+        return self._id_by_code.get(code)
+
+    def code_of(self, currency_id: int) -> Optional[str]:
+        """Mendapatkan kode mata uang dari ID"""
+        if 0 <= currency_id < len(self.codes):
+            return self.codes[currency_id]
+        return None
+
+    def code_from_display(self, display_name: str) -> Optional[str]:
+        """Mendapatkan kode mata uang dari display name"""
+        currency_id = self._id_by_display.get(display_name)
+        if currency_id is None:
+            return None
+        return self.codes[currency_id]
+
+    def display_from_code(self, code: str) -> Optional[str]:
+        """Mendapatkan display name dari kode mata uang"""
+        currency_id = self._id_by_code.get(code)
+        if currency_id is None:
+            return None
+        return self.display_names[currency_id]
+
+    def minor_unit_of(self, code: str) -> int:
+        """
+        Mendapatkan jumlah digit minor unit ISO 4217
+
+        Args:
+            code: Kode mata uang
+
+        Returns:
+            Jumlah digit desimal (default 2 untuk kode tidak dikenal)
+        """
+        currency_id = self._id_by_code.get(code)
+        if currency_id is None:
+            return MINOR_UNITS.get(code, DEFAULT_MINOR_UNITS)
+        return self.minor_units[currency_id]
+
+
+# Registry bersama untuk view, controller dan model
+REGISTRY = CurrencyRegistry()
@@ -3,5 +3,6 @@
 # ============================================================
 """Views package"""
 from .gui import CurrencyConverterGUI
+from .watchlist import WatchlistPanel
 
-__all__ = ['CurrencyConverterGUI']
+__all__ = ['CurrencyConverterGUI', 'WatchlistPanel']
@@ -5,21 +5,27 @@
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional
-from utils.constants import CURRENCIES, COLORS, WINDOW_CONFIG
+from utils.constants import CURRENCIES, COLORS, WINDOW_CONFIG, INPUT_CONFIG, WATCHLIST_CONFIG
+from utils.registry import CurrencyRegistry, REGISTRY
+from .watchlist import WatchlistPanel
 
 
 class CurrencyConverterGUI:
     """Class untuk GUI aplikasi konverter mata uang"""
     
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, registry: Optional[CurrencyRegistry] = None):
         """
         Inisialisasi GUI
         
         Args:
             root: Tkinter root window
+            registry: Registry mata uang (default REGISTRY)
         """
         self.root = root
         self.currencies = CURRENCIES
+        self.registry = registry if registry is not None else REGISTRY
+        # Index combobox sama dengan ID mata uang di registry
+        self.currency_names = list(self.registry.display_names)
         self.colors = COLORS
         
         # Callback functions (akan diset oleh controller)
@@ -27,6 +33,16 @@ class CurrencyConverterGUI:
         self.on_swap: Optional[Callable] = None
         self.on_refresh: Optional[Callable] = None
         self.on_clear: Optional[Callable] = None
+        self.on_watchlist: Optional[Callable] = None
+        self.on_activity: Optional[Callable] = None
+        
+        # Jendela watchlist (dibuat saat pertama dibuka)
+        self.watchlist_window: Optional[tk.Toplevel] = None
+        self.watchlist_panel: Optional[WatchlistPanel] = None
+        
+        # Konversi dari keystroke digabung: maksimal satu per interval
+        self.convert_interval_ms = INPUT_CONFIG['convert_interval_ms']
+        self._convert_job: Optional[str] = None
         
         self._configure_window()
         self._create_widgets()
@@ -37,6 +53,12 @@ class CurrencyConverterGUI:
         self.root.geometry(f"{WINDOW_CONFIG['width']}x{WINDOW_CONFIG['height']}")
         self.root.resizable(WINDOW_CONFIG['resizable'], WINDOW_CONFIG['resizable'])
         self.root.configure(bg=self.colors['background'])
+        
+        # Aktivitas user (keyboard, mouse, window dibuka lagi) dilaporkan
+        # ke controller untuk refresh otomatis
+        self.root.bind_all('<KeyPress>', lambda e: self._trigger_activity(), add='+')
+        self.root.bind_all('<ButtonPress>', lambda e: self._trigger_activity(), add='+')
+        self.root.bind('<Map>', lambda e: self._trigger_activity(), add='+')
     
     def _create_widgets(self):
         """Membuat semua widget GUI"""
@@ -104,17 +126,17 @@ class CurrencyConverterGUI:
         )
         self.amount_entry.pack(side='left', padx=(0, 10), ipady=8)
         self.amount_entry.insert(0, '1')
-        self.amount_entry.bind('<KeyRelease>', lambda e: self._trigger_convert())
+        self.amount_entry.bind('<KeyRelease>', lambda e: self._schedule_convert())
         
         self.from_currency = ttk.Combobox(
             input_frame,
-            values=list(self.currencies.values()),
+            values=self.currency_names,
             font=('Arial', 11),
             width=20,
             state='readonly'
         )
         self.from_currency.pack(side='left', ipady=8)
-        self.from_currency.current(0)
+        self.from_currency.current(self.registry.id_of('USD'))
         self.from_currency.bind('<<ComboboxSelected>>', lambda e: self._trigger_convert())
     
     def _create_swap_button(self):
@@ -168,13 +190,13 @@ class CurrencyConverterGUI:
         
         self.to_currency = ttk.Combobox(
             output_frame,
-            values=list(self.currencies.values()),
+            values=self.currency_names,
             font=('Arial', 11),
             width=20,
             state='readonly'
         )
         self.to_currency.pack(side='left', ipady=8)
-        self.to_currency.current(3)
+        self.to_currency.current(self.registry.id_of('IDR'))
         self.to_currency.bind('<<ComboboxSelected>>', lambda e: self._trigger_convert())
     
     def _create_rate_info(self):
@@ -224,6 +246,20 @@ class CurrencyConverterGUI:
             relief='flat'
         )
         self.clear_button.pack(side='left', padx=5)
+        
+        self.watchlist_button = tk.Button(
+            button_frame,
+            text="📋 Watchlist",
+            font=('Arial', 11, 'bold'),
+            bg=self.colors['primary'],
+            fg=self.colors['white'],
+            command=self._trigger_watchlist,
+            padx=15,
+            pady=8,
+            cursor='hand2',
+            relief='flat'
+        )
+        self.watchlist_button.pack(side='left', padx=5)
     
     def _create_status_bar(self):
         """Membuat status bar"""
@@ -238,8 +274,28 @@ class CurrencyConverterGUI:
         self.status_label.pack(fill='x', pady=(10, 0))
     
     # Trigger methods
+    def _schedule_convert(self):
+        """
+        Menjadwalkan konversi dari keystroke
+        
+        Keystroke yang datang selama masih ada jadwal tertunda digabung
+        ke jadwal tersebut; saat dijalankan, konversi membaca input terbaru.
+        """
+        if self._convert_job is not None:
+            return
+        self._convert_job = self.root.after(self.convert_interval_ms,
+                                            self._run_scheduled_convert)
+    
+    def _run_scheduled_convert(self):
+        """Menjalankan konversi yang dijadwalkan"""
+        self._convert_job = None
+        self._trigger_convert()
+    
     def _trigger_convert(self):
         """Trigger callback konversi"""
+        if self._convert_job is not None:
+            self.root.after_cancel(self._convert_job)
+            self._convert_job = None
         if self.on_convert:
             self.on_convert()
     
@@ -258,6 +314,16 @@ class CurrencyConverterGUI:
         if self.on_clear:
             self.on_clear()
     
+    def _trigger_watchlist(self):
+        """Trigger callback watchlist"""
+        if self.on_watchlist:
+            self.on_watchlist()
+    
+    def _trigger_activity(self):
+        """Trigger callback aktivitas user"""
+        if self.on_activity:
+            self.on_activity()
+    
     # Getter methods
     def get_amount(self) -> str:
         """Mendapatkan nilai amount"""
@@ -279,7 +345,44 @@ class CurrencyConverterGUI:
         """Mendapatkan index mata uang tujuan"""
         return self.to_currency.current()
     
+    def is_minimized(self) -> bool:
+        """Mengecek apakah window sedang diminimize/disembunyikan"""
+        return self.root.state() in ('iconic', 'withdrawn')
+    
     # Setter methods
+    def open_watchlist(self, on_close: Optional[Callable] = None) -> WatchlistPanel:
+        """
+        Membuka jendela watchlist, atau memunculkan jendela yang sudah ada
+        
+        Args:
+            on_close: Callback saat jendela watchlist ditutup
+            
+        Returns:
+            Panel watchlist di jendela tersebut
+        """
+        if self.watchlist_window is not None:
+            self.watchlist_window.deiconify()
+            self.watchlist_window.lift()
+            return self.watchlist_panel
+        
+        window = tk.Toplevel(self.root)
+        window.title(WATCHLIST_CONFIG['title'])
+        window.configure(bg=self.colors['background'])
+        panel = WatchlistPanel(window)
+        panel.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        def close():
+            self.watchlist_window = None
+            self.watchlist_panel = None
+            window.destroy()
+            if on_close:
+                on_close()
+        
+        window.protocol('WM_DELETE_WINDOW', close)
+        self.watchlist_window = window
+        self.watchlist_panel = panel
+        return panel
+    
     def set_result(self, value: str):
         """Set hasil konversi"""
         self.result_var.set(value)
@@ -292,6 +395,10 @@ class CurrencyConverterGUI:
         """Set status message"""
         self.status_label.config(text=text)
     
+    def set_refresh_enabled(self, enabled: bool):
+        """Aktifkan/nonaktifkan tombol refresh"""
+        self.refresh_button.config(state='normal' if enabled else 'disabled')
+    
     def set_from_currency_index(self, index: int):
         """Set index mata uang asal"""
         self.from_currency.current(index)
@@ -315,7 +422,4 @@ class CurrencyConverterGUI:
         Returns:
             Kode mata uang atau None
         """
-        for code, name in self.currencies.items():
-            if name == display_name:
-                return code
-        return None
\ No newline at end of file
+        return self.registry.code_from_display(display_name)
\ No newline at end of file
@@ -0,0 +1,167 @@
+# ============================================================
+# FILE: views/watchlist.py
+# ============================================================
+"""Panel watchlist banyak pasangan kurs dengan Treeview virtual"""
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+from utils.constants import COLORS, WATCHLIST_CONFIG
+
+# Nilai satu baris: (kurs, perubahan, tag warna)
+RowValues = Tuple[str, str, str]
+
+
+class WatchlistPanel:
+    """
+    Class panel watchlist yang hanya menggambar baris yang terlihat
+
+    Treeview berisi sejumlah tetap item (visible_rows) yang dipakai ulang;
+    scroll hanya menggeser offset ke daftar baris dan mengisi ulang item
+    tersebut. Update nilai dikumpulkan lalu digambar sekali di after_idle,
+    dan hanya sel yang teksnya berubah yang di-set ke Tk.
+    """
+
+    COLUMNS = ('pair', 'rate', 'change')
+
+    def __init__(self, parent: tk.Misc, visible_rows: Optional[int] = None):
+        """
+        Inisialisasi panel watchlist
+
+        Args:
+            parent: Widget induk
+            visible_rows: Jumlah baris yang terlihat (default WATCHLIST_CONFIG)
+        """
+        self.colors = COLORS
+        self.visible_rows = visible_rows or WATCHLIST_CONFIG['visible_rows']
+
+        # Data semua baris; hanya potongan [offset, offset + visible_rows) digambar
+        self._keys: List[Hashable] = []
+        self._labels: Dict[Hashable, str] = {}
+        self._values: Dict[Hashable, RowValues] = {}
+        self._offset = 0
+        self._redraw_job: Optional[str] = None
+
+        self.frame = tk.Frame(parent, bg=self.colors['background'])
+        self._create_tree()
+
+        # Teks dan tag yang sedang tampil per item, untuk melewati sel yang sama
+        self._items = [self.tree.insert('', 'end', values=('', '', ''))
+                       for _ in range(self.visible_rows)]
+        self._shown: List[Tuple[str, str, str]] = [('', '', '')] * self.visible_rows
+        self._shown_tags: List[str] = [''] * self.visible_rows
+
+    def _create_tree(self):
+        """Membuat Treeview dan scrollbar"""
+        self.tree = ttk.Treeview(
+            self.frame,
+            columns=self.COLUMNS,
+            show='headings',
+            height=self.visible_rows,
+            selectmode='none'
+        )
+        self.tree.heading('pair', text='Pasangan')
+        self.tree.heading('rate', text='Kurs')
+        self.tree.heading('change', text='Perubahan')
+        self.tree.column('pair', width=120, anchor='w')
+        self.tree.column('rate', width=180, anchor='e')
+        self.tree.column('change', width=110, anchor='e')
+        self.tree.tag_configure('up', foreground=self.colors['secondary'])
+        self.tree.tag_configure('down', foreground=self.colors['danger'])
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self._on_scrollbar)
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.scrollbar.pack(side='right', fill='y')
+
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll_to(self._offset - 3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_to(self._offset + 3))
+
+    def pack(self, **kwargs):
+        """Menempatkan panel dengan pack"""
+        self.frame.pack(**kwargs)
+
+    def set_rows(self, keys: Sequence[Hashable], labels: Dict[Hashable, str]):
+        """
+        Mengganti daftar baris watchlist
+
+        Args:
+            keys: Kunci baris sesuai urutan tampil
+            labels: Kunci -> teks kolom pasangan
+        """
+        self._keys = list(keys)
+        self._labels = dict(labels)
+        self._values = {key: value for key, value in self._values.items() if key in self._labels}
+        self._offset = min(self._offset, self._max_offset())
+        self._schedule_redraw()
+
+    def update_rows(self, values: Dict[Hashable, RowValues]):
+        """
+        Memperbarui nilai beberapa baris; digambar sekali setelah idle
+
+        Args:
+            values: Kunci -> (teks kurs, teks perubahan, tag 'up'/'down'/'')
+        """
+        self._values.update(values)
+        self._schedule_redraw()
+
+    def scroll_to(self, offset: int):
+        """Menggeser baris pertama yang terlihat lalu menggambar ulang"""
+        offset = max(0, min(offset, self._max_offset()))
+        if offset != self._offset:
+            self._offset = offset
+            self._redraw()
+
+    def _max_offset(self) -> int:
+        return max(0, len(self._keys) - self.visible_rows)
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None):
+        """Protokol command scrollbar Tk: moveto <fraksi> / scroll <n> units|pages"""
+        if action == 'moveto':
+            self.scroll_to(round(float(amount) * len(self._keys)))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.scroll_to(self._offset + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll roda mouse (Windows/macOS)"""
+        # Windows mengirim kelipatan 120 per langkah, macOS langsung jumlah langkah
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll_to(self._offset - steps * 3)
+
+    def _schedule_redraw(self):
+        """Menggabungkan update yang datang berturut-turut menjadi satu redraw"""
+        if self._redraw_job is None:
+            self._redraw_job = self.frame.after_idle(self._redraw)
+
+    def _redraw(self):
+        """Menggambar baris yang terlihat; hanya sel yang berubah yang di-set"""
+        if self._redraw_job is not None:
+            self.frame.after_cancel(self._redraw_job)
+            self._redraw_job = None
+
+        keys = self._keys
+        empty = ('', '', '')
+        for slot, item in enumerate(self._items):
+            index = self._offset + slot
+            if index < len(keys):
+                key = keys[index]
+                rate_text, change_text, tag = self._values.get(key, empty)
+                row = (self._labels.get(key, ''), rate_text, change_text)
+            else:
+                row, tag = empty, ''
+
+            shown = self._shown[slot]
+            if row != shown:
+                for column, text, old_text in zip(self.COLUMNS, row, shown):
+                    if text != old_text:
+                        self.tree.set(item, column, text)
+                self._shown[slot] = row
+            if tag != self._shown_tags[slot]:
+                self.tree.item(item, tags=(tag,) if tag else ())
+                self._shown_tags[slot] = tag
+
+        total = len(keys)
+        if total > self.visible_rows:
+            self.scrollbar.set(self._offset / total, (self._offset + self.visible_rows) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)